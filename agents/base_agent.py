@@ -17,7 +17,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from config.llm_config import PRIMARY_MODEL, FALLBACK_MODELS, ModelProvider
-from tools import HuggingFaceClient, OpenRouterClient
+from tools import HuggingFaceClient, get_openrouter_client
 from tools import HuggingFaceAPIError, OpenRouterClientError
 
 
@@ -75,7 +75,7 @@ class BaseAgent(ABC):
         if PRIMARY_MODEL.provider == ModelProvider.HUGGINGFACE:
             return HuggingFaceClient(model=PRIMARY_MODEL.model_name)
         elif PRIMARY_MODEL.provider == ModelProvider.OPENROUTER:
-            return OpenRouterClient(model=PRIMARY_MODEL.model_name)
+            return get_openrouter_client(model=PRIMARY_MODEL.model_name)
         else:
             raise AgentError(f"Unsupported provider: {PRIMARY_MODEL.provider}")
 
@@ -91,7 +91,7 @@ class BaseAgent(ABC):
                 if model_config.provider == ModelProvider.HUGGINGFACE:
                     clients.append(HuggingFaceClient(model=model_config.model_name))
                 elif model_config.provider == ModelProvider.OPENROUTER:
-                    clients.append(OpenRouterClient(model=model_config.model_name))
+                    clients.append(get_openrouter_client(model=model_config.model_name))
             except Exception as e:
                 logger.warning(f"Failed to initialize fallback client {model_config.model_name}: {e}")
 
@@ -49,11 +49,14 @@ def setup_position_manager():
     # Risk Level: Low (wide stop-losses)
     # Time Horizon: Days to weeks
 
-    manager.STRATEGY_DEFAULTS["dca"]["enabled"] = True           # Enable/Disable
-    manager.STRATEGY_DEFAULTS["dca"]["atr_multiplier"] = 2.0     # Wide stops (2× ATR)
-    manager.STRATEGY_DEFAULTS["dca"]["allocation_limit"] = 0.5   # Max 50% of budget
-    manager.STRATEGY_DEFAULTS["dca"]["time_between_buys"] = 3600 # 1 hour minimum between buys
-    manager.STRATEGY_DEFAULTS["dca"]["min_hold_time"] = 86400    # Hold for 24 hours minimum
+    manager.set_strategy_config(
+        "dca",
+        enabled=True,            # Enable/Disable
+        atr_multiplier=2.0,      # Wide stops (2× ATR)
+        allocation_limit=0.5,    # Max 50% of budget
+        time_between_buys=3600,  # 1 hour minimum between buys
+        min_hold_time=86400,     # Hold for 24 hours minimum
+    )
 
     # =========================================================================
     # STRATEGY 2: SWING TRADING
@@ -62,10 +65,13 @@ def setup_position_manager():
     # Risk Level: Medium (moderate stop-losses)
     # Time Horizon: Hours to days
 
-    manager.STRATEGY_DEFAULTS["swing"]["enabled"] = True         # Enable/Disable
-    manager.STRATEGY_DEFAULTS["swing"]["atr_multiplier"] = 1.5   # Moderate stops (1.5× ATR)
-    manager.STRATEGY_DEFAULTS["swing"]["allocation_limit"] = 0.3 # Max 30% of budget
-    manager.STRATEGY_DEFAULTS["swing"]["min_hold_time"] = 3600   # Hold for 1 hour minimum
+    manager.set_strategy_config(
+        "swing",
+        enabled=True,          # Enable/Disable
+        atr_multiplier=1.5,    # Moderate stops (1.5× ATR)
+        allocation_limit=0.3,  # Max 30% of budget
+        min_hold_time=3600,    # Hold for 1 hour minimum
+    )
 
     # =========================================================================
     # STRATEGY 3: DAY TRADING (DISABLED BY DEFAULT - RISKY)
@@ -77,10 +83,13 @@ def setup_position_manager():
     # [WARN] WARNING: Day trading is high risk and requires constant monitoring.
     #             Keep this disabled unless you know what you're doing!
 
-    manager.STRATEGY_DEFAULTS["day"]["enabled"] = False          # Keep disabled
-    manager.STRATEGY_DEFAULTS["day"]["atr_multiplier"] = 1.0     # Tight stops (1× ATR)
-    manager.STRATEGY_DEFAULTS["day"]["allocation_limit"] = 0.2   # Max 20% of budget
-    manager.STRATEGY_DEFAULTS["day"]["min_hold_time"] = 900      # Hold for 15 minutes minimum
+    manager.set_strategy_config(
+        "day",
+        enabled=False,         # Keep disabled
+        atr_multiplier=1.0,    # Tight stops (1× ATR)
+        allocation_limit=0.2,  # Max 20% of budget
+        min_hold_time=900,     # Hold for 15 minutes minimum
+    )
 
     # =========================================================================
     # EMERGENCY SAFEGUARDS (Already set by default, but can be adjusted)
@@ -4,7 +4,7 @@ This module contains all Pydantic schemas used throughout the system
 for data validation, serialization, and type safety.
 
 Files in this directory:
-- market_data.py: Market data models (price, volume, 24h stats)
+- market_data.py: Market data models (price, volume, 24h stats, column batches)
 - indicators.py: Technical analysis indicators (RSI, MACD, ATR, MAs, Bollinger)
 - decisions.py: Trading decision models (buy/sell/hold with risk management)
 - portfolio.py: Portfolio state tracking (balances, positions, P/L)
@@ -20,7 +20,7 @@ Example:
 from typing import List
 
 # Import all models for easy access
-from data_models.market_data import MarketData
+from data_models.market_data import MarketData, MarketDataBatch
 from data_models.indicators import TechnicalIndicators
 from data_models.decisions import TradeDecision
 from data_models.portfolio import PortfolioState
@@ -30,6 +30,7 @@ from data_models.positions import Position
 __all__: List[str] = [
     # Market data
     "MarketData",
+    "MarketDataBatch",
     # Technical indicators
     "TechnicalIndicators",
     # Trading decisions
@@ -18,9 +18,11 @@ Example:
     BTC Price: $45,000.50
 """
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
@@ -278,3 +280,82 @@ class MarketData(BaseModel):
             f"volume=${self.volume:,.0f}, "
             f"change_24h={self.change_24h:+.2f}%)"
         )
+
+
+@dataclass(frozen=True)
+class MarketDataBatch:
+    """Column-oriented (struct-of-arrays) view of a MarketData series.
+
+    Indicator calculations operate on whole price columns. Holding them as
+    contiguous float64 arrays avoids re-walking a list of Pydantic models
+    once per indicator.
+
+    Attributes:
+        prices: Closing prices (most recent last)
+        highs: 24h highs (falls back to price where high_24h is missing)
+        lows: 24h lows (falls back to price where low_24h is missing)
+        closes: Closing prices (same array as ``prices``)
+        volumes: 24h trading volumes
+
+    Example:
+        >>> batch = MarketDataBatch.from_list(market_data_list)
+        >>> indicators = calculate_all_indicators(batch)
+    """
+
+    prices: np.ndarray
+    highs: np.ndarray
+    lows: np.ndarray
+    closes: np.ndarray
+    volumes: np.ndarray
+
+    def __post_init__(self) -> None:
+        """Validate that every column has one entry per data point.
+
+        The indicator kernels run without bounds checking, so a short column
+        would be read past its end instead of raising.
+
+        Raises:
+            ValueError: If the column lengths differ
+        """
+        n = len(self.prices)
+        lengths = {
+            "highs": len(self.highs),
+            "lows": len(self.lows),
+            "closes": len(self.closes),
+            "volumes": len(self.volumes),
+        }
+        if any(length != n for length in lengths.values()):
+            detail = ", ".join(f"{name}={length}" for name, length in lengths.items())
+            raise ValueError(f"Columns must have same length. Got prices={n}, {detail}")
+
+    def __len__(self) -> int:
+        return int(self.prices.shape[0])
+
+    @classmethod
+    def from_list(cls, market_data_list: List[MarketData]) -> "MarketDataBatch":
+        """Build a batch from MarketData objects.
+
+        Each column is written straight into a pre-sized float64 buffer with
+        ``np.fromiter(..., count=n)``; no intermediate Python lists or row
+        tuples are allocated.
+
+        Args:
+            market_data_list: List of MarketData (oldest first)
+
+        Returns:
+            MarketDataBatch: Column arrays with one entry per data point
+        """
+        n = len(market_data_list)
+        prices = np.fromiter((md.price for md in market_data_list), dtype=np.float64, count=n)
+        highs = np.fromiter(
+            (md.high_24h if md.high_24h is not None else md.price for md in market_data_list),
+            dtype=np.float64,
+            count=n,
+        )
+        lows = np.fromiter(
+            (md.low_24h if md.low_24h is not None else md.price for md in market_data_list),
+            dtype=np.float64,
+            count=n,
+        )
+        volumes = np.fromiter((md.volume for md in market_data_list), dtype=np.float64, count=n)
+        return cls(prices=prices, highs=highs, lows=lows, closes=prices, volumes=volumes)
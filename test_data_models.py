@@ -1,9 +1,13 @@
-from data_models.market_data import MarketData
+from data_models.market_data import MarketData, MarketDataBatch
 from data_models.indicators import TechnicalIndicators
 from data_models.decisions import TradeDecision
 from data_models.portfolio import PortfolioState
 from data_models.sentiment import SentimentData
+from data_models.positions import Position
+import copy
+import pickle
 from datetime import datetime
+import numpy as np
 
 print("Testing Pydantic Models...")
 
@@ -28,6 +32,15 @@ try:
 except Exception as e:
     print(f"[FAIL] Decision failed: {e}")
 
+# Test Position copy/pickle (travels inside workflow state checkpoints)
+try:
+    pos = Position(position_id="DCA-20250101-000001", strategy="dca", amount_btc=0.01, amount_usd=620, entry_price=62000, stop_loss=60000)
+    assert pickle.loads(pickle.dumps(pos)) == pos
+    assert copy.deepcopy(pos) == pos
+    print(f"[OK] Position: {pos.position_id} pickles and deep-copies")
+except Exception as e:
+    print(f"[FAIL] Position copy failed: {e}")
+
 # Test validation (should fail)
 try:
     bad = MarketData(price=-1000, volume=0, timestamp="", change_24h=0)
@@ -35,4 +48,14 @@ try:
 except Exception:
     print("[OK] Validation working")
 
+# Test MarketDataBatch column lengths (should fail)
+try:
+    bad_batch = MarketDataBatch(
+        prices=np.ones(300), highs=np.ones(60), lows=np.ones(60),
+        closes=np.ones(300), volumes=np.ones(300)
+    )
+    print("[FAIL] Mismatched batch columns accepted!")
+except ValueError:
+    print("[OK] Batch length validation working")
+
 print("Tests complete!")
\ No newline at end of file
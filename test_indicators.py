@@ -1,9 +1,12 @@
 from tools.indicator_calculator import (
     calculate_rsi, calculate_macd, calculate_atr,
-    calculate_sma, calculate_ema, calculate_all_indicators
+    calculate_sma, calculate_ema, calculate_all_indicators,
+    calculate_bollinger_bands, IndicatorState,
+    get_rsi_fn, get_sma_fn, get_ema_fn, get_bollinger_fn, get_atr_fn
 )
 from data_models.market_data import MarketData
 from datetime import datetime
+import numpy as np
 
 print("="*60)
 print("TESTING INDICATOR CALCULATOR")
@@ -96,6 +99,39 @@ try:
 except Exception as e:
     print(f"[FAIL] Error handling failed: {e}")
 
+# Test 6: Incremental Bollinger Bands
+print("\n6. Testing IndicatorState (incremental Bollinger Bands)...")
+try:
+    state = IndicatorState(bb_period=20)
+    for p in prices:
+        state.update(p)
+    inc_upper, inc_middle, inc_lower = state.bollinger_bands
+    upper, middle, lower = calculate_bollinger_bands(prices, period=20)
+    if abs(inc_upper - upper) < 1e-6 and abs(inc_lower - lower) < 1e-6:
+        print(f"[OK] Incremental bands match: Upper={inc_upper:.2f}, Lower={inc_lower:.2f}")
+    else:
+        print(f"[FAIL] Incremental bands differ: {inc_upper:.2f} vs {upper:.2f}")
+except Exception as e:
+    print(f"[FAIL] IndicatorState failed: {e}")
+
+# Test 7: Resolved functions reject short input
+print("\n7. Testing get_*_fn length guards...")
+short = np.array(prices[:10], dtype=np.float64)
+guarded = [
+    ("RSI", lambda: get_rsi_fn(14)(short)),
+    ("SMA", lambda: get_sma_fn(50)(short)),
+    ("EMA", lambda: get_ema_fn(12)(short)),
+    ("Bollinger", lambda: get_bollinger_fn(20)(short)),
+    ("ATR", lambda: get_atr_fn(14)(short, short, short)),
+    ("ATR mismatched", lambda: get_atr_fn(3)(short, short[:5], short)),
+]
+for name, call in guarded:
+    try:
+        call()
+        print(f"[FAIL] {name}: short input accepted")
+    except ValueError as e:
+        print(f"[OK] {name}: {e}")
+
 print("\n" + "="*60)
 print("INDICATOR TESTS COMPLETE")
 print("="*60)
\ No newline at end of file
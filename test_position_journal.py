@@ -0,0 +1,186 @@
+"""
+Position Manager Journal Replay Test
+
+Verifies crash recovery from the positions snapshot plus the JSONL journal:
+1. Torn final journal line (crash mid-append)
+2. Crash between the snapshot rename and the journal truncate
+3. "open" record for a position that is already in the snapshot
+4. Opens are snapshotted right away, not after JOURNAL_SNAPSHOT_EVERY entries
+5. Concurrent opens journaled out of row order
+6. Close journaled ahead of its open
+"""
+
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+# Setup logging
+logging.basicConfig(level=logging.ERROR)  # Replay warnings are expected here
+
+from data_models.positions import Position
+from tools.position_manager import PositionManager
+
+
+def make_position(position_id: str, status: str = "open") -> Position:
+    """Build a DCA position, closed at 64000 if status is not open."""
+    position = Position(
+        position_id=position_id,
+        strategy="dca",
+        amount_btc=0.01,
+        amount_usd=620.0,
+        entry_price=62000.0,
+        stop_loss=60000.0,
+    )
+    if status != "open":
+        position.status = status
+        position.exit_price = 64000.0
+        position.realized_pnl = 20.0
+        position.realized_pnl_pct = 2000.0 / 62000.0
+    return position
+
+
+def load_manager(directory: Path, snapshot_positions=None, journal_seq=0, journal_lines=()):
+    """Write a snapshot and journal by hand, then load a fresh manager from them."""
+    positions_file = directory / "positions.json"
+
+    if snapshot_positions is not None:
+        positions_file.write_text(
+            json.dumps(
+                {
+                    "journal_seq": journal_seq,
+                    "emergency_mode": False,
+                    "last_dca_time": None,
+                    "positions": [p.to_dict() for p in snapshot_positions],
+                }
+            )
+        )
+
+    positions_file.with_suffix(".jsonl").write_text("".join(journal_lines))
+
+    # Fresh instance (the manager is a singleton)
+    PositionManager._instance = None
+    return PositionManager(initial_budget=10000.0, positions_file=str(positions_file))
+
+
+def journal_line(record: dict) -> str:
+    """Serialize one journal record as a JSONL line."""
+    return json.dumps(record) + "\n"
+
+
+print("=" * 80)
+print("POSITION MANAGER - JOURNAL REPLAY")
+print("=" * 80)
+print()
+
+# TEST 1: Torn final line
+with tempfile.TemporaryDirectory() as tmp:
+    opened = make_position("DCA-20250101-000001")
+    lines = [
+        journal_line({"op": "open", "row": 0, "position": opened.to_dict(), "seq": 1}),
+        journal_line({"op": "tick", "price": 63000.0, "seq": 2}),
+        '{"op": "close", "row": 0, "posi',
+    ]
+    manager = load_manager(Path(tmp), journal_lines=lines)
+
+    assert len(manager.positions) == 1
+    assert manager.positions[0].status == "open"
+    assert manager.positions[0].current_price == 63000.0
+    assert manager._positions_version == 2
+    manager.flush(timeout=5)
+
+print("[OK] Torn final journal line skipped, earlier entries replayed")
+
+# TEST 2: Crash between snapshot rename and journal truncate
+with tempfile.TemporaryDirectory() as tmp:
+    opened = make_position("DCA-20250101-000002")
+    closed = make_position("DCA-20250101-000002", status="closed")
+    lines = [
+        journal_line({"op": "open", "row": 0, "position": opened.to_dict(), "seq": 1}),
+        journal_line({"op": "close", "row": 0, "position": closed.to_dict(), "seq": 2}),
+    ]
+    manager = load_manager(Path(tmp), [closed], journal_seq=2, journal_lines=lines)
+
+    assert len(manager.positions) == 1
+    assert manager.positions[0].status == "closed"
+    assert manager._positions_version == 2
+    assert manager._saved_seq == 2
+
+print("[OK] Journal entries already in the snapshot are not replayed twice")
+
+# TEST 3: "open" record already in the snapshot
+with tempfile.TemporaryDirectory() as tmp:
+    opened = make_position("DCA-20250101-000003")
+    lines = [
+        journal_line({"op": "open", "row": 0, "position": opened.to_dict(), "seq": 1}),
+    ]
+    manager = load_manager(Path(tmp), [opened], journal_seq=0, journal_lines=lines)
+
+    assert len(manager.positions) == 1
+    assert manager.positions[0].position_id == opened.position_id
+    assert manager._positions_version == 1
+
+    # The replayed open is folded into a fresh snapshot
+    assert manager.flush(timeout=5)
+    saved = json.loads(Path(tmp, "positions.json").read_text())
+    assert saved["journal_seq"] == 1
+    assert len(saved["positions"]) == 1
+    assert Path(tmp, "positions.jsonl").read_text() == ""
+
+print("[OK] Open that raced the snapshot replaces its row instead of duplicating")
+
+# TEST 4: Opens are snapshotted without waiting for the tick threshold
+with tempfile.TemporaryDirectory() as tmp:
+    manager = load_manager(Path(tmp))
+    position = manager.open_position("dca", btc_price=62000, amount_usd=500, atr=850)
+
+    deadline = time.monotonic() + 5
+    while manager._saved_seq < manager._positions_version and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    saved = json.loads(Path(tmp, "positions.json").read_text())
+    assert [p["position_id"] for p in saved["positions"]] == [position.position_id]
+
+print("[OK] Open written to the snapshot without an explicit flush")
+
+# TEST 5: Concurrent opens journaled out of row order
+with tempfile.TemporaryDirectory() as tmp:
+    first = make_position("DCA-20250101-000005")
+    second = make_position("DCA-20250101-000006")
+    lines = [
+        journal_line({"op": "open", "row": 1, "position": second.to_dict(), "seq": 1}),
+        journal_line({"op": "open", "row": 0, "position": first.to_dict(), "seq": 2}),
+    ]
+    manager = load_manager(Path(tmp), journal_lines=lines)
+
+    assert [p.position_id for p in manager.positions] == [
+        first.position_id,
+        second.position_id,
+    ]
+    assert manager.get_budget_stats()["allocated_capital"] == 2 * 620.0
+    manager.flush(timeout=5)
+
+print("[OK] Out-of-order opens replayed into their own rows")
+
+# TEST 6: Close journaled ahead of its open
+with tempfile.TemporaryDirectory() as tmp:
+    opened = make_position("DCA-20250101-000007")
+    closed = make_position("DCA-20250101-000007", status="closed")
+    lines = [
+        journal_line({"op": "close", "row": 0, "position": closed.to_dict(), "seq": 1}),
+        journal_line({"op": "open", "row": 0, "position": opened.to_dict(), "seq": 2}),
+    ]
+    manager = load_manager(Path(tmp), journal_lines=lines)
+
+    assert len(manager.positions) == 1
+    assert manager.positions[0].status == "closed"
+    assert manager.get_budget_stats()["allocated_capital"] == 0
+    manager.flush(timeout=5)
+
+print("[OK] Close that beat its open to the journal is not reopened")
+
+PositionManager._instance = None
+
+print()
+print("[OK] Journal replay tests complete!")
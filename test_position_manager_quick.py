@@ -46,6 +46,12 @@ for strategy in ["dca", "swing", "day"]:
 
 print("\n[OK] Stop-loss calculations working\n")
 
+# Runtime config changes take effect immediately
+manager.set_strategy_config("dca", atr_multiplier=3.0)
+assert manager.calculate_stop_loss("dca", entry_price, atr) == entry_price - 3 * atr
+manager.set_strategy_config("dca", atr_multiplier=2.0)
+print("[OK] set_strategy_config applied without a manual refresh\n")
+
 # TEST 2: Budget Allocation
 print("=" * 80)
 print("TEST 2: Budget Allocation Checks")
@@ -172,6 +178,12 @@ for strategy in ["dca", "swing", "day"]:
     print(f"  {strategy.upper()}: {s['count']} positions, ${s['allocated']:,.0f} ({s['allocation_pct']:.1%})")
 
 print()
+
+# Cached budget stats are handed out as copies
+budget_stats["allocated_capital"] = -1.0
+budget_stats["by_strategy"]["dca"]["count"] = -1
+fresh = manager.get_budget_stats()
+assert fresh["allocated_capital"] >= 0 and fresh["by_strategy"]["dca"]["count"] >= 0
 print("[OK] Statistics working\n")
 
 # FINAL CHECKLIST
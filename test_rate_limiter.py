@@ -26,4 +26,119 @@ print("(CMC call 2 would wait 5 minutes)")
 stats = get_all_rate_limit_stats()
 print(f"\n[OK] Usage stats available: {len(stats)} APIs tracked")
 
+# Test jittered reservations keep the call window sorted
+from tools import rate_limiter
+from tools.rate_limiter import SmartRateLimiter
+
+jitter = iter([0.9, 0.1, 0.9, 0.1] * 2)
+real_random = rate_limiter.random.random
+rate_limiter.random.random = lambda: next(jitter)
+try:
+    burst = SmartRateLimiter(max_calls=4, period=10, name="JitterBurst")
+    for i in range(8):
+        burst._reserve(100.0 + i * 0.001)
+finally:
+    rate_limiter.random.random = real_random
+
+ring = [burst._call_times[(burst._call_head + k) % 4] for k in range(burst._call_count)]
+assert ring == sorted(ring), ring
+burst._clean_old_calls(ring[1] + 10 + 0.0005)
+assert burst._call_count == 2, burst._call_count
+print("[OK] Jittered burst reservations stay sorted")
+
+# Test cached results are keyed on argument types as well as values
+from tools.rate_limiter import cache_result
+
+typed_calls = []
+
+@cache_result(ttl=60)
+def echo_type(value, scale=1):
+    typed_calls.append(value)
+    return type(value).__name__
+
+assert [echo_type(1), echo_type(True), echo_type(1.0)] == ["int", "bool", "float"]
+assert echo_type(1, scale=1) == "int" and echo_type(1, scale=1.0) == "int"
+assert [echo_type(1), echo_type(True), echo_type(1.0)] == ["int", "bool", "float"]
+assert len(typed_calls) == 5, typed_calls
+print("[OK] Cache keeps equal values of different types apart")
+
+# Test token bucket burst drain and refill
+from tools.rate_limiter import TokenBucketRateLimiter
+
+bucket = TokenBucketRateLimiter(max_calls=4, period=1, name="BucketTest")
+burst_waits = [bucket._acquire() for _ in range(6)]
+assert burst_waits[:4] == [0.0] * 4, burst_waits
+assert 0.2 < burst_waits[4] <= 0.25 and 0.45 < burst_waits[5] <= 0.5, burst_waits
+assert not bucket.can_make_call()
+assert bucket.get_usage_stats().total_waits == 2
+time.sleep(0.8)  # pays off the two queued tokens and refills one more
+assert bucket.can_make_call() and bucket.calculate_wait_time() == 0.0
+time.sleep(1.0)
+assert bucket._acquire() == 0.0 and bucket._tokens <= bucket.capacity - 1.0
+print("[OK] Token bucket drains bursts at the refill rate and refills to capacity")
+
+# Test cache LRU eviction and clear_cache
+from tools.rate_limiter import clear_cache
+
+lru_calls = []
+
+@cache_result(ttl=60)
+def lru_square(x):
+    lru_calls.append(x)
+    return x * x
+
+real_max_entries = rate_limiter.MAX_CACHE_ENTRIES
+rate_limiter.MAX_CACHE_ENTRIES = 3
+try:
+    for x in (1, 2, 3):
+        lru_square(x)
+    lru_square(1)  # most recently used; 2 is now the oldest
+    lru_square(4)  # evicts 2
+    assert len(rate_limiter._cache[f"{__name__}.lru_square"]) == 3
+    lru_square(1), lru_square(3), lru_square(4)
+    assert lru_calls == [1, 2, 3, 4], lru_calls
+    lru_square(2)
+    assert lru_calls == [1, 2, 3, 4, 2], lru_calls
+finally:
+    rate_limiter.MAX_CACHE_ENTRIES = real_max_entries
+
+clear_cache(lru_square)
+assert lru_square(2) == 4 and lru_calls[-1] == 2 and len(lru_calls) == 6
+clear_cache()
+assert lru_square(2) == 4 and echo_type(1) == "int"
+assert len(lru_calls) == 7 and len(typed_calls) == 6
+print("[OK] Cache evicts least recently used entries and survives clear_cache()")
+
+# Test circuit breaker cooldown doubles on re-open and resets after success
+from tools.rate_limiter import CircuitBreakerOpen, CircuitState
+
+breaker = SmartRateLimiter(
+    max_calls=10, period=1, name="BreakerTest",
+    circuit_breaker_threshold=2, circuit_breaker_timeout=10,
+)
+breaker.MAX_CIRCUIT_BREAKER_TIMEOUT = 30
+
+def expect_cooldown(seconds):
+    opened_at = breaker._circuit_opened_at
+    try:
+        breaker._check_circuit_breaker(opened_at + seconds - 0.01)
+        raise AssertionError("circuit should still be open")
+    except CircuitBreakerOpen:
+        pass
+    breaker._check_circuit_breaker(opened_at + seconds)
+    assert breaker._circuit_state == CircuitState.HALF_OPEN
+
+breaker.record_failure()
+breaker.record_failure()
+expect_cooldown(10)
+for cooldown in (20, 30, 30):  # failed HALF_OPEN probes double it, up to the cap
+    breaker.record_failure()
+    expect_cooldown(cooldown)
+breaker.record_success()
+assert breaker._circuit_state == CircuitState.CLOSED
+breaker.record_failure()
+breaker.record_failure()
+expect_cooldown(10)
+print("[OK] Circuit breaker cooldown backs off exponentially and resets on success")
+
 print("\nRate limiter tests complete!")
\ No newline at end of file
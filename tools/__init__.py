@@ -31,6 +31,7 @@ from typing import List
 # Import rate limiting components
 from tools.rate_limiter import (
     SmartRateLimiter,
+    TokenBucketRateLimiter,
     RateLimitExceeded,
     CircuitBreakerOpen,
     binance_rate_limit,
@@ -61,6 +62,7 @@ from tools.openrouter_client import (
     OpenRouterClient,
     OpenRouterClientError,
     OpenRouterAPIError,
+    get_openrouter_client,
 )
 
 # Import indicator calculator
@@ -73,6 +75,12 @@ from tools.indicator_calculator import (
     calculate_bollinger_bands,
     calculate_all_indicators,
     validate_price_data,
+    IndicatorState,
+    get_rsi_fn,
+    get_sma_fn,
+    get_ema_fn,
+    get_bollinger_fn,
+    get_atr_fn,
 )
 
 # Import RAG engine
@@ -82,8 +90,9 @@ from tools.csv_rag_pipeline import RAGRetriever
 from tools.google_sheets_sync import GoogleSheetsSync, GoogleSheetsSyncError
 
 __all__: List[str] = [
-    # Rate limiter class
+    # Rate limiter classes
     "SmartRateLimiter",
+    "TokenBucketRateLimiter",
     # Exceptions
     "RateLimitExceeded",
     "CircuitBreakerOpen",
@@ -115,6 +124,7 @@ __all__: List[str] = [
     "OpenRouterClient",
     "OpenRouterClientError",
     "OpenRouterAPIError",
+    "get_openrouter_client",
     # Indicator Calculator
     "calculate_rsi",
     "calculate_macd",
@@ -124,6 +134,12 @@ __all__: List[str] = [
     "calculate_bollinger_bands",
     "calculate_all_indicators",
     "validate_price_data",
+    "IndicatorState",
+    "get_rsi_fn",
+    "get_sma_fn",
+    "get_ema_fn",
+    "get_bollinger_fn",
+    "get_atr_fn",
     # RAG Engine
     "RAGRetriever",
     # Google Sheets Sync
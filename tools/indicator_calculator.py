@@ -1,7 +1,9 @@
 """Technical indicator calculator for Bitcoin trading system.
 
-This module calculates technical analysis indicators from market data using
-TA-Lib when available, with manual fallback implementations for reliability.
+This module calculates technical analysis indicators from market data.
+TA-Lib computes RSI, MACD, ATR and EMA (last value and full series) when it
+is installed; otherwise direct NumPy/Numba kernels do, serving as manual
+fallback implementations for reliability.
 
 All indicators are used by trading agents to make informed decisions:
 - RSI: Momentum oscillator (overbought/oversold)
@@ -22,11 +24,14 @@ Example:
 """
 
 import logging
-from typing import List, Optional, Tuple
+import math
+from collections import deque
+from math import fabs as _fabs
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
-from data_models import MarketData, TechnicalIndicators
+from data_models import MarketData, MarketDataBatch, TechnicalIndicators
 
 
 # Configure logger
@@ -45,13 +50,653 @@ except ImportError:
         "Install with: pip install TA-Lib"
     )
 
+# Try to import Numba (optional dependency)
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Try to import Bottleneck (optional dependency for rolling windows)
+try:
+    import bottleneck as bn
+
+    BN_AVAILABLE = True
+except ImportError:
+    BN_AVAILABLE = False
+
+
+# ============================================================================
+# Internal Kernels
+# ============================================================================
+
+def _as_f64(values) -> np.ndarray:
+    """Return ``values`` as a C-contiguous float64 array, copying only if needed.
+
+    ndarray inputs that are already float64 and contiguous (e.g. columns of
+    a MarketDataBatch) pass through without an O(N) copy.
+    """
+    if (
+        isinstance(values, np.ndarray)
+        and values.dtype == np.float64
+        and values.flags["C_CONTIGUOUS"]
+    ):
+        return values
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+# LLVM fast-math flags for the indicator kernels: allow FMA contraction and
+# reassociation of sums, but keep NaN/inf semantics (series outputs use NaN
+# padding, so "nnan"/"ninf" are deliberately left out)
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# Kernels below declare explicit signatures so Numba compiles them eagerly at
+# import time (and caches the machine code to __pycache__) instead of paying
+# the JIT cost on the first indicator call of a trading cycle. Inputs must be
+# C-contiguous float64 arrays, which _as_f64 guarantees.
+
+# Precomputed EMA multipliers 2 / (period + 1) for commonly used periods
+_EMA_K = {p: 2.0 / (p + 1) for p in (5, 9, 12, 14, 20, 26, 50, 100, 200)}
+
+
+@njit("f8[::1](f8[::1], i8)", cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _ema_series(arr: np.ndarray, period: int) -> np.ndarray:
+    """Calculate the full EMA series in a single pass.
+
+    Seeds with the SMA of the first ``period`` values (same convention as
+    TA-Lib and ``calculate_ema``). Entries before the seed are NaN.
+
+    Args:
+        arr: Float64 array of values (most recent last)
+        period: EMA period
+
+    Returns:
+        np.ndarray: EMA series with the same length as ``arr``
+    """
+    n = arr.shape[0]
+    out = np.empty(n)
+    out[: period - 1] = np.nan
+
+    k = 2.0 / (period + 1)
+    ema = 0.0
+    for i in range(period):
+        ema += arr[i]
+    ema /= period
+    out[period - 1] = ema
+
+    for i in range(period, n):
+        ema = (arr[i] - ema) * k + ema
+        out[i] = ema
+
+    return out
+
+
+@njit("f8(f8[::1], i8, f8)", cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _ema_last(arr: np.ndarray, period: int, k: float) -> float:
+    """Calculate the most recent EMA without materializing the series.
+
+    Args:
+        arr: Float64 array of values (most recent last)
+        period: EMA period (SMA seed length)
+        k: EMA multiplier, 2 / (period + 1)
+
+    Returns:
+        float: EMA value
+    """
+    ema = 0.0
+    for i in range(period):
+        ema += arr[i]
+    ema /= period
+
+    for i in range(period, arr.shape[0]):
+        ema = (arr[i] - ema) * k + ema
+
+    return ema
+
+
+@njit("f8(f8, f8)", cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    """Convert Wilder average gain/loss into an RSI value."""
+    if avg_loss == 0.0:
+        return 100.0  # No losses = maximum RSI
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit("f8(f8[::1], i8)", cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _rsi_last(arr: np.ndarray, period: int) -> float:
+    """Calculate the most recent Wilder RSI without materializing the series.
+
+    Args:
+        arr: Float64 array of closing prices (most recent last)
+        period: RSI period
+
+    Returns:
+        float: RSI value between 0 and 100
+    """
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = arr[i] - arr[i - 1]
+        if delta > 0.0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period + 1, arr.shape[0]):
+        delta = arr[i] - arr[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    return _rsi_from_averages(avg_gain, avg_loss)
+
+
+@njit("f8[::1](f8[::1], i8)", cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _rsi_series(arr: np.ndarray, period: int) -> np.ndarray:
+    """Calculate the full Wilder RSI series (NaN for the first ``period`` bars).
+
+    Args:
+        arr: Float64 array of closing prices (most recent last)
+        period: RSI period
+
+    Returns:
+        np.ndarray: RSI series with the same length as ``arr``
+    """
+    n = arr.shape[0]
+    out = np.full(n, np.nan)
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = arr[i] - arr[i - 1]
+        if delta > 0.0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+    out[period] = _rsi_from_averages(avg_gain, avg_loss)
+
+    for i in range(period + 1, n):
+        delta = arr[i] - arr[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        out[i] = _rsi_from_averages(avg_gain, avg_loss)
+
+    return out
+
+
+@njit("f8(f8[::1], f8[::1], f8[::1], i8)", cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _atr_wilder(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    """Calculate the most recent Wilder ATR in a single streaming pass.
+
+    Seeds with the mean of the first ``period`` True Ranges (bars 1..period),
+    then applies atr = (atr * (period - 1) + tr) / period, which is what
+    TA-Lib computes. No True Range buffer is allocated.
+
+    Args:
+        high: Float64 high prices
+        low: Float64 low prices
+        close: Float64 closing prices
+        period: ATR period
+
+    Returns:
+        float: ATR value
+    """
+    sum_tr = 0.0
+    for i in range(1, period + 1):
+        prev_close = close[i - 1]
+        high_i = high[i]
+        low_i = low[i]
+        sum_tr += max(high_i - low_i, _fabs(high_i - prev_close), _fabs(low_i - prev_close))
+    atr = sum_tr / period
+
+    for i in range(period + 1, high.shape[0]):
+        prev_close = close[i - 1]
+        high_i = high[i]
+        low_i = low[i]
+        tr = max(high_i - low_i, _fabs(high_i - prev_close), _fabs(low_i - prev_close))
+        atr = (atr * (period - 1) + tr) / period
+
+    return atr
+
+
+@njit("f8[::1](f8[::1], i8)", cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _wilder_series(values: np.ndarray, period: int) -> np.ndarray:
+    """Apply Wilder smoothing over a series (NaN before the first full window).
+
+    Args:
+        values: Float64 array of values to smooth (e.g. True Ranges)
+        period: Smoothing period
+
+    Returns:
+        np.ndarray: Smoothed series with the same length as ``values``
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+
+    smoothed = 0.0
+    for i in range(period):
+        smoothed += values[i]
+    smoothed /= period
+    out[period - 1] = smoothed
+
+    for i in range(period, n):
+        smoothed = (smoothed * (period - 1) + values[i]) / period
+        out[i] = smoothed
+
+    return out
+
+
+@njit("UniTuple(f8, 10)(f8[::1], f8[::1], f8[::1])", cache=True, fastmath=_FASTMATH, boundscheck=False)
+def _all_indicators(
+    prices: np.ndarray, highs: np.ndarray, lows: np.ndarray
+) -> Tuple[float, float, float, float, float, float, float, float, float, float]:
+    """Calculate every indicator used by calculate_all_indicators in one sweep.
+
+    Walks ``prices`` (and ``highs``/``lows``) exactly once while maintaining
+    all running states: EMA(12)/EMA(26) and the MACD signal EMA(9), Wilder
+    RSI(14) averages and ATR(14), and the trailing SMA(50) and Bollinger(20)
+    Welford windows. Matches the standalone ``calculate_*`` functions.
+
+    Args:
+        prices: Float64 closing prices (at least 50, most recent last)
+        highs: Float64 high prices, same length as ``prices``
+        lows: Float64 low prices, same length as ``prices``
+
+    Returns:
+        Tuple: (rsi_14, macd, macd_signal, macd_histogram, atr_14, sma_50,
+            ema_12, ema_26, bollinger_upper, bollinger_lower)
+    """
+    n = prices.shape[0]
+
+    k_fast = 2.0 / (12 + 1)
+    k_slow = 2.0 / (26 + 1)
+    k_signal = 2.0 / (9 + 1)
+
+    ema_fast = 0.0
+    ema_slow = 0.0
+    macd_signal = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    atr = 0.0
+    sma_sum = 0.0
+    bb_n = 0
+    bb_mean = 0.0
+    bb_m2 = 0.0
+
+    for i in range(n):
+        price = prices[i]
+
+        # EMA(12) / EMA(26): SMA seed, then recurrence
+        if i < 12:
+            ema_fast += price
+            if i == 11:
+                ema_fast /= 12
+        else:
+            ema_fast = (price - ema_fast) * k_fast + ema_fast
+
+        if i < 26:
+            ema_slow += price
+            if i == 25:
+                ema_slow /= 26
+        else:
+            ema_slow = (price - ema_slow) * k_slow + ema_slow
+
+        # MACD signal: EMA(9) of the MACD line, defined from bar 25
+        if i >= 25:
+            macd_val = ema_fast - ema_slow
+            j = i - 25
+            if j < 9:
+                macd_signal += macd_val
+                if j == 8:
+                    macd_signal /= 9
+            else:
+                macd_signal = (macd_val - macd_signal) * k_signal + macd_signal
+
+        if i >= 1:
+            prev_close = prices[i - 1]
+
+            # RSI(14): Wilder smoothing of gains/losses
+            delta = price - prev_close
+            gain = delta if delta > 0.0 else 0.0
+            loss = -delta if delta < 0.0 else 0.0
+            if i <= 14:
+                avg_gain += gain
+                avg_loss += loss
+                if i == 14:
+                    avg_gain /= 14
+                    avg_loss /= 14
+            else:
+                avg_gain = (avg_gain * 13 + gain) / 14
+                avg_loss = (avg_loss * 13 + loss) / 14
+
+            # ATR(14): Wilder smoothing of True Range
+            high_i = highs[i]
+            low_i = lows[i]
+            tr = max(high_i - low_i, _fabs(high_i - prev_close), _fabs(low_i - prev_close))
+            if i <= 14:
+                atr += tr
+                if i == 14:
+                    atr /= 14
+            else:
+                atr = (atr * 13 + tr) / 14
+
+        # SMA(50): trailing window sum
+        if i >= n - 50:
+            sma_sum += price
+
+        # Bollinger(20): Welford over the trailing window
+        if i >= n - 20:
+            bb_n += 1
+            d1 = price - bb_mean
+            bb_mean += d1 / bb_n
+            bb_m2 += d1 * (price - bb_mean)
+
+    macd_val = ema_fast - ema_slow
+    bb_std = math.sqrt(max(bb_m2, 0.0) / bb_n)
+
+    return (
+        _rsi_from_averages(avg_gain, avg_loss),
+        macd_val,
+        macd_signal,
+        macd_val - macd_signal,
+        atr,
+        sma_sum / 50,
+        ema_fast,
+        ema_slow,
+        bb_mean + 2.0 * bb_std,
+        bb_mean - 2.0 * bb_std,
+    )
+
+
+def _true_range_series(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Calculate True Range for bars 1..N-1 (bar 0 has no previous close).
+
+    Branchless: True Range = max(high-low, |high-prev_close|, |low-prev_close|)
+    is folded with two element-wise np.maximum calls, reusing the
+    intermediate buffers via ``out=`` so only three arrays are allocated.
+    """
+    prev_close = close[:-1]
+    high_1 = high[1:]
+    low_1 = low[1:]
+
+    true_range = np.subtract(high_1, low_1)
+    high_gap = np.subtract(high_1, prev_close)
+    np.abs(high_gap, out=high_gap)
+    low_gap = np.subtract(low_1, prev_close)
+    np.abs(low_gap, out=low_gap)
+
+    np.maximum(high_gap, low_gap, out=high_gap)
+    np.maximum(true_range, high_gap, out=true_range)
+    return true_range
+
+
+def _rolling_mean_std(
+    arr: np.ndarray, period: int, with_std: bool = True
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Calculate rolling mean (and population std) over the full series.
+
+    Uses Bottleneck's O(N) sliding-window kernels when available, otherwise
+    a NumPy sliding-window view. Entries before the first full window are NaN.
+
+    Args:
+        arr: Float64 array of values (most recent last)
+        period: Window length
+        with_std: Also compute the rolling standard deviation (ddof=0)
+
+    Returns:
+        Tuple[np.ndarray, Optional[np.ndarray]]: (rolling_mean, rolling_std)
+    """
+    if BN_AVAILABLE:
+        mean = bn.move_mean(arr, window=period)
+        std = bn.move_std(arr, window=period, ddof=0) if with_std else None
+        return mean, std
+
+    windows = np.lib.stride_tricks.sliding_window_view(arr, period)
+    mean = np.full(arr.shape[0], np.nan)
+    mean[period - 1 :] = windows.mean(axis=1)
+    std = None
+    if with_std:
+        std = np.full(arr.shape[0], np.nan)
+        std[period - 1 :] = windows.std(axis=1)
+    return mean, std
+
+
+# ============================================================================
+# Indicator Dispatch
+# ============================================================================
+
+# Resolved last-value implementations keyed by (indicator, *params)
+_DISPATCH: Dict[tuple, Callable] = {}
+
+
+def _require_length(n: int, min_len: int, name: str) -> None:
+    """Raise ValueError if a series is too short for an indicator.
+
+    The kernels run with bounds checking off, so this guard is all that
+    stands between a short array and an out-of-bounds read.
+    """
+    if n < min_len:
+        raise ValueError(f"Need at least {min_len} prices for {name}. Got {n} prices.")
+
+
+def get_rsi_fn(period: int = 14) -> Callable[[np.ndarray], float]:
+    """Get the resolved last-value RSI function for a period.
+
+    The backend is resolved once: TA-Lib when available (falling back to
+    the kernel if it fails), otherwise the NumPy/Numba kernel. The returned
+    function skips type conversion, so bar-by-bar loops (e.g. backtests)
+    can call it directly. It expects a C-contiguous float64 array and only
+    checks the length: fewer than ``period + 1`` prices raise ValueError.
+
+    Args:
+        period: RSI period (default: 14)
+
+    Returns:
+        Callable[[np.ndarray], float]: Function mapping prices to RSI
+
+    Example:
+        >>> rsi_fn = get_rsi_fn(14)
+        >>> rsi = rsi_fn(prices_array)
+    """
+    key = ("rsi", period)
+    fn = _DISPATCH.get(key)
+    if fn is None:
+
+        if TALIB_AVAILABLE:
+
+            def fn(prices_array: np.ndarray) -> float:
+                _require_length(len(prices_array), period + 1, f"RSI({period})")
+                try:
+                    return float(talib.RSI(prices_array, timeperiod=period)[-1])
+                except Exception as e:
+                    logger.warning(f"TA-Lib RSI calculation failed: {e}. Using fallback.")
+                return float(_rsi_last(prices_array, period))
+
+        else:
+
+            def fn(prices_array: np.ndarray) -> float:
+                _require_length(len(prices_array), period + 1, f"RSI({period})")
+                return float(_rsi_last(prices_array, period))
+
+        _DISPATCH[key] = fn
+    return fn
+
+
+def get_sma_fn(period: int = 50) -> Callable[[np.ndarray], float]:
+    """Get the resolved last-value SMA function for a period.
+
+    Like get_rsi_fn(), the returned function only checks the length
+    (at least ``period`` prices).
+
+    Args:
+        period: SMA period (default: 50)
+
+    Returns:
+        Callable[[np.ndarray], float]: Function mapping prices to SMA
+    """
+    key = ("sma", period)
+    fn = _DISPATCH.get(key)
+    if fn is None:
+
+        def fn(prices_array: np.ndarray) -> float:
+            _require_length(len(prices_array), period, f"SMA({period})")
+            return float(prices_array[-period:].sum() / period)
+
+        _DISPATCH[key] = fn
+    return fn
+
+
+def get_ema_fn(period: int = 12) -> Callable[[np.ndarray], float]:
+    """Get the resolved last-value EMA function for a period.
+
+    Uses TA-Lib when available, then the compiled Numba kernel; otherwise
+    runs the recurrence over a Python list with an fsum seed. Like
+    get_rsi_fn(), the returned function only checks the length (at least
+    ``period`` prices).
+
+    Args:
+        period: EMA period (default: 12)
+
+    Returns:
+        Callable[[np.ndarray], float]: Function mapping prices to EMA
+    """
+    key = ("ema", period)
+    fn = _DISPATCH.get(key)
+    if fn is None:
+        # EMA multiplier: 2 / (period + 1)
+        multiplier = _EMA_K.get(period) or 2.0 / (period + 1)
+
+        if NUMBA_AVAILABLE:
+
+            def kernel_fn(prices_array: np.ndarray) -> float:
+                return float(_ema_last(prices_array, period, multiplier))
+
+        else:
+
+            def kernel_fn(prices_array: np.ndarray) -> float:
+                prices = prices_array.tolist()
+
+                # Start with SMA as initial EMA (fsum avoids round-off in the seed)
+                ema = math.fsum(prices[:period]) / period
+
+                # Calculate EMA for remaining prices (index loop avoids copying a slice)
+                for i in range(period, len(prices)):
+                    ema = (prices[i] - ema) * multiplier + ema
+                return ema
+
+        if TALIB_AVAILABLE:
+
+            def fn(prices_array: np.ndarray) -> float:
+                _require_length(len(prices_array), period, f"EMA({period})")
+                try:
+                    return float(talib.EMA(prices_array, timeperiod=period)[-1])
+                except Exception as e:
+                    logger.warning(f"TA-Lib EMA calculation failed: {e}. Using fallback.")
+                return kernel_fn(prices_array)
+
+        else:
+
+            def fn(prices_array: np.ndarray) -> float:
+                _require_length(len(prices_array), period, f"EMA({period})")
+                return kernel_fn(prices_array)
+
+        _DISPATCH[key] = fn
+    return fn
+
+
+def get_bollinger_fn(
+    period: int = 20, num_std: float = 2.0
+) -> Callable[[np.ndarray], Tuple[float, float, float]]:
+    """Get the resolved last-value Bollinger Bands function.
+
+    Like get_rsi_fn(), the returned function only checks the length
+    (at least ``period`` prices).
+
+    Args:
+        period: Window length (default: 20)
+        num_std: Number of standard deviations (default: 2.0)
+
+    Returns:
+        Callable[[np.ndarray], Tuple[float, float, float]]: Function mapping
+            prices to (upper_band, middle_band, lower_band)
+    """
+    key = ("bbands", period, num_std)
+    fn = _DISPATCH.get(key)
+    if fn is None:
+
+        def fn(prices_array: np.ndarray) -> Tuple[float, float, float]:
+            _require_length(len(prices_array), period, f"Bollinger Bands({period})")
+            window = prices_array[-period:]
+            middle_band = float(window.mean())
+            std_dev = float(window.std())
+            return (
+                middle_band + (num_std * std_dev),
+                middle_band,
+                middle_band - (num_std * std_dev),
+            )
+
+        _DISPATCH[key] = fn
+    return fn
+
+
+def get_atr_fn(period: int = 14) -> Callable[[np.ndarray, np.ndarray, np.ndarray], float]:
+    """Get the resolved last-value ATR function for a period.
+
+    Like get_rsi_fn(), TA-Lib is preferred when available and the returned
+    function only checks lengths: the arrays must match and hold at least
+    ``period + 1`` bars.
+
+    Args:
+        period: ATR period (default: 14)
+
+    Returns:
+        Callable: Function mapping (high, low, close) arrays to ATR
+    """
+    key = ("atr", period)
+    fn = _DISPATCH.get(key)
+    if fn is None:
+
+        def fn(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> float:
+            n = len(high)
+            if len(low) != n or len(close) != n:
+                raise ValueError(
+                    f"Price arrays must have same length. "
+                    f"Got high={n}, low={len(low)}, close={len(close)}"
+                )
+            _require_length(n, period + 1, f"ATR({period})")
+            if TALIB_AVAILABLE:
+                try:
+                    return float(talib.ATR(high, low, close, timeperiod=period)[-1])
+                except Exception as e:
+                    logger.warning(f"TA-Lib ATR calculation failed: {e}. Using fallback.")
+            return float(_atr_wilder(high, low, close, period))
+
+        _DISPATCH[key] = fn
+    return fn
+
 
 # ============================================================================
 # RSI (Relative Strength Index)
 # ============================================================================
 
 
-def calculate_rsi(prices: List[float], period: int = 14) -> float:
+def calculate_rsi(
+    prices: List[float], period: int = 14, return_series: bool = False
+) -> Union[float, np.ndarray]:
     """Calculate Relative Strength Index (RSI).
 
     RSI is a momentum oscillator that measures the speed and magnitude
@@ -65,9 +710,12 @@ def calculate_rsi(prices: List[float], period: int = 14) -> float:
     Args:
         prices: List of closing prices (most recent last)
         period: Number of periods for RSI calculation (default: 14)
+        return_series: Return the full RSI series instead of only the
+            most recent value
 
     Returns:
-        float: RSI value between 0 and 100
+        float: RSI value between 0 and 100, or np.ndarray of RSI values
+            if return_series is True
 
     Raises:
         ValueError: If prices list is too short for calculation
@@ -84,46 +732,21 @@ def calculate_rsi(prices: List[float], period: int = 14) -> float:
             f"Got {len(prices)} prices."
         )
 
-    if TALIB_AVAILABLE:
-        # Use TA-Lib for accurate calculation
-        try:
-            prices_array = np.array(prices, dtype=float)
-            rsi_values = talib.RSI(prices_array, timeperiod=period)
-            # Return most recent non-NaN value
-            rsi = float(rsi_values[-1])
-            logger.debug(f"Calculated RSI({period}) = {rsi:.2f} using TA-Lib")
-            return rsi
-        except Exception as e:
-            logger.warning(f"TA-Lib RSI calculation failed: {e}. Using fallback.")
-            # Fall through to manual calculation
-
-    # Fallback: Manual RSI calculation
-    logger.debug(f"Calculating RSI({period}) manually (fallback)")
-
-    # Calculate price changes (deltas)
-    deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
-
-    # Separate gains and losses
-    gains = [delta if delta > 0 else 0 for delta in deltas]
-    losses = [-delta if delta < 0 else 0 for delta in deltas]
+    prices_array = _as_f64(prices)
 
-    # Calculate initial average gain and loss
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
+    if return_series:
+        if TALIB_AVAILABLE:
+            try:
+                return talib.RSI(prices_array, timeperiod=period)
+            except Exception as e:
+                logger.warning(f"TA-Lib RSI calculation failed: {e}. Using fallback.")
+                # Fall through to manual calculation
+        return _rsi_series(prices_array, period)
 
-    # Smooth the averages using Wilder's smoothing method
-    for i in range(period, len(gains)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+    # Only the last value is needed: skip TA-Lib's N-length output buffer
+    rsi = get_rsi_fn(period)(prices_array)
 
-    # Calculate RS and RSI
-    if avg_loss == 0:
-        rsi = 100.0  # No losses = maximum RSI
-    else:
-        rs = avg_gain / avg_loss
-        rsi = 100.0 - (100.0 / (1.0 + rs))
-
-    logger.debug(f"Calculated RSI({period}) = {rsi:.2f} (manual)")
+    logger.debug(f"Calculated RSI({period}) = {rsi:.2f}")
     return rsi
 
 
@@ -133,8 +756,12 @@ def calculate_rsi(prices: List[float], period: int = 14) -> float:
 
 
 def calculate_macd(
-    prices: List[float], fast: int = 12, slow: int = 26, signal: int = 9
-) -> Tuple[float, float, float]:
+    prices: List[float],
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+    return_series: bool = False,
+) -> Union[Tuple[float, float, float], Tuple[np.ndarray, np.ndarray, np.ndarray]]:
     """Calculate MACD, Signal, and Histogram.
 
     MACD is a trend-following momentum indicator that shows the relationship
@@ -154,9 +781,12 @@ def calculate_macd(
         fast: Fast EMA period (default: 12)
         slow: Slow EMA period (default: 26)
         signal: Signal line EMA period (default: 9)
+        return_series: Return the full MACD/signal/histogram series instead
+            of only the most recent values
 
     Returns:
-        Tuple[float, float, float]: (macd, signal, histogram)
+        Tuple[float, float, float]: (macd, signal, histogram), or a tuple of
+            np.ndarray series if return_series is True
 
     Raises:
         ValueError: If prices list is too short for calculation
@@ -172,45 +802,38 @@ def calculate_macd(
             f"Need at least {min_required} prices for MACD. Got {len(prices)} prices."
         )
 
+    prices_array = _as_f64(prices)
+
     if TALIB_AVAILABLE:
-        # Use TA-Lib for accurate calculation
         try:
-            prices_array = np.array(prices, dtype=float)
             macd_line, signal_line, histogram = talib.MACD(
                 prices_array, fastperiod=fast, slowperiod=slow, signalperiod=signal
             )
-            # Return most recent non-NaN values
-            macd_val = float(macd_line[-1])
-            signal_val = float(signal_line[-1])
-            histogram_val = float(histogram[-1])
-
-            logger.debug(
-                f"Calculated MACD = {macd_val:.2f}, Signal = {signal_val:.2f} using TA-Lib"
-            )
-            return macd_val, signal_val, histogram_val
+            if return_series:
+                return macd_line, signal_line, histogram
+            return float(macd_line[-1]), float(signal_line[-1]), float(histogram[-1])
         except Exception as e:
             logger.warning(f"TA-Lib MACD calculation failed: {e}. Using fallback.")
             # Fall through to manual calculation
 
-    # Fallback: Manual MACD calculation
-    logger.debug("Calculating MACD manually (fallback)")
+    # MACD line = Fast EMA - Slow EMA (full series, valid from index slow-1)
+    macd_series = _ema_series(prices_array, fast) - _ema_series(prices_array, slow)
 
-    # Calculate EMAs
-    ema_fast = calculate_ema(prices, period=fast)
-    ema_slow = calculate_ema(prices, period=slow)
+    # Signal line = EMA of the MACD series
+    signal_series = _ema_series(macd_series[slow - 1 :], signal)
 
-    # MACD line = Fast EMA - Slow EMA
-    macd_val = ema_fast - ema_slow
+    if return_series:
+        signal_full = np.full(macd_series.shape[0], np.nan)
+        signal_full[slow - 1 :] = signal_series
+        return macd_series, signal_full, macd_series - signal_full
 
-    # For signal line, we need to calculate EMA of MACD values
-    # Since we only have the current MACD, we'll use a simplified approach
-    # In production, you'd maintain a history of MACD values
-    signal_val = macd_val  # Simplified - assumes signal converges to MACD
+    macd_val = float(macd_series[-1])
+    signal_val = float(signal_series[-1])
 
     # Histogram
     histogram_val = macd_val - signal_val
 
-    logger.debug(f"Calculated MACD = {macd_val:.2f} (manual, simplified)")
+    logger.debug(f"Calculated MACD = {macd_val:.2f}, Signal = {signal_val:.2f}")
     return macd_val, signal_val, histogram_val
 
 
@@ -220,12 +843,17 @@ def calculate_macd(
 
 
 def calculate_atr(
-    high: List[float], low: List[float], close: List[float], period: int = 14
-) -> float:
+    high: List[float],
+    low: List[float],
+    close: List[float],
+    period: int = 14,
+    return_series: bool = False,
+) -> Union[float, np.ndarray]:
     """Calculate Average True Range (ATR).
 
     ATR is a volatility indicator that measures the average range between
-    high and low prices. Higher ATR indicates higher volatility.
+    high and low prices. Higher ATR indicates higher volatility. True Range
+    is smoothed with Wilder's method (same as TA-Lib).
 
     Used for:
     - Stop-loss calculation: Stop = Price - (ATR × Multiplier)
@@ -237,9 +865,12 @@ def calculate_atr(
         low: List of low prices
         close: List of closing prices
         period: Number of periods for ATR calculation (default: 14)
+        return_series: Return the full ATR series instead of only the
+            most recent value
 
     Returns:
-        float: ATR value (always positive)
+        float: ATR value (always positive), or np.ndarray of ATR values
+            if return_series is True
 
     Raises:
         ValueError: If price lists are too short or mismatched
@@ -262,43 +893,28 @@ def calculate_atr(
             f"Need at least {period + 1} prices for ATR({period}). Got {len(high)} prices."
         )
 
-    if TALIB_AVAILABLE:
-        # Use TA-Lib for accurate calculation
-        try:
-            high_array = np.array(high, dtype=float)
-            low_array = np.array(low, dtype=float)
-            close_array = np.array(close, dtype=float)
-
-            atr_values = talib.ATR(high_array, low_array, close_array, timeperiod=period)
-            atr = float(atr_values[-1])
-
-            logger.debug(f"Calculated ATR({period}) = {atr:.2f} using TA-Lib")
-            return atr
-        except Exception as e:
-            logger.warning(f"TA-Lib ATR calculation failed: {e}. Using fallback.")
-            # Fall through to manual calculation
-
-    # Fallback: Manual ATR calculation
-    logger.debug(f"Calculating ATR({period}) manually (fallback)")
-
-    # Calculate True Range for each period
-    true_ranges = []
-    for i in range(1, len(close)):
-        # True Range = max(high-low, abs(high-prev_close), abs(low-prev_close))
-        tr = max(
-            high[i] - low[i],
-            abs(high[i] - close[i - 1]),
-            abs(low[i] - close[i - 1]),
+    if return_series:
+        high_array = _as_f64(high)
+        low_array = _as_f64(low)
+        close_array = _as_f64(close)
+
+        if TALIB_AVAILABLE:
+            try:
+                return talib.ATR(high_array, low_array, close_array, timeperiod=period)
+            except Exception as e:
+                logger.warning(f"TA-Lib ATR calculation failed: {e}. Using fallback.")
+                # Fall through to manual calculation
+
+        atr_series = np.full(close_array.shape[0], np.nan)
+        atr_series[1:] = _wilder_series(
+            _true_range_series(high_array, low_array, close_array), period
         )
-        true_ranges.append(tr)
+        return atr_series
 
-    # ATR = Average of True Ranges
-    if len(true_ranges) >= period:
-        atr = sum(true_ranges[-period:]) / period
-    else:
-        atr = sum(true_ranges) / len(true_ranges)
+    # Only the last value is needed: stream Wilder smoothing without a TR buffer
+    atr = get_atr_fn(period)(_as_f64(high), _as_f64(low), _as_f64(close))
 
-    logger.debug(f"Calculated ATR({period}) = {atr:.2f} (manual)")
+    logger.debug(f"Calculated ATR({period}) = {atr:.2f}")
     return atr
 
 
@@ -307,7 +923,9 @@ def calculate_atr(
 # ============================================================================
 
 
-def calculate_sma(prices: List[float], period: int = 50) -> float:
+def calculate_sma(
+    prices: List[float], period: int = 50, return_series: bool = False
+) -> Union[float, np.ndarray]:
     """Calculate Simple Moving Average (SMA).
 
     SMA is the arithmetic mean of prices over a specified period.
@@ -319,9 +937,12 @@ def calculate_sma(prices: List[float], period: int = 50) -> float:
     Args:
         prices: List of closing prices (most recent last)
         period: Number of periods for SMA calculation (default: 50)
+        return_series: Return the full SMA series (e.g. for charting)
+            instead of only the most recent value
 
     Returns:
-        float: SMA value
+        float: SMA value, or np.ndarray of SMA values (NaN before the
+            first full window) if return_series is True
 
     Raises:
         ValueError: If prices list is too short for calculation
@@ -336,23 +957,23 @@ def calculate_sma(prices: List[float], period: int = 50) -> float:
             f"Need at least {period} prices for SMA({period}). Got {len(prices)} prices."
         )
 
-    if TALIB_AVAILABLE:
-        # Use TA-Lib for accurate calculation
-        try:
-            prices_array = np.array(prices, dtype=float)
-            sma_values = talib.SMA(prices_array, timeperiod=period)
-            sma = float(sma_values[-1])
+    prices_array = _as_f64(prices)
 
-            logger.debug(f"Calculated SMA({period}) = {sma:.2f} using TA-Lib")
-            return sma
-        except Exception as e:
-            logger.warning(f"TA-Lib SMA calculation failed: {e}. Using fallback.")
-            # Fall through to manual calculation
+    if return_series:
+        # Bottleneck's sliding window beats TA-Lib; use TA-Lib only without it
+        if TALIB_AVAILABLE and not BN_AVAILABLE:
+            try:
+                return talib.SMA(prices_array, timeperiod=period)
+            except Exception as e:
+                logger.warning(f"TA-Lib SMA calculation failed: {e}. Using fallback.")
+                # Fall through to manual calculation
+        sma_series, _ = _rolling_mean_std(prices_array, period, with_std=False)
+        return sma_series
 
-    # Fallback: Manual SMA calculation
-    sma = sum(prices[-period:]) / period
+    # Only the last value is needed: average the trailing window directly
+    sma = get_sma_fn(period)(prices_array)
 
-    logger.debug(f"Calculated SMA({period}) = {sma:.2f} (manual)")
+    logger.debug(f"Calculated SMA({period}) = {sma:.2f}")
     return sma
 
 
@@ -361,7 +982,9 @@ def calculate_sma(prices: List[float], period: int = 50) -> float:
 # ============================================================================
 
 
-def calculate_ema(prices: List[float], period: int = 12) -> float:
+def calculate_ema(
+    prices: List[float], period: int = 12, return_series: bool = False
+) -> Union[float, np.ndarray]:
     """Calculate Exponential Moving Average (EMA).
 
     EMA is a weighted moving average that gives more weight to recent prices.
@@ -373,9 +996,12 @@ def calculate_ema(prices: List[float], period: int = 12) -> float:
     Args:
         prices: List of closing prices (most recent last)
         period: Number of periods for EMA calculation (default: 12)
+        return_series: Return the full EMA series instead of only the
+            most recent value
 
     Returns:
-        float: EMA value
+        float: EMA value, or np.ndarray of EMA values (NaN before the seed)
+            if return_series is True
 
     Raises:
         ValueError: If prices list is too short for calculation
@@ -391,33 +1017,21 @@ def calculate_ema(prices: List[float], period: int = 12) -> float:
             f"Need at least {period} prices for EMA({period}). Got {len(prices)} prices."
         )
 
-    if TALIB_AVAILABLE:
-        # Use TA-Lib for accurate calculation
-        try:
-            prices_array = np.array(prices, dtype=float)
-            ema_values = talib.EMA(prices_array, timeperiod=period)
-            ema = float(ema_values[-1])
-
-            logger.debug(f"Calculated EMA({period}) = {ema:.2f} using TA-Lib")
-            return ema
-        except Exception as e:
-            logger.warning(f"TA-Lib EMA calculation failed: {e}. Using fallback.")
-            # Fall through to manual calculation
-
-    # Fallback: Manual EMA calculation
-    logger.debug(f"Calculating EMA({period}) manually (fallback)")
+    if return_series:
+        prices_array = _as_f64(prices)
 
-    # EMA multiplier: 2 / (period + 1)
-    multiplier = 2.0 / (period + 1)
+        if TALIB_AVAILABLE:
+            try:
+                return talib.EMA(prices_array, timeperiod=period)
+            except Exception as e:
+                logger.warning(f"TA-Lib EMA calculation failed: {e}. Using fallback.")
+                # Fall through to manual calculation
+        return _ema_series(prices_array, period)
 
-    # Start with SMA as initial EMA
-    ema = sum(prices[:period]) / period
+    # Only the last value is needed: run the recurrence without an output buffer
+    ema = get_ema_fn(period)(_as_f64(prices))
 
-    # Calculate EMA for remaining prices
-    for price in prices[period:]:
-        ema = (price - ema) * multiplier + ema
-
-    logger.debug(f"Calculated EMA({period}) = {ema:.2f} (manual)")
+    logger.debug(f"Calculated EMA({period}) = {ema:.2f}")
     return ema
 
 
@@ -427,8 +1041,8 @@ def calculate_ema(prices: List[float], period: int = 12) -> float:
 
 
 def calculate_bollinger_bands(
-    prices: List[float], period: int = 20, num_std: float = 2.0
-) -> Tuple[float, float, float]:
+    prices: List[float], period: int = 20, num_std: float = 2.0, return_series: bool = False
+) -> Union[Tuple[float, float, float], Tuple[np.ndarray, np.ndarray, np.ndarray]]:
     """Calculate Bollinger Bands (Upper, Middle, Lower).
 
     Bollinger Bands consist of:
@@ -446,9 +1060,12 @@ def calculate_bollinger_bands(
         prices: List of closing prices (most recent last)
         period: Number of periods for calculation (default: 20)
         num_std: Number of standard deviations (default: 2.0)
+        return_series: Return the full band series (e.g. for charting)
+            instead of only the most recent values
 
     Returns:
-        Tuple[float, float, float]: (upper_band, middle_band, lower_band)
+        Tuple[float, float, float]: (upper_band, middle_band, lower_band),
+            or a tuple of np.ndarray series if return_series is True
 
     Raises:
         ValueError: If prices list is too short for calculation
@@ -464,47 +1081,122 @@ def calculate_bollinger_bands(
             f"Got {len(prices)} prices."
         )
 
-    if TALIB_AVAILABLE:
-        # Use TA-Lib for accurate calculation
-        try:
-            prices_array = np.array(prices, dtype=float)
-            upper, middle, lower = talib.BBANDS(
-                prices_array, timeperiod=period, nbdevup=num_std, nbdevdn=num_std
-            )
+    prices_array = _as_f64(prices)
+
+    if return_series:
+        # Bottleneck's sliding window beats TA-Lib; use TA-Lib only without it
+        if TALIB_AVAILABLE and not BN_AVAILABLE:
+            try:
+                return talib.BBANDS(
+                    prices_array, timeperiod=period, nbdevup=num_std, nbdevdn=num_std
+                )
+            except Exception as e:
+                logger.warning(f"TA-Lib Bollinger Bands calculation failed: {e}. Using fallback.")
+                # Fall through to manual calculation
+        middle_series, std_series = _rolling_mean_std(prices_array, period)
+        return (
+            middle_series + num_std * std_series,
+            middle_series,
+            middle_series - num_std * std_series,
+        )
 
-            upper_val = float(upper[-1])
-            middle_val = float(middle[-1])
-            lower_val = float(lower[-1])
+    # Only the last values are needed: mean and std of the trailing window
+    upper_band, middle_band, lower_band = get_bollinger_fn(period, num_std)(prices_array)
+
+    logger.debug(
+        f"Calculated Bollinger Bands: Upper={upper_band:.2f}, "
+        f"Middle={middle_band:.2f}, Lower={lower_band:.2f}"
+    )
+    return upper_band, middle_band, lower_band
 
-            logger.debug(
-                f"Calculated Bollinger Bands: "
-                f"Upper={upper_val:.2f}, Middle={middle_val:.2f}, "
-                f"Lower={lower_val:.2f} using TA-Lib"
-            )
-            return upper_val, middle_val, lower_val
-        except Exception as e:
-            logger.warning(f"TA-Lib Bollinger Bands calculation failed: {e}. Using fallback.")
-            # Fall through to manual calculation
 
-    # Fallback: Manual Bollinger Bands calculation
-    logger.debug(f"Calculating Bollinger Bands({period}) manually (fallback)")
+# ============================================================================
+# Incremental Indicator State
+# ============================================================================
 
-    # Calculate middle band (SMA)
-    middle_band = sum(prices[-period:]) / period
 
-    # Calculate standard deviation
-    variance = sum((p - middle_band) ** 2 for p in prices[-period:]) / period
-    std_dev = variance**0.5
+class IndicatorState:
+    """Incremental indicator state for bar-by-bar updates (e.g. backtests).
 
-    # Calculate upper and lower bands
-    upper_band = middle_band + (num_std * std_dev)
-    lower_band = middle_band - (num_std * std_dev)
+    Instead of re-scanning the full window every bar, the state is updated
+    in O(1) per price. Bollinger Bands use Welford's online recurrence with
+    add/evict over a sliding window, which avoids the catastrophic
+    cancellation of the naive sum-of-squares formula.
 
-    logger.debug(
-        f"Calculated Bollinger Bands: Upper={upper_band:.2f}, "
-        f"Middle={middle_band:.2f}, Lower={lower_band:.2f} (manual)"
-    )
-    return upper_band, middle_band, lower_band
+    Attributes:
+        bb_period: Bollinger Bands window length
+        bb_num_std: Number of standard deviations for the bands
+
+    Example:
+        >>> state = IndicatorState(bb_period=20)
+        >>> for price in prices:
+        ...     state.update(price)
+        >>> bands = state.bollinger_bands
+        >>> if bands:
+        ...     upper, middle, lower = bands
+    """
+
+    def __init__(self, bb_period: int = 20, bb_num_std: float = 2.0):
+        """Initialize empty indicator state.
+
+        Args:
+            bb_period: Bollinger Bands window length (default: 20)
+            bb_num_std: Number of standard deviations (default: 2.0)
+
+        Raises:
+            ValueError: If bb_period is not positive
+        """
+        if bb_period < 1:
+            raise ValueError(f"bb_period must be positive. Got {bb_period}.")
+
+        self.bb_period = bb_period
+        self.bb_num_std = bb_num_std
+
+        # Welford state over the sliding Bollinger window
+        self._bb_window: Deque[float] = deque()
+        self._bb_n = 0
+        self._bb_mean = 0.0
+        self._bb_m2 = 0.0
+
+    def update(self, price: float) -> None:
+        """Push a new closing price into the state.
+
+        Args:
+            price: Latest closing price
+        """
+        # Welford add: M2 += (x - mean_prev) * (x - mean_new)
+        self._bb_window.append(price)
+        self._bb_n += 1
+        delta = price - self._bb_mean
+        self._bb_mean += delta / self._bb_n
+        self._bb_m2 += delta * (price - self._bb_mean)
+
+        # Welford evict once the window overflows
+        if self._bb_n > self.bb_period:
+            old = self._bb_window.popleft()
+            delta = old - self._bb_mean
+            self._bb_n -= 1
+            self._bb_mean -= delta / self._bb_n
+            self._bb_m2 -= delta * (old - self._bb_mean)
+
+    @property
+    def bollinger_bands(self) -> Optional[Tuple[float, float, float]]:
+        """Current Bollinger Bands, or None until the window is full.
+
+        Returns:
+            Optional[Tuple[float, float, float]]: (upper_band, middle_band, lower_band)
+        """
+        if self._bb_n < self.bb_period:
+            return None
+
+        # Clamp tiny negative drift from floating-point round-off
+        std_dev = math.sqrt(max(self._bb_m2, 0.0) / self._bb_n)
+        middle_band = self._bb_mean
+        return (
+            middle_band + self.bb_num_std * std_dev,
+            middle_band,
+            middle_band - self.bb_num_std * std_dev,
+        )
 
 
 # ============================================================================
@@ -512,14 +1204,92 @@ def calculate_bollinger_bands(
 # ============================================================================
 
 
+def _calculate_indicators_individually(
+    prices: np.ndarray, highs: np.ndarray, lows: np.ndarray
+) -> Tuple[float, float, float, float, float, float, float, float, Optional[float], Optional[float]]:
+    """Calculate each indicator separately with individual error handling.
+
+    Used by calculate_all_indicators when TA-Lib is installed or the fused
+    kernel fails, so a single failing indicator degrades to a neutral
+    default instead of aborting the whole calculation.
+
+    Args:
+        prices: Float64 closing prices (most recent last)
+        highs: Float64 high prices
+        lows: Float64 low prices
+
+    Returns:
+        Tuple: (rsi_14, macd, macd_signal, macd_histogram, atr_14, sma_50,
+            ema_12, ema_26, bollinger_upper, bollinger_lower)
+    """
+    # Calculate each indicator with individual error handling
+    try:
+        rsi = calculate_rsi(prices, period=14)
+    except Exception as e:
+        logger.error(f"Failed to calculate RSI: {e}")
+        rsi = 50.0  # Neutral default
+
+    try:
+        macd, macd_signal, macd_histogram = calculate_macd(prices)
+    except Exception as e:
+        logger.error(f"Failed to calculate MACD: {e}")
+        macd = macd_signal = macd_histogram = 0.0
+
+    try:
+        atr = calculate_atr(highs, lows, prices, period=14)
+    except Exception as e:
+        logger.error(f"Failed to calculate ATR: {e}")
+        # Estimate ATR from price volatility
+        price_range = max(prices[-14:]) - min(prices[-14:])
+        atr = price_range / 2
+
+    try:
+        sma_50 = calculate_sma(prices, period=50)
+    except Exception as e:
+        logger.error(f"Failed to calculate SMA(50): {e}")
+        sma_50 = prices[-1]  # Use current price as fallback
+
+    try:
+        ema_12 = calculate_ema(prices, period=12)
+    except Exception as e:
+        logger.error(f"Failed to calculate EMA(12): {e}")
+        ema_12 = prices[-1]
+
+    try:
+        ema_26 = calculate_ema(prices, period=26)
+    except Exception as e:
+        logger.error(f"Failed to calculate EMA(26): {e}")
+        ema_26 = prices[-1]
+
+    # Bollinger Bands (optional - may fail)
+    try:
+        bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(prices, period=20)
+    except Exception as e:
+        logger.warning(f"Failed to calculate Bollinger Bands: {e}")
+        bb_upper = bb_lower = None
+
+    return (
+        rsi,
+        macd,
+        macd_signal,
+        macd_histogram,
+        atr,
+        sma_50,
+        ema_12,
+        ema_26,
+        bb_upper,
+        bb_lower,
+    )
+
+
 def calculate_all_indicators(
-    market_data_list: List[MarketData],
+    market_data_list: Union[List[MarketData], MarketDataBatch],
 ) -> Optional[TechnicalIndicators]:
     """Calculate all technical indicators from market data.
 
     This is the main entry point for feature engineering. Takes a list
-    of MarketData objects and calculates all technical indicators used
-    by the trading agents.
+    of MarketData objects (or a pre-built MarketDataBatch) and calculates
+    all technical indicators used by the trading agents.
 
     Calculated indicators:
     - RSI(14): Momentum oscillator
@@ -530,7 +1300,8 @@ def calculate_all_indicators(
     - Bollinger Bands: Volatility and price levels
 
     Args:
-        market_data_list: List of MarketData (minimum 50 for SMA-50)
+        market_data_list: List of MarketData or a MarketDataBatch
+            (minimum 50 data points for SMA-50)
 
     Returns:
         TechnicalIndicators: All calculated indicators, or None if insufficient data
@@ -559,64 +1330,41 @@ def calculate_all_indicators(
     logger.info(f"Calculating indicators from {len(market_data_list)} data points")
 
     try:
-        # Extract price arrays from MarketData
-        prices = [md.price for md in market_data_list]
-
-        # Extract high/low for ATR (filter out None values)
-        highs = [md.high_24h for md in market_data_list if md.high_24h is not None]
-        lows = [md.low_24h for md in market_data_list if md.low_24h is not None]
-
-        # Ensure we have enough high/low data for ATR
-        if len(highs) < 15 or len(lows) < 15:
-            logger.warning("Insufficient high/low data for ATR. Using price as approximation.")
-            highs = prices
-            lows = prices
-
-        # Calculate each indicator with individual error handling
-        try:
-            rsi = calculate_rsi(prices, period=14)
-        except Exception as e:
-            logger.error(f"Failed to calculate RSI: {e}")
-            rsi = 50.0  # Neutral default
-
-        try:
-            macd, macd_signal, macd_histogram = calculate_macd(prices)
-        except Exception as e:
-            logger.error(f"Failed to calculate MACD: {e}")
-            macd = macd_signal = macd_histogram = 0.0
-
-        try:
-            atr = calculate_atr(highs, lows, prices, period=14)
-        except Exception as e:
-            logger.error(f"Failed to calculate ATR: {e}")
-            # Estimate ATR from price volatility
-            price_range = max(prices[-14:]) - min(prices[-14:])
-            atr = price_range / 2
-
-        try:
-            sma_50 = calculate_sma(prices, period=50)
-        except Exception as e:
-            logger.error(f"Failed to calculate SMA(50): {e}")
-            sma_50 = prices[-1]  # Use current price as fallback
-
-        try:
-            ema_12 = calculate_ema(prices, period=12)
-        except Exception as e:
-            logger.error(f"Failed to calculate EMA(12): {e}")
-            ema_12 = prices[-1]
-
-        try:
-            ema_26 = calculate_ema(prices, period=26)
-        except Exception as e:
-            logger.error(f"Failed to calculate EMA(26): {e}")
-            ema_26 = prices[-1]
-
-        # Bollinger Bands (optional - may fail)
-        try:
-            bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(prices, period=20)
-        except Exception as e:
-            logger.warning(f"Failed to calculate Bollinger Bands: {e}")
-            bb_upper = bb_lower = None
+        # Extract column arrays once (list input is routed through the batch)
+        if isinstance(market_data_list, MarketDataBatch):
+            batch = market_data_list
+        else:
+            batch = MarketDataBatch.from_list(market_data_list)
+
+        prices = _as_f64(batch.prices)
+        highs = _as_f64(batch.highs)
+        lows = _as_f64(batch.lows)
+
+        # With TA-Lib installed each indicator goes through it; otherwise the
+        # fused single-sweep kernel, with the per-indicator path if it fails
+        results = None
+        if not TALIB_AVAILABLE:
+            try:
+                results = tuple(float(v) for v in _all_indicators(prices, highs, lows))
+            except Exception as e:
+                logger.warning(
+                    f"Fused indicator kernel failed: {e}. Using per-indicator fallback."
+                )
+        if results is None:
+            results = _calculate_indicators_individually(prices, highs, lows)
+
+        (
+            rsi,
+            macd,
+            macd_signal,
+            macd_histogram,
+            atr,
+            sma_50,
+            ema_12,
+            ema_26,
+            bb_upper,
+            bb_lower,
+        ) = results
 
         # Create TechnicalIndicators Pydantic model
         indicators = TechnicalIndicators(
@@ -658,24 +1406,30 @@ def validate_price_data(prices: List[float]) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    if not prices:
-        logger.error("Price list is empty")
+    try:
+        prices_array = np.asarray(prices, dtype=np.float64)
+    except (TypeError, ValueError):
+        logger.error("Price list contains non-numeric values")
         return False
 
-    if len(prices) < 2:
-        logger.error(f"Need at least 2 prices, got {len(prices)}")
+    if prices_array.size == 0:
+        logger.error("Price list is empty")
         return False
 
-    # Check for negative prices
-    if any(p <= 0 for p in prices):
-        logger.error("Price list contains non-positive values")
+    if prices_array.size < 2:
+        logger.error(f"Need at least 2 prices, got {prices_array.size}")
         return False
 
     # Check for NaN or inf
-    if any(not isinstance(p, (int, float)) or p != p or p == float("inf") for p in prices):
+    if not np.isfinite(prices_array).all():
         logger.error("Price list contains invalid values (NaN or inf)")
         return False
 
+    # Check for negative prices
+    if (prices_array <= 0).any():
+        logger.error("Price list contains non-positive values")
+        return False
+
     return True
 
 
@@ -8,14 +8,33 @@ Example:
     >>> client = OpenRouterClient()
     >>> response = client.generate_text("Analyze BTC: price dropped 3%")
     >>> print(response)
+    >>>
+    >>> # Preferred: shared process-wide client (one connection pool per model)
+    >>> from tools.openrouter_client import get_openrouter_client
+    >>> client = get_openrouter_client()
+    >>>
+    >>> # Async variant (requires httpx)
+    >>> response = await client.agenerate_text("Analyze BTC: price dropped 3%")
 """
 
+import asyncio
+import atexit
+import concurrent.futures
+import functools
+import gzip
+import hashlib
 import json
 import logging
+import re
+import threading
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 from config import get_settings
 from tools.rate_limiter import openrouter_rate_limit
@@ -24,6 +43,147 @@ from tools.rate_limiter import openrouter_rate_limit
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# JSON extraction from model output: fenced block first, then the outermost
+# object/array span anywhere in the text (tolerates surrounding prose)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*\}|\[.*\])\s*```", re.DOTALL)
+_JSON_RE = re.compile(r"(\{.*\}|\[.*\])", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+# Default system message for generate_json; shared, never mutated
+_DEFAULT_JSON_SYSTEM_PROMPT = "You are a helpful assistant that responds in valid JSON format."
+_DEFAULT_JSON_SYSTEM_MSG = {"role": "system", "content": _DEFAULT_JSON_SYSTEM_PROMPT}
+
+# Request bodies above this size are gzip-compressed (smaller ones aren't worth the CPU)
+_GZIP_MIN_BYTES = 1024
+_GZIP_HEADERS = {"Content-Encoding": "gzip"}
+
+# Cap on distinct cached system messages (guards against per-call formatted prompts)
+_SYSTEM_MSG_CACHE_MAX = 64
+
+# Retry policy shared by the sync adapter and the async loop. Only failures
+# where the request was never processed (connect errors) or the server asked
+# for a retry (429, gateway/unavailable 502/503/504) are retried: a POST
+# whose response timed out, or that failed with a 500, may already have
+# been billed
+_RETRY_STATUSES = frozenset([429, 502, 503, 504])
+_RETRY_BACKOFF_FACTOR = 1.0
+_RETRY_BACKOFF_MAX = 30.0
+
+# Longest Retry-After delay honored; larger server values are clamped
+_RETRY_AFTER_MAX = 30.0
+
+# Try to import orjson (optional dependency, faster JSON encode/decode)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import httpx (optional dependency, required for the async API)
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _sse_content(line: Union[bytes, str]) -> Optional[str]:
+    """Extract the content delta from one server-sent event line.
+
+    Args:
+        line: Raw SSE line (bytes from requests, str from httpx)
+
+    Returns:
+        Optional[str]: Content delta ("" for keep-alives, comments and empty
+            deltas), or None once the ``[DONE]`` sentinel is reached
+
+    Raises:
+        OpenRouterClientError: If the event data is not a valid chunk
+    """
+    if isinstance(line, str):
+        line = line.encode()
+
+    if not line.startswith(b"data:"):
+        return ""
+
+    data = line[5:].strip()
+    if data == b"[DONE]":
+        return None
+
+    try:
+        choices = _json_loads(data).get("choices")
+        if not choices:
+            return ""
+
+        return choices[0].get("delta", {}).get("content") or ""
+    except (ValueError, AttributeError) as e:
+        raise OpenRouterClientError(f"Malformed stream chunk: {data[:256]!r}") from e
+
+
+def _error_message(content: bytes) -> str:
+    """Extract the error message from an API error response body.
+
+    Only the first 4 KB are decoded; bodies that are larger or not JSON
+    fall back to a short raw-text snippet.
+
+    Args:
+        content: Raw response body
+
+    Returns:
+        str: Error message
+    """
+    try:
+        error = _json_loads(content[:4096]).get("error", {})
+        return error.get("message", "Unknown error")
+    except (ValueError, AttributeError):
+        return content[:256].decode("utf-8", errors="replace") or "Unknown error"
+
+
+def _backoff_time(retries: int) -> float:
+    """Backoff before the next attempt, on urllib3's Retry schedule.
+
+    Args:
+        retries: Failed attempts so far
+
+    Returns:
+        float: Seconds to sleep (0 before the first retry)
+    """
+    if retries <= 1:
+        return 0.0
+    return min(_RETRY_BACKOFF_MAX, _RETRY_BACKOFF_FACTOR * 2 ** (retries - 1))
+
+
+class _CappedRetry(Retry):
+    """urllib3 Retry that clamps server Retry-After delays to _RETRY_AFTER_MAX."""
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        """Parse the Retry-After header, clamped to _RETRY_AFTER_MAX."""
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _RETRY_AFTER_MAX)
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON from bytes or str (orjson when available).
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's
+            JSONDecodeError subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class OpenRouterClientError(Exception):
     """Base exception for OpenRouter client errors."""
@@ -34,15 +194,17 @@ class OpenRouterClientError(Exception):
 class OpenRouterAPIError(OpenRouterClientError):
     """Raised when OpenRouter API returns an error response."""
 
-    def __init__(self, status_code: int, message: str):
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
         """Initialize OpenRouter API error.
 
         Args:
             status_code: HTTP status code
             message: Error message from API
+            retry_after: Seconds from the Retry-After header (clamped), if any
         """
         self.status_code = status_code
         self.message = message
+        self.retry_after = retry_after
         super().__init__(f"OpenRouter API Error {status_code}: {message}")
 
 
@@ -63,128 +225,788 @@ class OpenRouterClient:
     """
 
     API_URL = "https://openrouter.ai/api/v1/chat/completions"
+    MODELS_URL = "https://openrouter.ai/api/v1/models"  # Cheap GET used for prewarming
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: str = "mistralai/mistral-7b-instruct:free",
+        cache_ttl: float = 300.0,
+        cache_maxsize: int = 256,
+        max_retries: int = 2,
+        prewarm: bool = False,
+        compress_requests: bool = False,
     ):
         """Initialize OpenRouter client.
 
         Args:
             api_key: OpenRouter API key (defaults to config)
             model: Model name (default: mistralai/mistral-7b-instruct:free)
+            cache_ttl: Seconds a cached response stays valid (use_cache=True calls)
+            cache_maxsize: Maximum number of cached responses (LRU eviction)
+            max_retries: Retries for connection errors and 429/502/503/504 responses
+                (read timeouts are not retried: the POST may have been processed)
+            prewarm: Open the keep-alive connection in the background (a real
+                GET to MODELS_URL) so the first request skips the TCP+TLS
+                handshake; opt-in so tests and offline runs stay off the network
+            compress_requests: Gzip request bodies over 1 KB (opt-in: OpenRouter
+                does not document accepting gzip-encoded request bodies, so
+                only enable this against an endpoint known to decode them;
+                responses are compressed either way via Accept-Encoding)
         """
         settings = get_settings()
 
-        self.api_key = api_key or settings.OPENROUTER_API_KEY
-        self.model = model
+        self.api_key = api_key or settings.OPENROUTER_API_KEY
+        self.model = model
+
+        if not self.api_key:
+            raise OpenRouterClientError(
+                "OpenRouter API key not configured. Set OPENROUTER_API_KEY in .env"
+            )
+
+        self._static_headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            # Only the codings urllib3 can decode here (br needs brotli installed)
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "HTTP-Referer": "https://github.com/bitcoin-trading-system",  # Optional
+            "X-Title": "Bitcoin Trading System",  # Optional
+        }
+
+        self.compress_requests = compress_requests
+
+        # Retries run inside urllib3 with exponential backoff, honoring the
+        # (clamped) Retry-After header OpenRouter sends with 429 responses.
+        # Read errors re-raise at once: the POST may already have been billed
+        self.max_retries = max_retries
+        self._retry = _CappedRetry(
+            total=max_retries,
+            connect=max_retries,
+            read=False,
+            status=max_retries,
+            other=0,
+            backoff_factor=_RETRY_BACKOFF_FACTOR,
+            backoff_max=_RETRY_BACKOFF_MAX,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+        # Pooled keep-alive session: later calls skip the TCP+TLS handshake
+        self._session = requests.Session()
+        self._session.headers.update(self._static_headers)
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=self._retry)
+        )
+
+        # System prompt -> prebuilt system message dict (reused across calls)
+        self._system_msg_cache: Dict[str, Dict[str, str]] = {
+            _DEFAULT_JSON_SYSTEM_PROMPT: _DEFAULT_JSON_SYSTEM_MSG
+        }
+
+        # Zero-retry session for retry=False calls (created lazily)
+        self._fast_session: Optional[requests.Session] = None
+
+        # Async HTTP clients, one per event loop (created lazily on first async
+        # call): pooled connections are bound to the loop that opened them
+        self._aclients: Dict[asyncio.AbstractEventLoop, "httpx.AsyncClient"] = {}
+
+        # Opt-in response cache: key -> (timestamp, text), in LRU order
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self._cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Single-flight maps for use_cache calls: cache key -> pending result
+        self._inflight: Dict[bytes, concurrent.futures.Future] = {}
+        self._ainflight: Dict[bytes, asyncio.Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Best-effort connection prewarming (sync now, async on first use)
+        self.prewarm = prewarm
+        self._prewarm_task: Optional["asyncio.Future"] = None
+        if prewarm:
+            threading.Thread(target=self._prewarm, daemon=True).start()
+
+        logger.info(f"Initialized OpenRouterClient (model={self.model})")
+
+    def _prewarm(self) -> None:
+        """Open a pooled connection with a cheap GET (errors are ignored)."""
+        try:
+            self._session.get(self.MODELS_URL, timeout=5).close()
+        except Exception as e:
+            logger.debug("OpenRouter prewarm failed: %s", e)
+
+    async def _aprewarm(self, client: "httpx.AsyncClient") -> None:
+        """Async version of _prewarm for an async client."""
+        try:
+            await client.get(self.MODELS_URL, timeout=5.0)
+        except Exception as e:
+            logger.debug("OpenRouter async prewarm failed: %s", e)
+
+    def _build_payload(
+        self, messages: list, max_tokens: int, temperature: float
+    ) -> Dict[str, Any]:
+        """Build the chat completions request payload.
+
+        Args:
+            messages: List of message dictionaries (OpenAI chat format)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+
+        Returns:
+            Dict: Request payload
+        """
+        return {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+    @staticmethod
+    def _extract_text(data: Dict[str, Any]) -> str:
+        """Extract generated text from a chat completions response.
+
+        Args:
+            data: Parsed response body
+
+        Returns:
+            str: Generated text
+
+        Raises:
+            OpenRouterClientError: If the response has no choices
+        """
+        if "choices" in data and len(data["choices"]) > 0:
+            message = data["choices"][0].get("message", {})
+            generated_text = message.get("content", "")
+
+            logger.info("[OK] Generated %d characters", len(generated_text))
+            return generated_text
+
+        raise OpenRouterClientError(f"Unexpected response format: {data}")
+
+    def _encode_body(self, payload: Dict[str, Any]) -> Tuple[bytes, Optional[Dict[str, str]]]:
+        """Serialize a payload, gzip-compressing it when large enough.
+
+        Args:
+            payload: Request payload
+
+        Returns:
+            tuple: (body, extra headers or None)
+        """
+        body = _json_dumps(payload)
+
+        if self.compress_requests and len(body) > _GZIP_MIN_BYTES:
+            return gzip.compress(body, compresslevel=1), _GZIP_HEADERS
+
+        return body, None
+
+    def _cache_key(self, messages: list, max_tokens: int, temperature: float) -> bytes:
+        """Build the response cache key for a request.
+
+        Args:
+            messages: List of message dictionaries (OpenAI chat format)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+
+        Returns:
+            bytes: 16-byte BLAKE2b digest of (model, messages, params)
+        """
+        raw = _json_dumps([self.model, messages, max_tokens, temperature])
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[str]:
+        """Return a cached response if present and not expired.
+
+        Args:
+            key: Cache key from _cache_key
+
+        Returns:
+            Optional[str]: Cached text, or None on miss/expiry
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+
+            cached_at, text = entry
+            if time.monotonic() - cached_at >= self.cache_ttl:
+                del self._cache[key]
+                return None
+
+            self._cache.move_to_end(key)
+            return text
+
+    def _cache_put(self, key: bytes, text: str) -> None:
+        """Store a response, evicting the least recently used when full.
+
+        Args:
+            key: Cache key from _cache_key
+            text: Generated text
+        """
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), text)
+            self._cache.move_to_end(key)
+
+            while len(self._cache) > self.cache_maxsize:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _make_request_shared(
+        self,
+        cache_key: bytes,
+        messages: list,
+        max_tokens: int,
+        temperature: float,
+        retry: bool,
+    ) -> str:
+        """Make a request, collapsing concurrent identical requests into one.
+
+        The first caller for a key sends the request and caches the
+        response; callers arriving while it is in flight wait for its result
+        (or exception) instead of sending their own.
+
+        Args:
+            cache_key: Cache key from _cache_key
+            messages: List of message dictionaries (OpenAI chat format)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            retry: Retry failures
+
+        Returns:
+            str: Generated text
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            leader = future is None
+            if leader:
+                future = concurrent.futures.Future()
+                self._inflight[cache_key] = future
+
+        if not leader:
+            logger.debug("Joining in-flight OpenRouter request")
+            return future.result()
+
+        try:
+            response = self._make_request(messages, max_tokens, temperature, retry=retry)
+            self._cache_put(cache_key, response)
+            future.set_result(response)
+            return response
+
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+
+    async def _amake_request_shared(
+        self,
+        cache_key: bytes,
+        messages: list,
+        max_tokens: int,
+        temperature: float,
+        retry: bool,
+    ) -> str:
+        """Async version of _make_request_shared (per event loop).
+
+        Args:
+            cache_key: Cache key from _cache_key
+            messages: List of message dictionaries (OpenAI chat format)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            retry: Retry failures
+
+        Returns:
+            str: Generated text
+        """
+        loop = asyncio.get_running_loop()
+        future = self._ainflight.get(cache_key)
+
+        if future is not None and future.get_loop() is loop:
+            logger.debug("Joining in-flight OpenRouter request")
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        self._ainflight[cache_key] = future
+
+        try:
+            response = await self._amake_request(
+                messages, max_tokens, temperature, max_retries=self.max_retries if retry else 0
+            )
+            self._cache_put(cache_key, response)
+            future.set_result(response)
+            return response
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved: there may be no follower to consume it
+            future.exception()
+            raise
+
+        finally:
+            if self._ainflight.get(cache_key) is future:
+                del self._ainflight[cache_key]
+
+    def _get_fast_session(self) -> requests.Session:
+        """Get the zero-retry session, creating it on first use.
+
+        Returns:
+            requests.Session: Pooled session whose adapter never retries
+        """
+        if self._fast_session is None:
+            self._fast_session = requests.Session()
+            self._fast_session.headers.update(self._static_headers)
+            self._fast_session.mount(
+                "https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+            )
+
+        return self._fast_session
+
+    def _do_request_once(
+        self,
+        session: requests.Session,
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """POST a serialized payload once and decode the generated text.
+
+        Args:
+            session: Session to send with (its adapter decides retries)
+            body: Serialized request payload
+            headers: Extra request headers (e.g. Content-Encoding)
+
+        Returns:
+            str: Generated text
+
+        Raises:
+            OpenRouterAPIError: If API returns error response
+            requests.exceptions.RequestException: If the request fails
+        """
+        response = session.post(self.API_URL, data=body, headers=headers, timeout=30)
+
+        if response.status_code != 200:
+            raise OpenRouterAPIError(
+                status_code=response.status_code,
+                message=_error_message(response.content),
+            )
+
+        data = _json_loads(response.content)
+        return self._extract_text(data)
+
+    @openrouter_rate_limit
+    def _make_request(
+        self,
+        messages: list,
+        max_tokens: int = 500,
+        temperature: float = 0.1,
+        retry: bool = True,
+    ) -> str:
+        """Make HTTP request to OpenRouter API.
+
+        Retries and backoff are handled by the session's Retry adapter.
+
+        Args:
+            messages: List of message dictionaries (OpenAI chat format)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            retry: Retry failures; False sends exactly one request
+
+        Returns:
+            str: Generated text
+
+        Raises:
+            OpenRouterAPIError: If API returns error response
+            OpenRouterClientError: If request fails after retries
+        """
+        payload = self._build_payload(messages, max_tokens, temperature)
+
+        # Serialize once; requests would otherwise re-encode with stdlib json
+        body, headers = self._encode_body(payload)
+        session = self._session if retry else self._get_fast_session()
+
+        logger.debug("OpenRouter API: %s", self.model)
+
+        try:
+            return self._do_request_once(session, body, headers)
+
+        except requests.exceptions.Timeout:
+            logger.warning("OpenRouter API timeout")
+            raise OpenRouterClientError("Request timed out")
+
+        except requests.exceptions.RequestException as e:
+            logger.error("OpenRouter API request failed: %s", e)
+            raise OpenRouterClientError(f"Request failed: {e}")
+
+    def _stream_request(
+        self,
+        messages: list,
+        max_tokens: int = 500,
+        temperature: float = 0.1,
+    ) -> Iterator[str]:
+        """Stream a chat completion, yielding content deltas as they arrive.
+
+        Streams are not retried: a retry after partial output would replay
+        text the caller has already consumed.
+
+        Args:
+            messages: List of message dictionaries (OpenAI chat format)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+
+        Yields:
+            str: Content deltas
+
+        Raises:
+            OpenRouterAPIError: If API returns error response
+            OpenRouterClientError: If the request fails
+        """
+        payload = self._build_payload(messages, max_tokens, temperature)
+        payload["stream"] = True
+        body, headers = self._encode_body(payload)
+
+        try:
+            with self._session.post(
+                self.API_URL, data=body, headers=headers, timeout=30, stream=True
+            ) as response:
+                if response.status_code != 200:
+                    error_msg = _error_message(response.content)
+                    raise OpenRouterAPIError(
+                        status_code=response.status_code,
+                        message=error_msg,
+                    )
+
+                for line in response.iter_lines(decode_unicode=False):
+                    content = _sse_content(line)
+                    if content is None:
+                        break
+                    if content:
+                        yield content
+
+        except requests.exceptions.Timeout:
+            raise OpenRouterClientError("Streaming request timed out")
+
+        except requests.exceptions.RequestException as e:
+            logger.error("OpenRouter API stream failed: %s", e)
+            raise OpenRouterClientError(f"Request failed: {e}")
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Get the running event loop's async HTTP client, creating it on first use.
+
+        Each loop gets its own client, so a shared instance used from a
+        second asyncio.run() never reuses connections from a closed loop.
+
+        Returns:
+            httpx.AsyncClient: Pooled async client with the static headers
+
+        Raises:
+            OpenRouterClientError: If httpx is not installed
+        """
+        if not HTTPX_AVAILABLE:
+            raise OpenRouterClientError(
+                "Async OpenRouter API requires httpx. Install with: pip install httpx"
+            )
+
+        loop = asyncio.get_running_loop()
+        client = self._aclients.get(loop)
+
+        if client is None:
+            # Drop clients of loops that have since closed (their connections
+            # can't be used or closed from here)
+            for closed_loop in [lp for lp in self._aclients if lp.is_closed()]:
+                del self._aclients[closed_loop]
+
+            limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            try:
+                client = httpx.AsyncClient(
+                    http2=True, limits=limits, timeout=30.0, headers=self._static_headers
+                )
+            except ImportError:
+                # HTTP/2 needs the optional h2 package; fall back to HTTP/1.1
+                client = httpx.AsyncClient(
+                    limits=limits, timeout=30.0, headers=self._static_headers
+                )
+            self._aclients[loop] = client
+
+            if self.prewarm:
+                self._prewarm_task = loop.create_task(self._aprewarm(client))
+
+        return client
+
+    async def _ado_request_once(
+        self,
+        client: "httpx.AsyncClient",
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Async version of _do_request_once.
+
+        Args:
+            client: Async HTTP client
+            body: Serialized request payload
+            headers: Extra request headers (e.g. Content-Encoding)
+
+        Returns:
+            str: Generated text
+
+        Raises:
+            OpenRouterAPIError: If API returns error response
+            httpx.HTTPError: If the request fails
+        """
+        response = await client.post(self.API_URL, content=body, headers=headers)
+
+        if response.status_code != 200:
+            retry_after = None
+            if response.status_code in _RETRY_STATUSES:
+                retry_after = self._retry.get_retry_after(response)
+            raise OpenRouterAPIError(
+                status_code=response.status_code,
+                message=_error_message(response.content),
+                retry_after=retry_after,
+            )
+
+        data = _json_loads(response.content)
+        return self._extract_text(data)
+
+    @openrouter_rate_limit
+    async def _amake_request(
+        self,
+        messages: list,
+        max_tokens: int = 500,
+        temperature: float = 0.1,
+        max_retries: int = 2,
+    ) -> str:
+        """Async version of _make_request (same retry and error semantics).
+
+        Args:
+            messages: List of message dictionaries (OpenAI chat format)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            max_retries: Retries after the first attempt (0 = single attempt)
+
+        Returns:
+            str: Generated text
+
+        Raises:
+            OpenRouterAPIError: If API returns error response
+            OpenRouterClientError: If request fails after retries
+        """
+        client = self._get_async_client()
+        body, headers = self._encode_body(self._build_payload(messages, max_tokens, temperature))
+
+        # Fast path: single attempt, no retry bookkeeping
+        if max_retries <= 0:
+            try:
+                return await self._ado_request_once(client, body, headers)
+
+            except httpx.TimeoutException:
+                raise OpenRouterClientError("Request timed out")
+
+            except httpx.HTTPError as e:
+                raise OpenRouterClientError(f"Request failed: {e}")
+
+        # Same policy as the sync Retry adapter: connect errors and 429/502/503/504
+        # only, backing off on urllib3's schedule or the clamped Retry-After
+        for attempt in range(max_retries + 1):
+            last_attempt = attempt == max_retries
+
+            try:
+                logger.debug(
+                    "OpenRouter API (async): %s (attempt %d/%d)",
+                    self.model,
+                    attempt + 1,
+                    max_retries + 1,
+                )
+
+                return await self._ado_request_once(client, body, headers)
+
+            except OpenRouterAPIError as e:
+                if e.status_code not in _RETRY_STATUSES or last_attempt:
+                    raise
+                delay = e.retry_after
+                if delay is None:
+                    delay = _backoff_time(attempt + 1)
+                logger.warning(
+                    "OpenRouter API error %d, retrying in %.1fs", e.status_code, delay
+                )
+
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                logger.warning("OpenRouter API connect failed (attempt %d): %s", attempt + 1, e)
+                if last_attempt:
+                    raise OpenRouterClientError(f"Request failed: {e}")
+                delay = _backoff_time(attempt + 1)
+
+            except httpx.TimeoutException:
+                # The request may have reached the server: never resend it
+                logger.warning("OpenRouter API timeout")
+                raise OpenRouterClientError("Request timed out")
+
+            except httpx.HTTPError as e:
+                logger.error("OpenRouter API request failed: %s", e)
+                raise OpenRouterClientError(f"Request failed: {e}")
 
-        if not self.api_key:
-            raise OpenRouterClientError(
-                "OpenRouter API key not configured. Set OPENROUTER_API_KEY in .env"
-            )
+            await asyncio.sleep(delay)
 
-        logger.info(f"Initialized OpenRouterClient (model={self.model})")
+        raise OpenRouterClientError("Unexpected error in request logic")
 
-    def _make_request(
+    async def _astream_request(
         self,
         messages: list,
         max_tokens: int = 500,
         temperature: float = 0.1,
-        max_retries: int = 2,
-    ) -> str:
-        """Make HTTP request to OpenRouter API.
+    ) -> AsyncIterator[str]:
+        """Async version of _stream_request.
 
         Args:
             messages: List of message dictionaries (OpenAI chat format)
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
-            max_retries: Maximum number of retry attempts
 
-        Returns:
-            str: Generated text
+        Yields:
+            str: Content deltas
 
         Raises:
             OpenRouterAPIError: If API returns error response
-            OpenRouterClientError: If request fails after retries
+            OpenRouterClientError: If the request fails
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/bitcoin-trading-system",  # Optional
-            "X-Title": "Bitcoin Trading System",  # Optional
-        }
-
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-
-        # Retry logic with exponential backoff
-        for attempt in range(max_retries):
-            try:
-                logger.debug(
-                    f"OpenRouter API: {self.model} (attempt {attempt + 1}/{max_retries})"
-                )
-
-                response = requests.post(
-                    self.API_URL, json=payload, headers=headers, timeout=30
-                )
-
-                if response.status_code == 429:
-                    # Rate limit exceeded
-                    logger.warning("OpenRouter rate limit exceeded, waiting...")
-                    time.sleep(10 * (attempt + 1))
-                    continue
+        client = self._get_async_client()
+        payload = self._build_payload(messages, max_tokens, temperature)
+        payload["stream"] = True
+        body, headers = self._encode_body(payload)
 
+        try:
+            async with client.stream(
+                "POST", self.API_URL, content=body, headers=headers
+            ) as response:
                 if response.status_code != 200:
-                    error_data = response.json()
-                    error_msg = error_data.get("error", {}).get("message", "Unknown error")
+                    error_msg = _error_message(await response.aread())
                     raise OpenRouterAPIError(
                         status_code=response.status_code,
                         message=error_msg,
                     )
 
-                data = response.json()
+                async for line in response.aiter_lines():
+                    content = _sse_content(line)
+                    if content is None:
+                        break
+                    if content:
+                        yield content
 
-                # Extract generated text
-                if "choices" in data and len(data["choices"]) > 0:
-                    message = data["choices"][0].get("message", {})
-                    generated_text = message.get("content", "")
+        except httpx.TimeoutException:
+            raise OpenRouterClientError("Streaming request timed out")
 
-                    logger.info(f"[OK] Generated {len(generated_text)} characters")
-                    return generated_text
-                else:
-                    raise OpenRouterClientError(f"Unexpected response format: {data}")
+        except httpx.HTTPError as e:
+            logger.error("OpenRouter API stream failed: %s", e)
+            raise OpenRouterClientError(f"Request failed: {e}")
 
-            except requests.exceptions.Timeout:
-                logger.warning(f"OpenRouter API timeout (attempt {attempt + 1})")
-                if attempt == max_retries - 1:
-                    raise OpenRouterClientError("Request timed out after retries")
-                time.sleep(2**attempt)
+    def _build_messages(self, prompt: str, system_prompt: Optional[str]) -> list:
+        """Build messages in OpenAI chat format.
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"OpenRouter API request failed: {e}")
-                if attempt == max_retries - 1:
-                    raise OpenRouterClientError(f"Request failed: {e}")
-                time.sleep(2**attempt)
+        System message dicts are cached per system prompt, so only the user
+        message is allocated per call. Cached dicts must not be mutated.
 
-            except OpenRouterAPIError:
-                # Don't retry API errors
-                raise
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
 
-        raise OpenRouterClientError("Unexpected error in request logic")
+        Returns:
+            list: Message dictionaries
+        """
+        user_msg = {"role": "user", "content": prompt}
+
+        if not system_prompt:
+            return [user_msg]
+
+        system_msg = self._system_msg_cache.get(system_prompt)
+        if system_msg is None:
+            system_msg = {"role": "system", "content": system_prompt}
+            if len(self._system_msg_cache) < _SYSTEM_MSG_CACHE_MAX:
+                self._system_msg_cache[system_prompt] = system_msg
+
+        return [system_msg, user_msg]
+
+    @staticmethod
+    def _prepare_json_prompt(prompt: str, system_prompt: Optional[str]) -> tuple:
+        """Add JSON instructions to the prompt and default system prompt.
+
+        Args:
+            prompt: Input prompt
+            system_prompt: Optional system prompt
+
+        Returns:
+            tuple: (prompt, system_prompt) ready for a JSON request
+        """
+        # Add JSON instruction to prompt if not present
+        if "json" not in prompt.lower():
+            prompt = f"{prompt}\n\nRespond with valid JSON only."
+
+        # Add system prompt for JSON
+        if not system_prompt:
+            system_prompt = _DEFAULT_JSON_SYSTEM_PROMPT
+
+        return prompt, system_prompt
+
+    @staticmethod
+    def _parse_json_response(response_text: str) -> Dict[str, Any]:
+        """Parse JSON from generated text (handles code fences and prose).
+
+        Args:
+            response_text: Generated text
+
+        Returns:
+            Dict: Parsed JSON, or an error dict if parsing fails
+        """
+        # Prefer a fenced block, then the outermost {...}/[...] span, then raw text
+        match = _FENCE_RE.search(response_text) or _JSON_RE.search(response_text)
+        json_str = match.group(1) if match else response_text
+
+        try:
+            try:
+                parsed_json = _json_loads(json_str)
+
+            except json.JSONDecodeError:
+                if not match:
+                    raise
+                # Greedy span covered several values ("{...} and {...}");
+                # decode just the first balanced one
+                parsed_json, _ = _JSON_DECODER.raw_decode(json_str)
+
+            logger.info("[OK] Successfully parsed JSON response")
+            return parsed_json
+
+        except json.JSONDecodeError as e:
+            logger.error("Failed to parse JSON: %s", e)
+
+            # Slice once for both the log and the result
+            snippet = response_text[:500]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response text: %s", snippet)
+
+            # Return error dict instead of raising
+            return {
+                "error": "Failed to parse JSON",
+                "raw_response": snippet,
+            }
 
-    @openrouter_rate_limit
     def generate_text(
         self,
         prompt: str,
         max_tokens: int = 500,
         temperature: float = 0.1,
         system_prompt: Optional[str] = None,
+        use_cache: bool = False,
+        retry: bool = True,
     ) -> str:
         """Generate text using OpenRouter API.
 
@@ -193,6 +1015,11 @@ class OpenRouterClient:
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0-1.0)
             system_prompt: Optional system prompt
+            use_cache: Reuse an identical request's response from the last
+                cache_ttl seconds (skips the API call and its rate limit slot);
+                concurrent identical requests share one API call
+            retry: Retry failures; False sends a single best-effort request
+                for latency-critical callers
 
         Returns:
             str: Generated text
@@ -205,33 +1032,42 @@ class OpenRouterClient:
             >>> text = client.generate_text("Explain swing trading")
             >>> print(text)
         """
-        logger.info(f"Generating text (prompt_length={len(prompt)})")
+        logger.info("Generating text (prompt_length=%d)", len(prompt))
 
         # Build messages in OpenAI chat format
-        messages = []
-
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+        messages = self._build_messages(prompt, system_prompt)
 
-        messages.append({"role": "user", "content": prompt})
+        if use_cache:
+            cache_key = self._cache_key(messages, max_tokens, temperature)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info("[OK] Text generation served from cache")
+                return cached
 
         # Generate
         try:
-            response = self._make_request(messages, max_tokens, temperature)
+            if use_cache:
+                response = self._make_request_shared(
+                    cache_key, messages, max_tokens, temperature, retry
+                )
+            else:
+                response = self._make_request(messages, max_tokens, temperature, retry=retry)
+
             logger.info("[OK] Text generation successful")
             return response
 
         except Exception as e:
-            logger.error(f"Text generation failed: {e}")
+            logger.error("Text generation failed: %s", e)
             raise
 
-    @openrouter_rate_limit
     def generate_json(
         self,
         prompt: str,
         max_tokens: int = 500,
         temperature: float = 0.1,
         system_prompt: Optional[str] = None,
+        use_cache: bool = False,
+        retry: bool = True,
     ) -> Dict[str, Any]:
         """Generate JSON-structured output with error handling.
 
@@ -240,6 +1076,8 @@ class OpenRouterClient:
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature (0.0-1.0)
             system_prompt: Optional system prompt
+            use_cache: Reuse a cached response (see generate_text)
+            retry: Retry failures (see generate_text)
 
         Returns:
             Dict: Parsed JSON response
@@ -253,49 +1091,263 @@ class OpenRouterClient:
             >>> result = client.generate_json(prompt)
             >>> print(result["signal"])
         """
-        logger.info(f"Generating JSON (prompt_length={len(prompt)})")
-
-        # Add JSON instruction to prompt if not present
-        if "json" not in prompt.lower():
-            prompt = f"{prompt}\n\nRespond with valid JSON only."
+        logger.info("Generating JSON (prompt_length=%d)", len(prompt))
 
-        # Add system prompt for JSON
-        if not system_prompt:
-            system_prompt = "You are a helpful assistant that responds in valid JSON format."
+        prompt, system_prompt = self._prepare_json_prompt(prompt, system_prompt)
 
         # Generate text
-        response_text = self.generate_text(prompt, max_tokens, temperature, system_prompt)
+        response_text = self.generate_text(
+            prompt, max_tokens, temperature, system_prompt, use_cache=use_cache, retry=retry
+        )
 
         # Parse JSON from response
+        return self._parse_json_response(response_text)
+
+    async def agenerate_text(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+        use_cache: bool = False,
+        retry: bool = True,
+    ) -> str:
+        """Async version of generate_text (requires httpx).
+
+        Many prompts can be issued concurrently with asyncio.gather, sharing
+        one pooled HTTP/2 connection.
+
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0-1.0)
+            system_prompt: Optional system prompt
+            use_cache: Reuse a cached response (see generate_text)
+            retry: Retry failures (see generate_text)
+
+        Returns:
+            str: Generated text
+
+        Raises:
+            OpenRouterClientError: If request fails
+
+        Example:
+            >>> client = OpenRouterClient()
+            >>> texts = await asyncio.gather(
+            ...     client.agenerate_text("Analyze BTC trend"),
+            ...     client.agenerate_text("Analyze ETH trend"),
+            ... )
+        """
+        logger.info("Generating text async (prompt_length=%d)", len(prompt))
+
+        messages = self._build_messages(prompt, system_prompt)
+
+        if use_cache:
+            cache_key = self._cache_key(messages, max_tokens, temperature)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info("[OK] Text generation served from cache")
+                return cached
+
         try:
-            # Try to extract JSON from response (handle markdown code blocks)
-            json_str = response_text.strip()
-
-            # Remove markdown code block markers if present
-            if json_str.startswith("```"):
-                lines = json_str.split("\n")
-                # Remove first line (```json or ```)
-                lines = lines[1:]
-                # Remove last line (```)
-                if lines and lines[-1].strip() == "```":
-                    lines = lines[:-1]
-                json_str = "\n".join(lines)
-
-            # Parse JSON
-            parsed_json = json.loads(json_str)
+            if use_cache:
+                response = await self._amake_request_shared(
+                    cache_key, messages, max_tokens, temperature, retry
+                )
+            else:
+                response = await self._amake_request(
+                    messages, max_tokens, temperature, max_retries=self.max_retries if retry else 0
+                )
 
-            logger.info("[OK] Successfully parsed JSON response")
-            return parsed_json
+            logger.info("[OK] Text generation successful")
+            return response
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON: {e}")
-            logger.debug(f"Response text: {response_text[:500]}")
+        except Exception as e:
+            logger.error("Text generation failed: %s", e)
+            raise
 
-            # Return error dict instead of raising
-            return {
-                "error": "Failed to parse JSON",
-                "raw_response": response_text[:500],
-            }
+    async def agenerate_json(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+        use_cache: bool = False,
+        retry: bool = True,
+    ) -> Dict[str, Any]:
+        """Async version of generate_json (requires httpx).
+
+        Args:
+            prompt: Input prompt (should request JSON output)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0-1.0)
+            system_prompt: Optional system prompt
+            use_cache: Reuse a cached response (see generate_text)
+            retry: Retry failures (see generate_text)
+
+        Returns:
+            Dict: Parsed JSON response
+
+        Raises:
+            OpenRouterClientError: If generation fails
+        """
+        logger.info("Generating JSON async (prompt_length=%d)", len(prompt))
+
+        prompt, system_prompt = self._prepare_json_prompt(prompt, system_prompt)
+
+        response_text = await self.agenerate_text(
+            prompt, max_tokens, temperature, system_prompt, use_cache=use_cache, retry=retry
+        )
+
+        return self._parse_json_response(response_text)
+
+    @openrouter_rate_limit
+    def stream_text(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Generate text, yielding chunks as the model produces them.
+
+        Downstream consumers can start work on the first tokens instead of
+        waiting for the whole completion.
+
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0-1.0)
+            system_prompt: Optional system prompt
+
+        Yields:
+            str: Text chunks
+
+        Raises:
+            OpenRouterClientError: If request fails
+
+        Example:
+            >>> client = OpenRouterClient()
+            >>> for chunk in client.stream_text("Analyze BTC trend"):
+            ...     print(chunk, end="", flush=True)
+            >>> full_text = "".join(client.stream_text("Analyze BTC trend"))
+        """
+        logger.info("Streaming text (prompt_length=%d)", len(prompt))
+
+        messages = self._build_messages(prompt, system_prompt)
+        yield from self._stream_request(messages, max_tokens, temperature)
+
+    @openrouter_rate_limit
+    async def astream_text(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Async version of stream_text (requires httpx).
+
+        Args:
+            prompt: Input prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0-1.0)
+            system_prompt: Optional system prompt
+
+        Yields:
+            str: Text chunks
+
+        Raises:
+            OpenRouterClientError: If request fails
+
+        Example:
+            >>> async for chunk in client.astream_text("Analyze BTC trend"):
+            ...     print(chunk, end="", flush=True)
+        """
+        logger.info("Streaming text async (prompt_length=%d)", len(prompt))
+
+        messages = self._build_messages(prompt, system_prompt)
+        async for chunk in self._astream_request(messages, max_tokens, temperature):
+            yield chunk
+
+    async def agenerate_text_batch(
+        self,
+        prompts: List[str],
+        concurrency: int = 8,
+        max_tokens: int = 500,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+    ) -> List[Union[str, Exception]]:
+        """Generate text for many prompts concurrently (requires httpx).
+
+        At most ``concurrency`` requests are in flight at once. Each prompt
+        goes through agenerate_text, so the rate limiter is applied per
+        request rather than once for the whole batch.
+
+        Args:
+            prompts: Input prompts
+            concurrency: Maximum number of in-flight requests
+            max_tokens: Maximum tokens to generate per prompt
+            temperature: Sampling temperature (0.0-1.0)
+            system_prompt: Optional system prompt shared by all prompts
+
+        Returns:
+            List: Generated text per prompt, in input order. A failed prompt
+                yields its exception instead of aborting the batch.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate_text(prompt, max_tokens, temperature, system_prompt)
+
+        return await asyncio.gather(*(_one(p) for p in prompts), return_exceptions=True)
+
+    def generate_text_batch(
+        self,
+        prompts: List[str],
+        concurrency: int = 8,
+        max_tokens: int = 500,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+    ) -> List[Union[str, Exception]]:
+        """Synchronous entry point for agenerate_text_batch.
+
+        Must not be called from a running event loop; use
+        agenerate_text_batch there instead.
+
+        Args:
+            prompts: Input prompts
+            concurrency: Maximum number of in-flight requests
+            max_tokens: Maximum tokens to generate per prompt
+            temperature: Sampling temperature (0.0-1.0)
+            system_prompt: Optional system prompt shared by all prompts
+
+        Returns:
+            List: Generated text (or exception) per prompt, in input order
+
+        Example:
+            >>> client = OpenRouterClient()
+            >>> results = client.generate_text_batch(
+            ...     ["Sentiment for BTC?", "Sentiment for ETH?"], concurrency=4
+            ... )
+        """
+        logger.info(
+            "Generating text batch (prompts=%d, concurrency=%d)", len(prompts), concurrency
+        )
+
+        async def _run() -> List[Union[str, Exception]]:
+            try:
+                return await self.agenerate_text_batch(
+                    prompts, concurrency, max_tokens, temperature, system_prompt
+                )
+            finally:
+                # The async client is bound to this event loop; drop it with the loop
+                await self.aclose()
+
+        return asyncio.run(_run())
 
     def get_model_info(self) -> Dict[str, str]:
         """Get information about the current model.
@@ -315,6 +1367,31 @@ class OpenRouterClient:
             "rate_limit": "15 calls per 60 seconds",
         }
 
+    def close(self) -> None:
+        """Close the underlying HTTP sessions and their connection pools."""
+        self._session.close()
+        if self._fast_session is not None:
+            self._fast_session.close()
+            self._fast_session = None
+
+    async def aclose(self) -> None:
+        """Close the running event loop's async HTTP client and its connection pool."""
+        client = self._aclients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def __enter__(self) -> "OpenRouterClient":
+        """Enter context manager.
+
+        Returns:
+            OpenRouterClient: This client
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Exit context manager and close the HTTP session."""
+        self.close()
+
     def __repr__(self) -> str:
         """Return string representation of client.
 
@@ -322,3 +1399,53 @@ class OpenRouterClient:
             str: Client representation
         """
         return f"OpenRouterClient(model={self.model})"
+
+
+# ============================================================================
+# Shared Client Factory
+# ============================================================================
+
+# Clients handed out by get_openrouter_client, closed at interpreter exit
+_shared_clients: List[OpenRouterClient] = []
+
+
+def get_openrouter_client(
+    model: str = "mistralai/mistral-7b-instruct:free",
+) -> OpenRouterClient:
+    """Get the process-wide OpenRouter client for a model.
+
+    This is the preferred entry point: callers share one connection pool
+    (sync and async) per model instead of each paying for a TLS handshake.
+    Do not close the returned client; shared clients are closed at exit.
+
+    Args:
+        model: Model name (default: mistralai/mistral-7b-instruct:free)
+
+    Returns:
+        OpenRouterClient: Shared client instance
+
+    Example:
+        >>> client = get_openrouter_client()
+        >>> text = client.generate_text("What is DCA?", max_tokens=100)
+    """
+    # Always call the cache positionally: lru_cache keys get_x("m") and
+    # get_x(model="m") differently, which would build two clients
+    return _shared_client(model)
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_client(model: str) -> OpenRouterClient:
+    """Create and register the shared client for a model (cached per model)."""
+    client = OpenRouterClient(model=model)
+    _shared_clients.append(client)
+    return client
+
+
+def _close_shared_clients() -> None:
+    """Close the HTTP sessions of all shared clients."""
+    for client in _shared_clients:
+        client.close()
+    _shared_clients.clear()
+
+
+atexit.register(_close_shared_clients)
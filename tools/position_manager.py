@@ -9,11 +9,11 @@ Features:
     - Per-strategy budget allocation limits
     - Emergency portfolio safeguards (-25% trigger)
     - Time-based DCA intervals
-    - Real-time position monitoring
+    - Real-time position monitoring (vectorized with NumPy)
     - RAG prediction tracking (optional)
     - Binance order execution
-    - Thread-safe singleton pattern
-    - Persistent JSON storage
+    - Thread-safe singleton with fine-grained locking
+    - Persistent JSON storage (debounced background writes)
 
 Example:
     >>> from tools.position_manager import PositionManager
@@ -42,23 +42,262 @@ Example:
     >>>     manager.execute_stop_loss(pos, current_price=61500)
 """
 
+import atexit
+import bisect
 import json
 import logging
+import math
 import os
-import tempfile
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from statistics import mean, stdev
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 from data_models.positions import Position
 from data_models.portfolio import PortfolioState
 
+try:
+    from tools.binance_client import BinanceClient
+
+    _HAS_BINANCE = True
+except ImportError:
+    BinanceClient = None
+    _HAS_BINANCE = False
+
+# Try to import orjson (optional dependency, faster JSON encoding/decoding)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import Numba (optional dependency, JIT for the statistics kernel)
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
+def _dump_json(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _load_json(raw: bytes):
+    """Parse UTF-8 JSON bytes (orjson when available). Raises ValueError if malformed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Stop-loss prices are mirrored as integer cents for exact array compares;
+# rows without a stop get a sentinel that never compares >= a price
+_NO_STOP_CENTS = np.iinfo(np.int64).min
+
+
+def _to_cents(price: Optional[float]) -> int:
+    """Quantize a USD price to integer cents (None -> _NO_STOP_CENTS)."""
+    if price is None:
+        return _NO_STOP_CENTS
+    return round(price * 100)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """os.write() until every byte is written."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+@njit(
+    "Tuple((i8, i8, f8, f8, f8, i8[::1], i8[::1], i8[::1], f8[::1]))(f8[::1], i1[::1], i8)",
+    cache=True,
+    boundscheck=False,
+)
+def _realized_pnl_summary_jit(pnl_pcts, strategy_codes, n_strategies):
+    """
+    Fused single-pass realized P&L % reduction (Numba kernel).
+
+    Compiled eagerly for contiguous float64 percentages and the int8
+    strategy codes column. See _realized_pnl_summary_numpy() for arguments
+    and return value.
+    """
+    n = pnl_pcts.shape[0]
+    sample = np.empty(n)
+    count = 0
+    wins = 0
+    best = -np.inf
+    worst = np.inf
+    strat_total = np.zeros(n_strategies, np.int64)
+    strat_count = np.zeros(n_strategies, np.int64)
+    strat_wins = np.zeros(n_strategies, np.int64)
+    strat_sum = np.zeros(n_strategies)
+
+    for i in range(n):
+        code = strategy_codes[i]
+        strat_total[code] += 1
+
+        pct = pnl_pcts[i]
+        if np.isnan(pct):
+            continue
+
+        strat_count[code] += 1
+        strat_sum[code] += pct
+        if pct > 0:
+            strat_wins[code] += 1
+
+        if pct != 0:
+            sample[count] = pct
+            count += 1
+            if pct > 0:
+                wins += 1
+            best = max(best, pct)
+            worst = min(worst, pct)
+
+    median = np.median(sample[:count]) if count else np.nan
+    return (
+        count, wins, median, best, worst, strat_total, strat_count, strat_wins, strat_sum
+    )
+
+
+def _realized_pnl_summary_numpy(
+    pnl_pcts: np.ndarray, strategy_codes: np.ndarray, n_strategies: int
+) -> Tuple:
+    """
+    Reduce finished positions' realized P&L % for get_statistics().
+
+    The portfolio sample skips missing (NaN) and zero percentages; the
+    per-strategy sample skips only missing ones.
+
+    Args:
+        pnl_pcts: Realized P&L % per finished position (NaN if missing)
+        strategy_codes: Strategy code per finished position
+        n_strategies: Number of strategy codes
+
+    Returns:
+        (count, wins, median, best, worst,
+         strat_total, strat_count, strat_wins, strat_sum)
+    """
+    has_pct = ~np.isnan(pnl_pcts)
+    sample = pnl_pcts[has_pct & (pnl_pcts != 0)]
+    count = sample.size
+
+    codes = strategy_codes[has_pct]
+    pcts = pnl_pcts[has_pct]
+
+    return (
+        count,
+        int((sample > 0).sum()),
+        float(np.median(sample)) if count else np.nan,
+        float(sample.max()) if count else -np.inf,
+        float(sample.min()) if count else np.inf,
+        np.bincount(strategy_codes, minlength=n_strategies),
+        np.bincount(codes, minlength=n_strategies),
+        np.bincount(codes[pcts > 0], minlength=n_strategies),
+        np.bincount(codes, weights=pcts, minlength=n_strategies),
+    )
+
+
+_realized_pnl_summary = (
+    _realized_pnl_summary_jit if NUMBA_AVAILABLE else _realized_pnl_summary_numpy
+)
+
+
+# Shared Binance client, created on first order (see _get_binance_client)
+_binance_client = None
+_binance_client_lock = threading.Lock()
+
+
+def _get_binance_client():
+    """
+    Return the shared BinanceClient, creating it on first use.
+
+    Raises:
+        ImportError: If the Binance client module is unavailable
+    """
+    global _binance_client
+
+    client = _binance_client
+    if client is not None:
+        return client
+
+    if not _HAS_BINANCE:
+        raise ImportError("tools.binance_client is not available")
+
+    with _binance_client_lock:
+        if _binance_client is None:
+            _binance_client = BinanceClient()
+
+        return _binance_client
+
+
+class _RWLock:
+    """
+    Minimal writer-preferring readers-writer lock.
+
+    Any number of readers may hold the lock at once; a writer waits for
+    active readers to drain and blocks new readers while it is queued.
+    Not reentrant - never acquire it again from a thread that holds it.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read_lock(self):
+        """Acquire the lock for shared (read-only) access."""
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_lock(self):
+        """Acquire the lock for exclusive access."""
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
 class PositionManager:
     """
     Enhanced position manager for autonomous Bitcoin trading.
@@ -75,8 +314,11 @@ class PositionManager:
 
     Architecture:
         - Singleton pattern (one instance per application)
-        - Thread-safe with threading.Lock
-        - Atomic file writes for data integrity
+        - Readers-writer lock on the position list, per-position locks
+          for mutations; Binance calls never run under a lock
+        - Append-only JSONL journal per mutation, compacted into an atomic
+          JSON snapshot by a background writer (right after every open,
+          close or stop) and again at interpreter exit
         - Comprehensive logging for all operations
 
     Strategy Configurations:
@@ -121,12 +363,46 @@ class PositionManager:
     EMERGENCY_STOP_THRESHOLD = -0.25  # -25% portfolio loss
     MAX_TOTAL_ALLOCATION = 0.95  # Keep 5% cash buffer
 
+    # Monitoring: report P&L % moves larger than this between ticks
+    LARGE_MOVE_THRESHOLD = 0.02
+
+    # Emergency close: sell orders sent concurrently
+    CLOSE_ALL_MAX_WORKERS = 8
+
+    # Array view: initial row capacity (doubled when full)
+    MIN_ROW_CAPACITY = 64
+
+    # Array view columns: (attribute, dtype, value for unused rows).
+    # Unused rows are never open and never hit a stop.
+    _ROW_COLUMNS = (
+        ("_entry_prices", np.float64, 0.0),
+        ("_amount_btcs", np.float64, 0.0),
+        ("_amount_usds", np.float64, 0.0),
+        ("_stop_cents", np.int64, _NO_STOP_CENTS),
+        ("_prev_pnl_pcts", np.float64, 0.0),
+        ("_unrealized_pnls", np.float64, 0.0),
+        ("_realized_pcts", np.float64, np.nan),
+        ("_rag_expected", np.float64, np.nan),
+        ("_open_mask", bool, False),
+        ("_status_codes", np.int8, -1),
+        ("_strategy_codes", np.int8, -1),
+    )
+    _STATUS_CODES = {"open": 0, "closed": 1, "stopped": 2}
+    _STRATEGY_CODES = {strategy: i for i, strategy in enumerate(STRATEGY_DEFAULTS)}
+
+    # Persistence
+    SAVE_DEBOUNCE_SECONDS = 0.25  # Coalesce bursts of mutations into one write
+    JOURNAL_SNAPSHOT_EVERY = 50  # Price ticks journaled before compacting to a snapshot
+
     def __new__(cls, *args, **kwargs):
-        """Singleton pattern - ensure only one instance exists."""
-        if not cls._instance:
-            with cls._lock:
-                if not cls._instance:
-                    cls._instance = super().__new__(cls)
+        """Singleton pattern - lock is only taken until the instance exists."""
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
         return cls._instance
 
     def __init__(
@@ -139,24 +415,72 @@ class PositionManager:
             initial_budget: Starting capital in USD (default: 10000.0)
             positions_file: Path to positions JSON file
         """
-        # Prevent re-initialization
+        # Prevent re-initialization (lock-free once constructed)
         if hasattr(self, "_initialized"):
             return
 
-        self.initial_budget = initial_budget
-        self.positions_file = Path(positions_file)
-        self.positions: List[Position] = []
-        self._operation_lock = threading.Lock()
-        self.emergency_mode = False
-        self.last_dca_time: Optional[datetime] = None
-
-        # Ensure data directory exists
-        self.positions_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            if hasattr(self, "_initialized"):
+                return
+
+            self.initial_budget = initial_budget
+            self.positions_file = Path(positions_file)
+            self.positions: List[Position] = []
+            # Guards the structure of self.positions and its array view (append/iterate)
+            self._positions_rwlock = _RWLock()
+            # Serializes budget reservations in open_position
+            self._reserve_lock = threading.Lock()
+            # Per-position locks and in-flight closes, keyed by position_id.
+            # Kept here rather than on Position so the model stays picklable.
+            self._position_locks: Dict[str, threading.Lock] = {}
+            self._closing_ids: Set[str] = set()
+            # Last ID base and suffix per strategy (guarded by the write lock)
+            self._last_position_ids: Dict[str, Tuple[str, int]] = {}
+            self._pending_allocations: Dict[str, float] = {
+                strategy: 0.0 for strategy in self.STRATEGY_DEFAULTS
+            }
+            # Persistence: every mutation gets a sequence number
+            # (_positions_version) and is appended to the journal; the
+            # background writer folds the journal into a snapshot
+            # (positions_file) covering sequences <= _saved_seq.
+            # _save_cond guards the sequence, the journal and the snapshot.
+            self.journal_file = self.positions_file.with_suffix(".jsonl")
+            self._journal_fd: Optional[int] = None
+            self._dirty = threading.Event()
+            self._flush_now = threading.Event()
+            self._save_cond = threading.Condition()
+            self._positions_version = 0
+            self._saved_seq = 0
+            # Pretty-print snapshots (debugging only; roughly doubles the size)
+            self._indent_json = False
+
+            # Invalidated by any change to _positions_version
+            self._stats_cache: Optional[Tuple[int, Dict]] = None
+
+            self.emergency_mode = False
+            self.last_dca_time = None
+            self.refresh_strategy_config()
+
+            # Ensure data directory exists
+            self.positions_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # Load existing positions
+            self._load_positions()
+            self._rebuild_arrays()
+
+            # Fold replayed journal entries into a fresh snapshot
+            if self._saved_seq < self._positions_version:
+                self._dirty.set()
+
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop, name="PositionManagerWriter", daemon=True
+            )
+            self._writer_thread.start()
 
-        # Load existing positions
-        self._load_positions()
+            # Compact the journal on normal interpreter shutdown
+            atexit.register(self._flush_at_exit)
 
-        self._initialized = True
+            self._initialized = True
 
         # Log initialization
         stats = self.get_budget_stats()
@@ -170,6 +494,64 @@ class PositionManager:
             f"   Emergency mode: {self.emergency_mode}"
         )
 
+    @property
+    def last_dca_time(self) -> Optional[datetime]:
+        """Wall-clock time of the last DCA buy (persisted, for display)."""
+        return self._last_dca_time
+
+    @last_dca_time.setter
+    def last_dca_time(self, value: Optional[datetime]) -> None:
+        # DCA spacing is gated on the monotonic clock so wall-clock jumps
+        # cannot skip or stall it; map the wall-clock time onto it once here
+        self._last_dca_time = value
+        if value is None:
+            self._last_dca_monotonic: Optional[float] = None
+        else:
+            elapsed = (datetime.now() - value).total_seconds()
+            self._last_dca_monotonic = time.monotonic() - max(elapsed, 0.0)
+
+    def set_strategy_config(self, strategy: str, **settings) -> None:
+        """
+        Update one strategy's settings and refresh the hot-path lookups.
+
+        Prefer this to editing STRATEGY_DEFAULTS directly, which leaves the
+        lookups stale until refresh_strategy_config() is called.
+
+        Args:
+            strategy: "dca", "swing", or "day"
+            **settings: STRATEGY_DEFAULTS keys to change
+
+        Raises:
+            ValueError: If the strategy or a setting name is unknown
+
+        Example:
+            >>> manager.set_strategy_config("day", enabled=True, allocation_limit=0.1)
+        """
+        if strategy not in self.STRATEGY_DEFAULTS:
+            raise ValueError(f"Unknown strategy: {strategy}")
+
+        config = self.STRATEGY_DEFAULTS[strategy]
+        unknown = sorted(set(settings) - set(config))
+        if unknown:
+            raise ValueError(f"Unknown {strategy} settings: {', '.join(unknown)}")
+
+        config.update(settings)
+        self.refresh_strategy_config()
+
+    def refresh_strategy_config(self) -> None:
+        """
+        Re-read STRATEGY_DEFAULTS into the flat lookups used on hot paths.
+
+        set_strategy_config() calls this; call it yourself only after
+        editing STRATEGY_DEFAULTS directly.
+        """
+        cfg = self.STRATEGY_DEFAULTS
+        self._strategy_enabled = {s: c["enabled"] for s, c in cfg.items()}
+        self._atr_multipliers = {s: c["atr_multiplier"] for s, c in cfg.items()}
+        self._allocation_limits = {s: c["allocation_limit"] for s, c in cfg.items()}
+        self._dca_enabled = cfg["dca"]["enabled"]
+        self._dca_min_interval = cfg["dca"]["time_between_buys"]
+
     @classmethod
     def get_instance(cls, initial_budget: float = 10000.0) -> "PositionManager":
         """
@@ -181,9 +563,7 @@ class PositionManager:
         Returns:
             PositionManager: The singleton instance
         """
-        if cls._instance is None:
-            cls._instance = cls(initial_budget=initial_budget)
-        return cls._instance
+        return cls(initial_budget=initial_budget)
 
     # =========================================================================
     # POSITION OPENING METHODS
@@ -239,32 +619,35 @@ class PositionManager:
             >>>     rag_context={"success_rate": 0.72}
             >>> )
         """
-        with self._operation_lock:
-            # 1. Check strategy enabled
-            if not self.STRATEGY_DEFAULTS[strategy]["enabled"]:
-                raise ValueError(f"{strategy.upper()} strategy is disabled")
+        atr_multiplier = self._atr_multipliers[strategy]
 
-            # 2. Check emergency mode
-            if self.emergency_mode:
-                raise ValueError("Cannot open position: Emergency mode active")
+        # 1. Check strategy enabled
+        if not self._strategy_enabled[strategy]:
+            raise ValueError(f"{strategy.upper()} strategy is disabled")
+
+        # 2. Check emergency mode
+        if self.emergency_mode:
+            raise ValueError("Cannot open position: Emergency mode active")
 
-            # 3. Check budget
+        # 3. Check budget and reserve the amount so concurrent opens cannot
+        #    over-allocate while this order is in flight
+        with self._reserve_lock:
             can_allocate, check_reason = self.can_allocate(strategy, amount_usd)
             if not can_allocate:
                 raise ValueError(f"Cannot allocate: {check_reason}")
+            self._pending_allocations[strategy] += amount_usd
 
+        try:
             # 4. Calculate stop-loss
             stop_loss = self.calculate_stop_loss(strategy, btc_price, atr)
 
-            # 5. Execute market buy on Binance (if available)
+            # 5. Execute market buy on Binance (if available) - no locks held
             executed_price = btc_price
             amount_btc = amount_usd / btc_price
             order_id = None
 
             try:
-                from tools.binance_client import BinanceClient
-
-                client = BinanceClient()
+                client = _get_binance_client()
 
                 # Place market buy order
                 order = client.place_market_order(side="BUY", quantity=amount_btc)
@@ -276,7 +659,7 @@ class PositionManager:
                     amount_btc = executed_qty
                     order_id = order.get("orderId")
 
-                    logger.info(f"Binance order executed: {order_id}")
+                    logger.info("Binance order executed: %s", order_id)
 
             except ImportError:
                 logger.warning(
@@ -285,51 +668,69 @@ class PositionManager:
             except Exception as e:
                 logger.error(f"Binance order failed: {e}, using simulation")
 
-            # 6. Create position
-            position = Position(
-                position_id=f"{strategy.upper()}-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
-                strategy=strategy,
-                amount_btc=amount_btc,
-                amount_usd=amount_usd,
-                entry_price=executed_price,
-                entry_time=datetime.now().isoformat(),
-                stop_loss=stop_loss,
-                status="open",
-                metadata=metadata or {},
-            )
+            # 6. Build the complete metadata up front so the position is
+            #    constructed (and its metadata validated) exactly once
+            position_metadata = dict(metadata) if metadata else {}
 
             # 7. Add RAG insights
             if rag_context:
-                self.add_rag_insights(position, rag_context)
+                position_metadata.update(self._rag_metadata(rag_context))
 
             # 8. Add metadata
-            position.metadata.update(
-                {
-                    "reason": reason,
-                    "atr_used": atr,
-                    "atr_multiplier": self.STRATEGY_DEFAULTS[strategy]["atr_multiplier"],
-                }
-            )
+            position_metadata["reason"] = reason
+            position_metadata["atr_used"] = atr
+            position_metadata["atr_multiplier"] = atr_multiplier
 
             if order_id:
-                position.metadata["binance_order_id"] = order_id
+                position_metadata["binance_order_id"] = order_id
+
+            # 9. Create and track the position. The clock is read under the
+            #    write lock (one read for ID, entry time and DCA timing) so
+            #    that self.positions stays in entry-time order.
+            with self._positions_rwlock.write_lock():
+                opened_at = datetime.now()
+                position = Position(
+                    position_id=self._new_position_id(strategy, opened_at),
+                    strategy=strategy,
+                    amount_btc=amount_btc,
+                    amount_usd=amount_usd,
+                    entry_price=executed_price,
+                    entry_time=opened_at.isoformat(),
+                    stop_loss=stop_loss,
+                    status="open",
+                    metadata=position_metadata,
+                )
 
-            # 9. Track position
-            self.positions.append(position)
+                self.positions.append(position)
+                row = self._append_row(position)
 
-            # 10. Update DCA timing if applicable
-            if strategy == "dca":
-                self.last_dca_time = datetime.now()
+        finally:
+            with self._reserve_lock:
+                self._pending_allocations[strategy] -= amount_usd
 
-            self._save_positions()
+        # 10. Update DCA timing if applicable
+        if strategy == "dca":
+            self.last_dca_time = opened_at
+
+        self._mark_dirty(
+            {
+                "op": "open",
+                "row": row,
+                "position": position.to_dict(),
+                "last_dca_time": (
+                    self.last_dca_time.isoformat() if self.last_dca_time else None
+                ),
+            }
+        )
 
-            # Log
+        # Log
+        if logger.isEnabledFor(logging.INFO):
             log_msg = (
                 f"{strategy.upper()} position opened: {position.position_id}\n"
                 f"   Amount: {amount_btc:.6f} BTC (${amount_usd:,.2f})\n"
                 f"   Entry: ${executed_price:,.2f}\n"
                 f"   Stop: ${stop_loss:,.2f} "
-                f"(ATR: ${atr:,.0f} x {self.STRATEGY_DEFAULTS[strategy]['atr_multiplier']})\n"
+                f"(ATR: ${atr:,.0f} x {atr_multiplier})\n"
                 f"   Reason: {reason}"
             )
 
@@ -341,7 +742,7 @@ class PositionManager:
 
             logger.info(log_msg)
 
-            return position
+        return position
 
     def open_dca_position(
         self,
@@ -484,44 +885,65 @@ class PositionManager:
                 "positions_with_large_moves": [...]
             }
         """
-        with self._operation_lock:
-            updated = 0
-            large_moves = []
-
-            # Get open positions directly (avoid nested lock acquisition)
-            open_positions = [p for p in self.positions if p.status == "open"]
-
-            for position in open_positions:
-                old_pnl_pct = position.unrealized_pnl_pct or 0
-
-                # Update price and P&L
-                position.update_current_price(current_price)
-
-                # Track significant moves (>2% change)
-                if position.unrealized_pnl_pct:
-                    pnl_change = abs(position.unrealized_pnl_pct - old_pnl_pct)
-                    if pnl_change > 0.02:
-                        large_moves.append(
-                            {
-                                "position_id": position.position_id,
-                                "old_pnl_pct": old_pnl_pct,
-                                "new_pnl_pct": position.unrealized_pnl_pct,
-                                "change": position.unrealized_pnl_pct - old_pnl_pct,
-                                "unrealized_pnl": position.unrealized_pnl,
-                            }
-                        )
-
-                        logger.info(
-                            f"Large move detected: {position.position_id} "
-                            f"{old_pnl_pct:+.2%} -> {position.unrealized_pnl_pct:+.2%}"
-                        )
-
+        current_price = float(current_price)
+        large_moves = []
+
+        # Compute P&L for all open rows at once and write it back to the
+        # column arrays and Position objects. The write lock keeps concurrent
+        # ticks and opens from interleaving their array and field updates.
+        updated = 0
+        with self._positions_rwlock.write_lock():
+            rows = np.flatnonzero(self._open_mask)
+            open_positions = [self.positions[i] for i in rows.tolist()]
+            entry_prices = self._entry_prices[rows]
+            old_pnl_pcts = self._prev_pnl_pcts[rows]
+            pnls = (current_price - entry_prices) * self._amount_btcs[rows]
+            pnl_pcts = (current_price - entry_prices) / entry_prices
+            self._prev_pnl_pcts[rows] = pnl_pcts
+            self._unrealized_pnls[rows] = pnls
+
+            for position, pnl, pnl_pct in zip(
+                open_positions, pnls.tolist(), pnl_pcts.tolist()
+            ):
+                with self._position_lock(position):
+                    if position.status != "open":
+                        continue
+                    position.current_price = current_price
+                    position.unrealized_pnl = pnl
+                    position.unrealized_pnl_pct = pnl_pct
                 updated += 1
 
-            if updated > 0:
-                self._save_positions()
+        # Track significant moves (>2% change)
+        deltas = pnl_pcts - old_pnl_pcts
+        large_idxs = np.flatnonzero(
+            (np.abs(deltas) > self.LARGE_MOVE_THRESHOLD) & (pnl_pcts != 0)
+        )
+        for i in large_idxs.tolist():
+            position = open_positions[i]
+            old_pnl_pct = float(old_pnl_pcts[i])
+            new_pnl_pct = float(pnl_pcts[i])
+
+            large_moves.append(
+                {
+                    "position_id": position.position_id,
+                    "old_pnl_pct": old_pnl_pct,
+                    "new_pnl_pct": new_pnl_pct,
+                    "change": float(deltas[i]),
+                    "unrealized_pnl": float(pnls[i]),
+                }
+            )
+
+            logger.info(
+                "Large move detected: %s %+.2f%% -> %+.2f%%",
+                position.position_id,
+                old_pnl_pct * 100,
+                new_pnl_pct * 100,
+            )
+
+        if updated > 0:
+            self._mark_dirty({"op": "tick", "price": current_price})
 
-        # Calculate portfolio stats OUTSIDE lock to avoid deadlock
+        # Calculate portfolio stats once and share them with the emergency check
         stats = self.get_budget_stats()
         total_pnl = stats["unrealized_pnl"]
         portfolio_value = stats["portfolio_value"]
@@ -529,9 +951,9 @@ class PositionManager:
             (portfolio_value - self.initial_budget) / self.initial_budget
         )
 
-        # Check emergency condition OUTSIDE lock to avoid deadlock
+        # Check emergency condition
         emergency_triggered, emergency_details = self.check_emergency_condition(
-            current_price
+            stats=stats
         )
 
         return {
@@ -558,14 +980,24 @@ class PositionManager:
         """
         triggered = []
 
-        with self._operation_lock:
-            # Get open positions directly (avoid nested lock acquisition)
-            open_positions = [p for p in self.positions if p.status == "open"]
+        # Branchless integer compare over the stop array in cents. Stops are
+        # already whole cents and exchange prices tick in cents; rounding is
+        # monotonic, so sub-cent inputs can only add candidates, which the
+        # exact check in is_stop_loss_triggered() then drops.
+        with self._positions_rwlock.read_lock():
+            rows = np.flatnonzero(
+                (self._stop_cents >= _to_cents(current_price)) & self._open_mask
+            )
+            candidates = [self.positions[i] for i in rows.tolist()]
 
-            for position in open_positions:
-                if position.is_stop_loss_triggered(current_price):
-                    loss_pct = (current_price - position.entry_price) / position.entry_price
+        for position in candidates:
+            # Skip positions whose close order is already in flight
+            if position.position_id in self._closing_ids:
+                continue
 
+            if position.is_stop_loss_triggered(current_price):
+                if logger.isEnabledFor(logging.WARNING):
+                    loss_pct = (current_price - position.entry_price) / position.entry_price
                     logger.warning(
                         f"STOP-LOSS TRIGGERED: {position.position_id}\n"
                         f"   Strategy: {position.strategy.upper()}\n"
@@ -575,7 +1007,7 @@ class PositionManager:
                         f"   Loss: {loss_pct:.2%}"
                     )
 
-                    triggered.append(position)
+                triggered.append(position)
 
         return triggered
 
@@ -609,17 +1041,17 @@ class PositionManager:
             }
 
         Raises:
-            Exception: If Binance order fails critically
+            ValueError: If position is not open or already being closed
         """
-        with self._operation_lock:
+        self._begin_close(position)
+
+        try:
             executed_price = current_price
             order_id = None
 
-            # Execute market sell on Binance (if available)
+            # Execute market sell on Binance (if available) - no locks held
             try:
-                from tools.binance_client import BinanceClient
-
-                client = BinanceClient()
+                client = _get_binance_client()
                 order = client.place_market_order(side="SELL", quantity=position.amount_btc)
 
                 # Get execution details
@@ -627,55 +1059,70 @@ class PositionManager:
                     executed_price = float(order["fills"][0].get("price", current_price))
                     order_id = order.get("orderId")
 
-                logger.info(f"Stop-loss order executed: {order_id}")
+                logger.info("Stop-loss order executed: %s", order_id)
 
             except ImportError:
                 logger.warning("Binance client not available, simulating execution")
             except Exception as e:
                 logger.error(f"Binance sell failed: {e}, using simulation")
 
-            # Update position
-            position.status = "stopped"
-            position.current_price = executed_price
-            position.exit_price = executed_price
-            position.exit_time = datetime.now().isoformat()
-
             # Calculate P&L
             realized_pnl = (executed_price - position.entry_price) * position.amount_btc
             realized_pnl_pct = (executed_price - position.entry_price) / position.entry_price
 
-            position.realized_pnl = realized_pnl
-            position.realized_pnl_pct = realized_pnl_pct
+            exit_time = datetime.now().isoformat()
 
-            if order_id:
-                position.metadata["binance_stop_order_id"] = order_id
+            # Update position
+            with self._position_lock(position):
+                position.status = "stopped"
+                position.current_price = executed_price
+                position.exit_price = executed_price
+                position.exit_time = exit_time
+                position.realized_pnl = realized_pnl
+                position.realized_pnl_pct = realized_pnl_pct
 
-            # Free capital
-            capital_freed = position.amount_usd
+                if order_id:
+                    position.metadata["binance_stop_order_id"] = order_id
 
-            self._save_positions()
+            self._mark_row_closed(position)
 
-            # Get RAG prediction if available
-            rag_expected = None
-            rag_accuracy = None
-            if position.metadata and "rag_expected_outcome" in position.metadata:
-                rag_expected = position.metadata["rag_expected_outcome"]
-                rag_accuracy = abs(realized_pnl_pct - rag_expected)
-
-            result = {
-                "position_id": position.position_id,
-                "order_id": order_id,
-                "realized_pnl": realized_pnl,
-                "realized_pnl_pct": realized_pnl_pct,
-                "execution_price": executed_price,
-                "capital_freed": capital_freed,
+        finally:
+            self._closing_ids.discard(position.position_id)
+
+        # Free capital
+        capital_freed = position.amount_usd
+
+        self._mark_dirty(
+            {
+                "op": "close",
+                "row": self._rows[id(position)],
+                "position": position.to_dict(),
             }
+        )
 
-            # Add RAG comparison
-            if rag_expected is not None:
-                result["rag_expected"] = rag_expected
-                result["rag_accuracy"] = rag_accuracy
+        # Get RAG prediction if available
+        rag_expected = (
+            position.metadata.get("rag_expected_outcome") if position.metadata else None
+        )
+        rag_accuracy = None
+        if rag_expected is not None:
+            rag_accuracy = abs(realized_pnl_pct - rag_expected)
+
+        result = {
+            "position_id": position.position_id,
+            "order_id": order_id,
+            "realized_pnl": realized_pnl,
+            "realized_pnl_pct": realized_pnl_pct,
+            "execution_price": executed_price,
+            "capital_freed": capital_freed,
+        }
+
+        # Add RAG comparison
+        if rag_expected is not None:
+            result["rag_expected"] = rag_expected
+            result["rag_accuracy"] = rag_accuracy
 
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
                     f"RAG Comparison:\n"
                     f"   Expected: {rag_expected:+.2%}\n"
@@ -683,13 +1130,14 @@ class PositionManager:
                     f"   Error: {rag_accuracy:.2%}"
                 )
 
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 f"Stop-loss executed: {position.position_id}\n"
                 f"   Realized P&L: ${realized_pnl:,.2f} ({realized_pnl_pct:+.2%})\n"
                 f"   Capital freed: ${capital_freed:,.2f}"
             )
 
-            return result
+        return result
 
     def close_position(
         self, position_id: str, close_price: float, reason: str = "manual"
@@ -714,25 +1162,20 @@ class PositionManager:
         Raises:
             ValueError: If position not found or not open
         """
-        with self._operation_lock:
-            position = self.get_position(position_id)
+        position = self.get_position(position_id)
 
-            if not position:
-                raise ValueError(f"Position {position_id} not found")
+        if not position:
+            raise ValueError(f"Position {position_id} not found")
 
-            if position.status != "open":
-                raise ValueError(
-                    f"Position {position_id} is not open (status: {position.status})"
-                )
+        self._begin_close(position)
 
+        try:
             executed_price = close_price
             order_id = None
 
-            # Execute on Binance
+            # Execute on Binance - no locks held
             try:
-                from tools.binance_client import BinanceClient
-
-                client = BinanceClient()
+                client = _get_binance_client()
                 order = client.place_market_order(side="SELL", quantity=position.amount_btc)
 
                 if order and "fills" in order:
@@ -744,29 +1187,44 @@ class PositionManager:
             except Exception as e:
                 logger.error(f"Binance close failed: {e}")
 
-            # Update position
-            position.status = "closed"
-            position.exit_price = executed_price
-            position.current_price = executed_price
-            position.exit_time = datetime.now().isoformat()
-
-            # Calculate P&L
-            position.realized_pnl = (
-                executed_price - position.entry_price
-            ) * position.amount_btc
-            position.realized_pnl_pct = (
-                executed_price - position.entry_price
-            ) / position.entry_price
-
-            # Add close reason
-            if not position.metadata:
-                position.metadata = {}
-            position.metadata["close_reason"] = reason
-            if order_id:
-                position.metadata["binance_close_order_id"] = order_id
+            exit_time = datetime.now().isoformat()
 
-            self._save_positions()
+            # Update position
+            with self._position_lock(position):
+                position.status = "closed"
+                position.exit_price = executed_price
+                position.current_price = executed_price
+                position.exit_time = exit_time
+
+                # Calculate P&L
+                position.realized_pnl = (
+                    executed_price - position.entry_price
+                ) * position.amount_btc
+                position.realized_pnl_pct = (
+                    executed_price - position.entry_price
+                ) / position.entry_price
+
+                # Add close reason
+                if not position.metadata:
+                    position.metadata = {}
+                position.metadata["close_reason"] = reason
+                if order_id:
+                    position.metadata["binance_close_order_id"] = order_id
+
+            self._mark_row_closed(position)
+
+        finally:
+            self._closing_ids.discard(position.position_id)
+
+        self._mark_dirty(
+            {
+                "op": "close",
+                "row": self._rows[id(position)],
+                "position": position.to_dict(),
+            }
+        )
 
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 f"Position closed: {position_id}\n"
                 f"   Realized P&L: ${position.realized_pnl:,.2f} "
@@ -774,7 +1232,52 @@ class PositionManager:
                 f"   Reason: {reason}"
             )
 
-            return position
+        return position
+
+    def _new_position_id(self, strategy: str, opened_at: datetime) -> str:
+        """
+        Build a unique position ID ("{STRATEGY}-{YYYYmmdd-HHMMSS}").
+
+        A second position of the same strategy opened within the same second
+        gets a "-2", "-3", ... suffix so IDs stay unique. Caller holds the
+        write lock.
+        """
+        base = f"{strategy.upper()}-{opened_at.strftime('%Y%m%d-%H%M%S')}"
+
+        last_base, seq = self._last_position_ids.get(strategy, (None, 0))
+        seq = seq + 1 if base == last_base else 1
+        self._last_position_ids[strategy] = (base, seq)
+
+        return base if seq == 1 else f"{base}-{seq}"
+
+    def _position_lock(self, position: Position) -> threading.Lock:
+        """Return the lock guarding a position's fields, creating it on first use."""
+        lock = self._position_locks.get(position.position_id)
+        if lock is None:
+            lock = self._position_locks.setdefault(position.position_id, threading.Lock())
+        return lock
+
+    def _begin_close(self, position: Position) -> None:
+        """
+        Claim an open position for closing.
+
+        Marks the position as closing under its own lock so that a concurrent
+        stop-loss and manual close cannot both send a sell order.
+
+        Raises:
+            ValueError: If position is not open or already being closed
+        """
+        with self._position_lock(position):
+            if position.status != "open":
+                raise ValueError(
+                    f"Position {position.position_id} is not open "
+                    f"(status: {position.status})"
+                )
+            if position.position_id in self._closing_ids:
+                raise ValueError(
+                    f"Position {position.position_id} is already being closed"
+                )
+            self._closing_ids.add(position.position_id)
 
     def close_all_positions(self, current_price: float) -> List[Dict]:
         """
@@ -785,21 +1288,38 @@ class PositionManager:
         - User manual stop
         - System shutdown
 
+        Sell orders are sent in parallel (up to CLOSE_ALL_MAX_WORKERS at a
+        time), so total time is roughly one Binance round trip rather than
+        one per position.
+
         Args:
             current_price: Current market price
 
         Returns:
-            List of execution results
+            List of execution results (same order as get_open_positions())
         """
         results = []
+        open_positions = self.get_open_positions()
+        futures = []
+
+        if open_positions:
+            with ThreadPoolExecutor(
+                max_workers=min(self.CLOSE_ALL_MAX_WORKERS, len(open_positions)),
+                thread_name_prefix="PositionClose",
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self.close_position,
+                        position_id=position.position_id,
+                        close_price=current_price,
+                        reason="emergency_close",
+                    )
+                    for position in open_positions
+                ]
 
-        for position in self.get_open_positions():
+        for position, future in zip(open_positions, futures):
             try:
-                result = self.close_position(
-                    position_id=position.position_id,
-                    close_price=current_price,
-                    reason="emergency_close",
-                )
+                result = future.result()
                 results.append(
                     {
                         "position_id": result.position_id,
@@ -824,7 +1344,9 @@ class PositionManager:
     # EMERGENCY & BUDGET METHODS
     # =========================================================================
 
-    def check_emergency_condition(self, current_price: float) -> Tuple[bool, Dict]:
+    def check_emergency_condition(
+        self, current_price: Optional[float] = None, stats: Optional[Dict] = None
+    ) -> Tuple[bool, Dict]:
         """
         Check if portfolio hit emergency threshold (-25%).
 
@@ -840,12 +1362,15 @@ class PositionManager:
         - Return emergency details
 
         Args:
-            current_price: Current BTC price
+            current_price: Current BTC price (optional; positions already
+                carry the latest price from update_all_positions)
+            stats: Precomputed get_budget_stats() result (computed if omitted)
 
         Returns:
             (emergency_triggered: bool, details: Dict)
         """
-        stats = self.get_budget_stats()
+        if stats is None:
+            stats = self.get_budget_stats()
         portfolio_value = stats["portfolio_value"]
         portfolio_pnl_pct = (portfolio_value - self.initial_budget) / self.initial_budget
 
@@ -859,6 +1384,7 @@ class PositionManager:
 
         if portfolio_pnl_pct <= self.EMERGENCY_STOP_THRESHOLD and not self.emergency_mode:
             self.emergency_mode = True
+            self._mark_dirty({"op": "state", "emergency_mode": True})
 
             logger.critical(
                 f"\n{'='*60}\n"
@@ -883,11 +1409,13 @@ class PositionManager:
         """
         Check if we can allocate capital for new position.
 
-        Checks (in order):
+        Checks (in order, cheap configuration gates first):
         1. Emergency mode (block if True)
-        2. Available capital >= amount
-        3. Global allocation limit (95% max)
-        4. Strategy-specific allocation limit
+        2. Strategy enabled
+        3. Amount is positive
+        4. Available capital >= amount
+        5. Global allocation limit (95% max)
+        6. Strategy-specific allocation limit
 
         Args:
             strategy: "dca", "swing", or "day"
@@ -905,10 +1433,20 @@ class PositionManager:
         if self.emergency_mode:
             return False, "Emergency mode active - all positions blocked"
 
-        # Get budget stats
-        stats = self.get_budget_stats()
-        available = stats["available_capital"]
-        allocated = stats["allocated_capital"]
+        # Check strategy enabled
+        if not self._strategy_enabled[strategy]:
+            return False, f"{strategy.upper()} strategy is disabled"
+
+        # Check amount
+        if amount_usd <= 0:
+            return False, f"Invalid amount: ${amount_usd:,.2f}"
+
+        # Current allocation (including capital reserved by in-flight opens),
+        # read once for all three capital checks
+        allocated, available, by_strategy = self._get_allocation_snapshot()
+        pending = sum(self._pending_allocations.values())
+        available -= pending
+        allocated += pending
 
         # Check available cash
         if amount_usd > available:
@@ -926,8 +1464,8 @@ class PositionManager:
             )
 
         # Check strategy limit
-        strategy_limit = self.STRATEGY_DEFAULTS[strategy]["allocation_limit"]
-        strategy_allocated = stats["by_strategy"][strategy]["allocated"]
+        strategy_limit = self._allocation_limits[strategy]
+        strategy_allocated = by_strategy[strategy] + self._pending_allocations[strategy]
         new_strategy_alloc = strategy_allocated + amount_usd
         new_strategy_pct = new_strategy_alloc / self.initial_budget
 
@@ -945,23 +1483,28 @@ class PositionManager:
         Check if DCA position can be opened.
 
         Additional checks beyond can_allocate():
-        - DCA strategy enabled?
         - Time since last DCA >= min interval?
 
+        All configuration and timing gates run before any allocation work.
+
         Args:
             amount_usd: Amount to invest
 
         Returns:
             (can_open: bool, reason: str)
         """
+        # Check emergency
+        if self.emergency_mode:
+            return False, "Emergency mode active - all positions blocked"
+
         # Check if DCA enabled
-        if not self.STRATEGY_DEFAULTS["dca"]["enabled"]:
+        if not self._dca_enabled:
             return False, "DCA strategy is disabled"
 
         # Check timing (prevent too frequent DCA)
-        if self.last_dca_time:
-            time_since_last = (datetime.now() - self.last_dca_time).total_seconds()
-            min_interval = self.STRATEGY_DEFAULTS["dca"]["time_between_buys"]
+        if self._last_dca_monotonic is not None:
+            time_since_last = time.monotonic() - self._last_dca_monotonic
+            min_interval = self._dca_min_interval
 
             if time_since_last < min_interval:
                 return (
@@ -973,10 +1516,30 @@ class PositionManager:
         # Check budget allocation
         return self.can_allocate("dca", amount_usd)
 
+    def _get_allocation_snapshot(self) -> Tuple[float, float, Dict[str, float]]:
+        """
+        Capital currently allocated to open positions.
+
+        Read from the running counters kept by _append_row() and
+        _mark_row_closed(), so this is O(1) in the number of positions.
+
+        Returns:
+            (allocated, available, allocated_by_strategy)
+        """
+        with self._positions_rwlock.read_lock():
+            allocated = self._allocated_total
+            by_strategy = dict(self._allocated_by_strategy)
+
+        return allocated, self.initial_budget - allocated, by_strategy
+
     def get_budget_stats(self) -> Dict:
         """
         Calculate current budget allocation.
 
+        The result is cached until the next position mutation (open, close,
+        stop-loss or price update); callers get their own copy, so mutating
+        it cannot corrupt the cache.
+
         Returns:
             {
                 "initial_budget": 10000.0,
@@ -990,38 +1553,47 @@ class PositionManager:
                 "by_strategy": {...}
             }
         """
-        open_pos = self.get_open_positions()
-        closed_pos = self.get_all_positions("closed")
-        stopped_pos = self.get_all_positions("stopped")
+        # Read the version before computing so a concurrent mutation can
+        # never leave a stale result cached under the new version
+        version = self._positions_version
+        cached = self._stats_cache
+        if cached is not None and cached[0] == version:
+            return self._copy_budget_stats(cached[1])
+
+        # One read-lock round trip for every input
+        with self._positions_rwlock.read_lock():
+            # Allocated capital (in open positions)
+            allocated = self._allocated_total
+            allocated_by_strategy = dict(self._allocated_by_strategy)
+
+            open_counts = {
+                strategy: len(shard) for strategy, shard in self._open_by_strategy.items()
+            }
+
+            # Unrealized P&L
+            unrealized_pnl = float(self._unrealized_pnls[self._open_mask].sum())
 
-        # Allocated capital (in open positions)
-        allocated = sum(p.amount_usd for p in open_pos)
+            # Realized P&L (closed + stopped)
+            realized_pnl = self._realized_pnl_total
 
         # Available capital
         available = self.initial_budget - allocated
 
-        # Unrealized P&L
-        unrealized_pnl = sum(p.unrealized_pnl or 0 for p in open_pos)
-
-        # Realized P&L
-        realized_pnl = sum(p.realized_pnl or 0 for p in closed_pos + stopped_pos)
-
         # Portfolio value (cash + position values)
         portfolio_value = available + allocated + unrealized_pnl
 
         # By strategy
         by_strategy = {}
         for strategy in ["dca", "swing", "day"]:
-            strategy_positions = [p for p in open_pos if p.strategy == strategy]
-            strategy_allocated = sum(p.amount_usd for p in strategy_positions)
+            strategy_allocated = allocated_by_strategy[strategy]
 
             by_strategy[strategy] = {
-                "count": len(strategy_positions),
+                "count": open_counts[strategy],
                 "allocated": strategy_allocated,
                 "allocation_pct": strategy_allocated / self.initial_budget,
             }
 
-        return {
+        stats = {
             "initial_budget": self.initial_budget,
             "allocated_capital": allocated,
             "available_capital": available,
@@ -1033,6 +1605,18 @@ class PositionManager:
             "by_strategy": by_strategy,
         }
 
+        self._stats_cache = (version, stats)
+        return self._copy_budget_stats(stats)
+
+    @staticmethod
+    def _copy_budget_stats(stats: Dict) -> Dict:
+        """Copy a cached get_budget_stats() result, including the per-strategy dicts."""
+        copy = dict(stats)
+        copy["by_strategy"] = {
+            strategy: dict(entry) for strategy, entry in stats["by_strategy"].items()
+        }
+        return copy
+
     def get_portfolio_state(self) -> PortfolioState:
         """
         Get current portfolio state for trading workflow.
@@ -1047,14 +1631,18 @@ class PositionManager:
             >>> print(f"BTC: {state.btc_balance:.8f}, USD: ${state.usd_balance:.2f}")
             BTC: 0.00000000, USD: $10000.00
         """
-        open_positions = self.get_open_positions()
+        with self._positions_rwlock.read_lock():
+            open_positions = list(self._open_by_id.values())
+            in_order = self._entry_time_sorted
 
-        # Total BTC balance (sum of all open positions)
-        btc_balance = sum(p.amount_btc for p in open_positions)
+            # Total BTC balance (sum of all open positions)
+            btc_balance = float(self._amount_btcs[self._open_mask].sum())
 
-        # Available USD balance (initial budget minus allocated capital)
-        budget_stats = self.get_budget_stats()
-        usd_balance = budget_stats["available_capital"]
+            # Available USD balance (initial budget minus allocated capital)
+            usd_balance = self.initial_budget - self._allocated_total
+
+        if not in_order:
+            open_positions.sort(key=lambda p: p.entry_time)
 
         return PortfolioState(
             btc_balance=btc_balance,
@@ -1091,7 +1679,7 @@ class PositionManager:
             >>> stop = manager.calculate_stop_loss("dca", 62000, 850)
             >>> # stop = 62000 - (850 * 2.0) = 60300
         """
-        k = self.STRATEGY_DEFAULTS[strategy]["atr_multiplier"]
+        k = self._atr_multipliers[strategy]
         stop_loss = entry_price - (atr * k)
         return round(stop_loss, 2)
 
@@ -1117,22 +1705,22 @@ class PositionManager:
         if position.metadata is None:
             position.metadata = {}
 
-        position.metadata.update(
-            {
-                "rag_success_rate": rag_context.get("success_rate"),
-                "rag_expected_outcome": rag_context.get("expected_outcome"),
-                "rag_similar_patterns": rag_context.get("similar_patterns"),
-                "rag_confidence": rag_context.get("confidence"),
-            }
-        )
+        position.metadata.update(self._rag_metadata(rag_context))
+
+    @staticmethod
+    def _rag_metadata(rag_context: Dict) -> Dict:
+        """Map RAG context keys to position metadata keys."""
+        return {
+            "rag_success_rate": rag_context.get("success_rate"),
+            "rag_expected_outcome": rag_context.get("expected_outcome"),
+            "rag_similar_patterns": rag_context.get("similar_patterns"),
+            "rag_confidence": rag_context.get("confidence"),
+        }
 
     def get_position(self, position_id: str) -> Optional[Position]:
         """Get specific position by ID."""
-        with self._operation_lock:
-            for position in self.positions:
-                if position.position_id == position_id:
-                    return position
-            return None
+        with self._positions_rwlock.read_lock():
+            return self._positions_by_id.get(position_id)
 
     def get_all_positions(self, status: Optional[str] = None) -> List[Position]:
         """
@@ -1144,17 +1732,39 @@ class PositionManager:
         Returns:
             List of positions sorted by entry time
         """
-        with self._operation_lock:
-            positions = self.positions.copy()
+        with self._positions_rwlock.read_lock():
+            if not status:
+                positions = self.positions.copy()
+            elif status == "open":
+                positions = list(self._open_by_id.values())
+            else:
+                positions = [
+                    self.positions[row] for row in self._finished_rows.get(status, ())
+                ]
+            in_order = self._entry_time_sorted
+
+        # self.positions is kept in entry-time order; only sort if a loaded
+        # file or a wall-clock step broke that
+        if not in_order:
+            positions.sort(key=lambda p: p.entry_time)
+
+        return positions
+
+    def _snapshot_positions(self) -> List[Position]:
+        """Copy self.positions in a single read-lock round trip."""
+        with self._positions_rwlock.read_lock():
+            return self.positions.copy()
 
-            if status:
-                positions = [p for p in positions if p.status == status]
+    def get_open_positions(self) -> List[Position]:
+        """Get all open positions (from the open index, sorted by entry time)."""
+        with self._positions_rwlock.read_lock():
+            positions = list(self._open_by_id.values())
+            in_order = self._entry_time_sorted
 
-            return sorted(positions, key=lambda p: p.entry_time)
+        if not in_order:
+            positions.sort(key=lambda p: p.entry_time)
 
-    def get_open_positions(self) -> List[Position]:
-        """Get all open positions."""
-        return self.get_all_positions("open")
+        return positions
 
     def get_statistics(self) -> Dict:
         """
@@ -1180,85 +1790,79 @@ class PositionManager:
                 "rag_accuracy": {...}
             }
         """
-        all_pos = self.positions
-        open_pos = self.get_open_positions()
-        closed_pos = self.get_all_positions("closed")
-        stopped_pos = self.get_all_positions("stopped")
-        finished_pos = closed_pos + stopped_pos
+        # Everything below is reductions over the column arrays; open-position
+        # totals come from get_budget_stats()
+        with self._positions_rwlock.read_lock():
+            n = self._n_rows
+            n_open = len(self._open_by_id)
+            n_closed = len(self._finished_rows["closed"])
+            n_stopped = len(self._finished_rows["stopped"])
+            finished = self._status_codes[:n] > 0
+            pnl_pcts = self._realized_pcts[:n][finished]
+            strategy_codes = self._strategy_codes[:n][finished]
+            rag_expected = self._rag_expected[:n][finished]
+            total_realized_pnl = self._realized_pnl_total
+
+        (
+            count,
+            wins,
+            median,
+            best,
+            worst,
+            strat_total,
+            strat_count,
+            strat_wins,
+            strat_sum,
+        ) = _realized_pnl_summary(pnl_pcts, strategy_codes, len(self._STRATEGY_CODES))
+        budget_stats = self.get_budget_stats()
 
         # Basic counts
         stats = {
-            "total_positions": len(all_pos),
-            "open_positions": len(open_pos),
-            "closed_positions": len(closed_pos),
-            "stopped_positions": len(stopped_pos),
+            "total_positions": n,
+            "open_positions": n_open,
+            "closed_positions": n_closed,
+            "stopped_positions": n_stopped,
         }
 
         # P&L totals
-        stats["total_unrealized_pnl"] = sum(p.unrealized_pnl or 0 for p in open_pos)
-        stats["total_realized_pnl"] = sum(p.realized_pnl or 0 for p in finished_pos)
+        stats["total_unrealized_pnl"] = budget_stats["unrealized_pnl"]
+        stats["total_realized_pnl"] = total_realized_pnl
 
-        # Performance metrics (only for finished positions)
-        if finished_pos:
-            pnl_pcts = [p.realized_pnl_pct for p in finished_pos if p.realized_pnl_pct]
+        # Performance metrics (finished positions with a non-zero realized %)
+        if count:
+            stats["avg_realized_pnl_pct"] = self.realized_mean
+            stats["median_realized_pnl_pct"] = float(median)
+            stats["win_rate"] = wins / count
+            stats["best_trade_pct"] = float(best)
+            stats["worst_trade_pct"] = float(worst)
 
-            if pnl_pcts:
-                stats["avg_realized_pnl_pct"] = mean(pnl_pcts)
-                stats["median_realized_pnl_pct"] = sorted(pnl_pcts)[len(pnl_pcts) // 2]
-                stats["win_rate"] = sum(1 for pct in pnl_pcts if pct > 0) / len(pnl_pcts)
-                stats["best_trade_pct"] = max(pnl_pcts)
-                stats["worst_trade_pct"] = min(pnl_pcts)
-
-                if len(pnl_pcts) > 1:
-                    stats["stdev_pnl_pct"] = stdev(pnl_pcts)
+            if count > 1:
+                stats["stdev_pnl_pct"] = self.realized_std
 
         # By strategy
         by_strategy = {}
         for strategy in ["dca", "swing", "day"]:
-            strategy_finished = [p for p in finished_pos if p.strategy == strategy]
-            pnl_pcts = [
-                p.realized_pnl_pct
-                for p in strategy_finished
-                if p.realized_pnl_pct is not None
-            ]
+            code = self._STRATEGY_CODES[strategy]
+            n_pcts = int(strat_count[code])
 
             by_strategy[strategy] = {
-                "count": len(strategy_finished),
-                "win_rate": (
-                    sum(1 for pct in pnl_pcts if pct > 0) / len(pnl_pcts)
-                    if pnl_pcts
-                    else 0
-                ),
-                "avg_pnl_pct": mean(pnl_pcts) if pnl_pcts else 0,
+                "count": int(strat_total[code]),
+                "win_rate": int(strat_wins[code]) / n_pcts if n_pcts else 0,
+                "avg_pnl_pct": float(strat_sum[code]) / n_pcts if n_pcts else 0,
             }
 
         stats["by_strategy"] = by_strategy
 
         # Emergency & budget
         stats["emergency_mode"] = self.emergency_mode
-        stats["budget_stats"] = self.get_budget_stats()
+        stats["budget_stats"] = budget_stats
 
         # RAG accuracy (if used)
-        rag_positions = [
-            p
-            for p in finished_pos
-            if p.metadata and "rag_expected_outcome" in p.metadata
-        ]
-
-        if rag_positions:
-            errors = [
-                abs(p.realized_pnl_pct - p.metadata["rag_expected_outcome"])
-                for p in rag_positions
-                if p.realized_pnl_pct is not None
-            ]
-
-            stats["rag_accuracy"] = {
-                "predictions_made": len(rag_positions),
-                "avg_accuracy": 1 - mean(errors) if errors else 0,
-                "avg_error": mean(errors) if errors else 0,
-                "best_prediction": 1 - min(errors) if errors else 0,
-                "worst_prediction": 1 - max(errors) if errors else 0,
-            }
+        has_rag = ~np.isnan(pnl_pcts) & ~np.isnan(rag_expected)
+        if has_rag.any():
+            stats["rag_accuracy"] = self._summarize_rag_errors(
+                pnl_pcts[has_rag], rag_expected[has_rag]
+            )
 
         return stats
 
@@ -1277,17 +1881,22 @@ class PositionManager:
                 "worst_prediction": 0.65
             }
         """
-        finished = self.get_all_positions("closed") + self.get_all_positions("stopped")
+        with self._positions_rwlock.read_lock():
+            n = self._n_rows
+            actual = self._realized_pcts[:n]
+            expected = self._rag_expected[:n]
+            has_rag = (
+                (self._status_codes[:n] > 0) & ~np.isnan(actual) & ~np.isnan(expected)
+            )
+            actual = actual[has_rag]
+            expected = expected[has_rag]
 
-        rag_positions = [
-            p
-            for p in finished
-            if p.metadata
-            and "rag_expected_outcome" in p.metadata
-            and p.realized_pnl_pct is not None
-        ]
+        return self._summarize_rag_errors(actual, expected)
 
-        if not rag_positions:
+    @staticmethod
+    def _summarize_rag_errors(actual: np.ndarray, expected: np.ndarray) -> Dict:
+        """Summarize |actual - expected| P&L % errors into the RAG accuracy dict."""
+        if not len(actual):
             return {
                 "predictions_made": 0,
                 "avg_accuracy": 0,
@@ -1296,84 +1905,466 @@ class PositionManager:
                 "worst_prediction": 0,
             }
 
-        errors = [
-            abs(p.realized_pnl_pct - p.metadata["rag_expected_outcome"])
-            for p in rag_positions
-        ]
+        errors = np.abs(actual - expected)
+        avg_error = float(errors.mean())
 
         return {
-            "predictions_made": len(rag_positions),
-            "avg_accuracy": 1 - mean(errors),
-            "avg_error": mean(errors),
-            "best_prediction": 1 - min(errors),
-            "worst_prediction": 1 - max(errors),
+            "predictions_made": len(actual),
+            "avg_accuracy": 1 - avg_error,
+            "avg_error": avg_error,
+            "best_prediction": 1 - float(errors.min()),
+            "worst_prediction": 1 - float(errors.max()),
+        }
+
+    # =========================================================================
+    # ARRAY VIEW & INDEXES (mirrors of self.positions for monitoring)
+    # =========================================================================
+
+    def _rebuild_arrays(self) -> None:
+        """
+        Rebuild the NumPy arrays mirroring self.positions (row i == positions[i]),
+        the ID index, the open-position indexes (by ID, and sharded by strategy)
+        and the per-status rows of finished positions.
+        """
+        positions = self.positions
+        self._positions_by_id: Dict[str, Position] = {}
+        self._open_by_id: Dict[str, Position] = {}
+        self._open_by_strategy: Dict[str, Dict[str, Position]] = {
+            strategy: {} for strategy in self.STRATEGY_DEFAULTS
+        }
+        # Rows of finished positions per status, kept sorted (= entry order)
+        self._finished_rows: Dict[str, List[int]] = {"closed": [], "stopped": []}
+
+        # Running realized P&L % moments (Welford), same sample as get_statistics
+        self._realized_count = 0
+        self._realized_mean = 0.0
+        self._realized_m2 = 0.0
+        self._realized_pnl_total = 0.0
+
+        # Bucket every position in a single pass
+        for row, position in enumerate(positions):
+            position_id = position.position_id
+            self._positions_by_id[position_id] = position
+
+            if position.status == "open":
+                self._open_by_id[position_id] = position
+                self._open_by_strategy[position.strategy][position_id] = position
+            else:
+                self._finished_rows[position.status].append(row)
+                self._realized_pnl_total += position.realized_pnl or 0
+                if position.realized_pnl_pct:
+                    self._welford_update(position.realized_pnl_pct)
+
+        # Column arrays with spare capacity; rows >= _n_rows hold the fill values
+        n = len(positions)
+        capacity = max(self.MIN_ROW_CAPACITY, 2 * n)
+        columns = list(zip(*map(self._row_values, positions))) if n else []
+        for i, (attr, dtype, fill) in enumerate(self._ROW_COLUMNS):
+            array = np.full(capacity, fill, dtype=dtype)
+            if n:
+                array[:n] = columns[i]
+            setattr(self, attr, array)
+        self._n_rows = n
+        self._recount_allocations()
+
+        self._rows: Dict[int, int] = {id(p): i for i, p in enumerate(positions)}
+        # Rows (and the open index, which follows insertion order) are in
+        # entry-time order unless this turns False
+        self._entry_time_sorted = all(
+            a.entry_time <= b.entry_time for a, b in zip(positions, positions[1:])
+        )
+
+    def _row_values(self, position: Position) -> Tuple:
+        """Values of one position for each of _ROW_COLUMNS, in order."""
+        status = position.status
+        realized_pct = position.realized_pnl_pct
+        rag_expected = (
+            position.metadata.get("rag_expected_outcome") if position.metadata else None
+        )
+        return (
+            position.entry_price,
+            position.amount_btc,
+            position.amount_usd,
+            _to_cents(position.stop_loss),
+            position.unrealized_pnl_pct or 0.0,
+            position.unrealized_pnl or 0.0,
+            np.nan if realized_pct is None else realized_pct,
+            np.nan if rag_expected is None else rag_expected,
+            status == "open",
+            self._STATUS_CODES[status],
+            self._STRATEGY_CODES[position.strategy],
+        )
+
+    def _grow_rows(self) -> None:
+        """Double the capacity of every column array. Caller holds the write lock."""
+        n = self._n_rows
+        capacity = max(self.MIN_ROW_CAPACITY, 2 * len(self._entry_prices))
+        for attr, dtype, fill in self._ROW_COLUMNS:
+            array = np.full(capacity, fill, dtype=dtype)
+            array[:n] = getattr(self, attr)[:n]
+            setattr(self, attr, array)
+
+    def _append_row(self, position: Position) -> int:
+        """Append a row for a new position and return its index. Caller holds the write lock."""
+        row = self._n_rows
+        if row and position.entry_time < self.positions[row - 1].entry_time:
+            self._entry_time_sorted = False
+        self._rows[id(position)] = row
+        self._positions_by_id[position.position_id] = position
+        if position.status == "open":
+            self._open_by_id[position.position_id] = position
+            self._open_by_strategy[position.strategy][position.position_id] = position
+            self._allocated_total += position.amount_usd
+            self._allocated_by_strategy[position.strategy] += position.amount_usd
+        if row == len(self._entry_prices):
+            self._grow_rows()
+        for (attr, _, _), value in zip(self._ROW_COLUMNS, self._row_values(position)):
+            getattr(self, attr)[row] = value
+        self._n_rows = row + 1
+        return row
+
+    def _mark_row_closed(self, position: Position) -> None:
+        """
+        Move a closed/stopped position from the open mask, indexes and
+        allocation counters to its status bucket and fold its realized
+        P&L into the running stats.
+        """
+        with self._positions_rwlock.write_lock():
+            row = self._rows[id(position)]
+            self._open_mask[row] = False
+            self._status_codes[row] = self._STATUS_CODES[position.status]
+            if position.realized_pnl_pct is not None:
+                self._realized_pcts[row] = position.realized_pnl_pct
+            bisect.insort(self._finished_rows[position.status], row)
+            if self._open_by_id.pop(position.position_id, None) is not None:
+                shard = self._open_by_strategy[position.strategy]
+                shard.pop(position.position_id, None)
+                self._allocated_total -= position.amount_usd
+                self._allocated_by_strategy[position.strategy] -= position.amount_usd
+
+                # Snap to exact zero so float drift cannot accumulate
+                if not shard:
+                    self._allocated_by_strategy[position.strategy] = 0.0
+                if not self._open_by_id:
+                    self._allocated_total = 0.0
+
+            self._realized_pnl_total += position.realized_pnl or 0
+            if position.realized_pnl_pct:
+                self._welford_update(position.realized_pnl_pct)
+
+    def _recount_allocations(self) -> None:
+        """Recompute the allocation counters from the column arrays. Caller holds the write lock."""
+        open_mask = self._open_mask
+        sums = np.bincount(
+            self._strategy_codes[open_mask],
+            weights=self._amount_usds[open_mask],
+            minlength=len(self._STRATEGY_CODES),
+        )
+        self._allocated_by_strategy: Dict[str, float] = {
+            strategy: float(sums[code]) for strategy, code in self._STRATEGY_CODES.items()
         }
+        self._allocated_total = sum(self._allocated_by_strategy.values())
+
+    def invalidate(self) -> None:
+        """
+        Rebuild the array view, indexes and running counters from scratch.
+
+        These are maintained incrementally on open/close/stop; call this
+        after changing a tracked position's fields directly.
+        """
+        with self._positions_rwlock.write_lock():
+            self._rebuild_arrays()
+        self._stats_cache = None
+
+    def _welford_update(self, value: float) -> None:
+        """Add one sample to the running mean/variance. Caller holds the write lock."""
+        self._realized_count += 1
+        delta = value - self._realized_mean
+        self._realized_mean += delta / self._realized_count
+        self._realized_m2 += delta * (value - self._realized_mean)
+
+    @property
+    def realized_mean(self) -> float:
+        """Mean realized P&L % over finished positions (0.0 if none)."""
+        return self._realized_mean
+
+    @property
+    def realized_std(self) -> float:
+        """Sample standard deviation of realized P&L % (0.0 with < 2 samples)."""
+        if self._realized_count < 2:
+            return 0.0
+        return math.sqrt(self._realized_m2 / (self._realized_count - 1))
 
     # =========================================================================
     # PERSISTENCE METHODS
     # =========================================================================
 
-    def _save_positions(self) -> None:
-        """Save positions to JSON file atomically."""
+    def _mark_dirty(self, record: Optional[Dict] = None) -> None:
+        """
+        Record a mutation: journal it, invalidate cached stats and schedule
+        a snapshot.
+
+        Opens, closes and state changes are fsynced to the journal and
+        snapshotted right away. Price ticks are only appended: losing the
+        last few in a crash is harmless (the next tick recomputes them),
+        so they are compacted every JOURNAL_SNAPSHOT_EVERY entries.
+
+        Args:
+            record: Journal entry describing the mutation (see _apply_journal_record)
+        """
+        with self._save_cond:
+            self._positions_version += 1
+            durable = record is not None and record.get("op") != "tick"
+
+            if record is not None:
+                record["seq"] = self._positions_version
+                self._append_journal(record, sync=durable)
+
+            snapshot_due = durable or (
+                self._positions_version - self._saved_seq >= self.JOURNAL_SNAPSHOT_EVERY
+            )
+
+        if snapshot_due:
+            self._dirty.set()
+
+    def _append_journal(self, record: Dict, sync: bool = False) -> None:
+        """Append one JSON line to the journal (fsynced if sync). Caller holds _save_cond."""
         try:
-            # Convert positions to dicts
-            data = {
-                "emergency_mode": self.emergency_mode,
-                "last_dca_time": (
-                    self.last_dca_time.isoformat() if self.last_dca_time else None
-                ),
-                "positions": [p.to_dict() for p in self.positions],
-            }
+            fd = self._get_journal_fd()
+            _write_all(fd, _dump_json(record) + b"\n")
+            if sync:
+                os.fsync(fd)
+
+        except Exception as e:
+            logger.error(f"Failed to journal position change: {e}")
 
-            # Atomic write using temp file
-            temp_fd, temp_path = tempfile.mkstemp(
-                dir=self.positions_file.parent, suffix=".tmp"
+    def _get_journal_fd(self) -> int:
+        """Open the journal for appending on first use. Caller holds _save_cond."""
+        if self._journal_fd is None:
+            self._journal_fd = os.open(
+                self.journal_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
             )
+        return self._journal_fd
 
-            try:
-                with os.fdopen(temp_fd, "w") as f:
-                    json.dump(data, f, indent=2)
+    def _writer_loop(self) -> None:
+        """Background writer: compact the journal into a snapshot when due."""
+        while True:
+            self._dirty.wait()
 
-                # Atomic rename
-                os.replace(temp_path, self.positions_file)
+            # Let a burst of mutations settle (flush() cuts the wait short)
+            self._flush_now.wait(self.SAVE_DEBOUNCE_SECONDS)
+            self._flush_now.clear()
+            self._dirty.clear()
 
-            except Exception:
-                # Clean up temp file on error
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
-                raise
+            self._save_positions()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write a full snapshot covering every change made so far.
+
+        Changes are journaled as they happen; this compacts the journal into
+        positions_file. Runs automatically at interpreter exit.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            bool: True if the snapshot was written, False on timeout
+        """
+        with self._save_cond:
+            target = self._positions_version
+            if self._saved_seq >= target:
+                return True
+
+        self._flush_now.set()
+        self._dirty.set()
+
+        with self._save_cond:
+            return self._save_cond.wait_for(
+                lambda: self._saved_seq >= target, timeout
+            )
+
+    def _flush_at_exit(self) -> None:
+        """atexit hook: snapshot pending journal entries so restart skips replay."""
+        with self._save_cond:
+            pending = self._saved_seq < self._positions_version
+
+        # Save synchronously; the daemon writer may not get scheduled again
+        if pending:
+            self._save_positions()
+
+    def _save_positions(self) -> None:
+        """Save a snapshot to the JSON file atomically and truncate the journal."""
+        try:
+            # Hold _save_cond so no mutation is journaled between taking the
+            # snapshot and truncating the journal
+            with self._save_cond:
+                seq = self._positions_version
+
+                positions = self._snapshot_positions()
+
+                header = {
+                    "journal_seq": seq,
+                    "emergency_mode": self.emergency_mode,
+                    "last_dca_time": (
+                        self.last_dca_time.isoformat() if self.last_dca_time else None
+                    ),
+                }
+
+                # Atomic write: temp file, fsync, rename. Saves are
+                # serialized by _save_cond, so a fixed temp name is safe.
+                temp_path = f"{self.positions_file}.tmp"
+                temp_fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+                try:
+                    # Stream one position at a time instead of building the
+                    # whole document as dicts first
+                    with os.fdopen(temp_fd, "wb") as out:
+                        indent = self._indent_json
+                        out.write(_dump_json(header)[:-1] + b', "positions": [')
+                        for i, position in enumerate(positions):
+                            out.write(b",\n" if i else b"\n")
+                            out.write(_dump_json(position.to_dict(), indent=indent))
+                        out.write(b"\n]}\n")
+                        out.flush()
+                        os.fsync(out.fileno())
+
+                    # Atomic rename
+                    os.replace(temp_path, self.positions_file)
+
+                except Exception:
+                    # Clean up temp file on error
+                    if os.path.exists(temp_path):
+                        os.unlink(temp_path)
+                    raise
+
+                # Journal entries up to seq are now in the snapshot (replay
+                # skips them by seq if we crash before truncating)
+                if self._journal_fd is not None or self.journal_file.exists():
+                    os.ftruncate(self._get_journal_fd(), 0)
+
+                self._saved_seq = seq
+                self._save_cond.notify_all()
 
         except Exception as e:
             logger.error(f"Failed to save positions: {e}")
 
     def _load_positions(self) -> None:
-        """Load positions from JSON file."""
-        if not self.positions_file.exists():
+        """Load the positions snapshot, then replay newer journal entries."""
+        snapshot_seq = 0
+
+        if self.positions_file.exists():
+            try:
+                data = _load_json(self.positions_file.read_bytes())
+
+                snapshot_seq = data.get("journal_seq", 0)
+                self.emergency_mode = data.get("emergency_mode", False)
+
+                if data.get("last_dca_time"):
+                    self.last_dca_time = datetime.fromisoformat(data["last_dca_time"])
+
+                self.positions = [
+                    Position.from_dict(p_dict) for p_dict in data.get("positions", [])
+                ]
+
+            except Exception as e:
+                logger.error(f"Failed to load positions: {e}")
+                logger.warning("Starting with empty position list")
+                self.positions = []
+
+        elif not self.journal_file.exists():
             logger.info("No existing positions file, starting fresh")
             return
 
-        try:
-            with open(self.positions_file, "r") as f:
-                data = json.load(f)
+        seq = snapshot_seq
+        replayed = 0
 
-            self.emergency_mode = data.get("emergency_mode", False)
+        if self.journal_file.exists():
+            try:
+                with open(self.journal_file, "rb") as f:
+                    for line in f:
+                        try:
+                            record = _load_json(line)
+                        except ValueError:
+                            # Torn final line from a crash mid-write
+                            logger.warning("Skipping malformed journal entry")
+                            continue
+
+                        if record.get("seq", 0) <= snapshot_seq:
+                            continue
+
+                        self._apply_journal_record(record)
+                        seq = max(seq, record["seq"])
+                        replayed += 1
 
-            if data.get("last_dca_time"):
-                self.last_dca_time = datetime.fromisoformat(data["last_dca_time"])
+            except Exception as e:
+                logger.error(f"Failed to replay position journal: {e}")
 
-            self.positions = [
-                Position.from_dict(p_dict) for p_dict in data.get("positions", [])
-            ]
+        # Rows whose open record never reached the journal (torn write)
+        missing = sum(position is None for position in self.positions)
+        if missing:
+            logger.warning(f"Journal is missing {missing} opened position(s), dropping their rows")
+            self.positions = [position for position in self.positions if position is not None]
 
-            logger.info(
-                f"Loaded {len(self.positions)} positions "
-                f"({len(self.get_open_positions())} open)"
-            )
+        self._positions_version = seq
+        self._saved_seq = snapshot_seq
 
-        except Exception as e:
-            logger.error(f"Failed to load positions: {e}")
-            logger.warning("Starting with empty position list")
-            self.positions = []
+        logger.info(
+            f"Loaded {len(self.positions)} positions "
+            f"({sum(p.status == 'open' for p in self.positions)} open, "
+            f"{replayed} journal entries replayed)"
+        )
+
+    def _apply_journal_record(self, record: Dict) -> None:
+        """
+        Re-apply one journaled mutation during load.
+
+        Rows are assigned under the write lock but sequence numbers after it
+        is released, so records for different rows can arrive out of row
+        order: opens and closes are placed by explicit row (padding the list
+        with None), and an open never overwrites a row already closed.
+
+        Records:
+            {"op": "open", "row": i, "position": {...}, "last_dca_time": ...}
+            {"op": "close", "row": i, "position": {...}}   (closed or stopped)
+            {"op": "tick", "price": p}                      (update_all_positions)
+            {"op": "state", "emergency_mode": True}
+        """
+        op = record.get("op")
+
+        if op == "open":
+            row = record.get("row", len(self.positions))
+            self._pad_rows(row)
+            # Fill the row, or refresh an open that raced the snapshot; a
+            # close journaled ahead of its open must win
+            current = self.positions[row]
+            if current is None or current.status == "open":
+                self.positions[row] = Position.from_dict(record["position"])
+            if record.get("last_dca_time"):
+                last_dca_time = datetime.fromisoformat(record["last_dca_time"])
+                if self.last_dca_time is None or last_dca_time > self.last_dca_time:
+                    self.last_dca_time = last_dca_time
+
+        elif op == "close":
+            row = record["row"]
+            self._pad_rows(row)
+            self.positions[row] = Position.from_dict(record["position"])
+
+        elif op == "tick":
+            for position in self.positions:
+                if position is not None and position.status == "open":
+                    position.update_current_price(record["price"])
+
+        elif op == "state":
+            self.emergency_mode = record.get("emergency_mode", self.emergency_mode)
+
+        else:
+            logger.warning(f"Unknown journal op {op!r}, skipping")
+
+    def _pad_rows(self, row: int) -> None:
+        """Extend self.positions with None placeholders up to row (journal replay only)."""
+        if row >= len(self.positions):
+            self.positions.extend([None] * (row + 1 - len(self.positions)))
 
     def __repr__(self) -> str:
         """String representation for debugging."""
@@ -1381,6 +2372,6 @@ class PositionManager:
         return (
             f"PositionManager(budget=${self.initial_budget:,.2f}, "
             f"allocated={stats['allocation_pct']:.1%}, "
-            f"open_positions={len(self.get_open_positions())}, "
+            f"open_positions={len(self._open_by_id)}, "
             f"emergency={self.emergency_mode})"
         )
@@ -16,14 +16,20 @@ Example:
     ...     return api.get_price("BTC")
 """
 
+import array
+import asyncio
+import bisect
 import functools
+import inspect
 import logging
+import random
+import threading
 import time
-from collections import deque
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Deque, Dict, Optional, TypeVar
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 
 from config.settings import get_settings
 
@@ -84,7 +90,7 @@ class CircuitBreakerOpen(Exception):
         Args:
             limiter_name: Name of the rate limiter
             failures: Number of consecutive failures
-            cooldown_until: Unix timestamp when circuit resets
+            cooldown_until: Unix timestamp when circuit resets (wall clock)
         """
         self.limiter_name = limiter_name
         self.failures = failures
@@ -165,6 +171,18 @@ class SmartRateLimiter:
         ...     return binance.get_price()
     """
 
+    # Upper bound (seconds) for the circuit breaker cooldown, which doubles
+    # each time the circuit re-opens without a successful call in between
+    MAX_CIRCUIT_BREAKER_TIMEOUT = 3600
+
+    # Up to this many seconds of random delay are added to each sliding
+    # window wait so throttled callers (and other processes) don't wake in
+    # lockstep
+    WAIT_JITTER = 0.1
+
+    # Minimum seconds between high-usage warnings for one limiter
+    USAGE_WARNING_INTERVAL = 5.0
+
     def __init__(
         self,
         max_calls: int,
@@ -181,6 +199,7 @@ class SmartRateLimiter:
             name: Human-readable name for this rate limiter
             circuit_breaker_threshold: Number of failures before opening circuit
             circuit_breaker_timeout: Seconds to wait before closing circuit
+                (doubled on each consecutive re-open)
         """
         self.max_calls = max_calls
         self.period = period
@@ -188,69 +207,122 @@ class SmartRateLimiter:
         self.circuit_breaker_threshold = circuit_breaker_threshold
         self.circuit_breaker_timeout = circuit_breaker_timeout
 
-        # Sliding window of call timestamps
-        self._call_times: Deque[float] = deque()
+        # Sliding window of call timestamps (time.monotonic()) in a fixed
+        # ring buffer: _call_count entries starting at _call_head. Only the
+        # newest max_calls calls can matter, so a full ring overwrites the
+        # oldest entry instead of growing.
+        self._call_times = array.array("d", [0.0]) * max_calls
+        self._call_head = 0
+        self._call_count = 0
 
-        # Circuit breaker state
+        # Circuit breaker state (_circuit_opened_at is time.monotonic());
+        # _trip_count counts opens since the last successful call
         self._circuit_state = CircuitState.CLOSED
         self._consecutive_failures = 0
         self._circuit_opened_at: Optional[float] = None
+        self._trip_count = 0
+        self._current_timeout = circuit_breaker_timeout
 
         # Statistics
         self._total_calls = 0
         self._total_waits = 0
         self._total_wait_time = 0.0
 
-        # Warning threshold (80% usage)
+        # Warning threshold (80% usage) and when the last warning was logged
         self._warning_threshold = 0.80
+        self._last_usage_warning = float("-inf")
+
+        # Guards the call window and wait statistics; never held while sleeping
+        self._lock = threading.Lock()
 
         logger.info(
-            f"Initialized rate limiter '{name}': "
-            f"{max_calls} calls per {period}s "
-            f"(circuit breaker: {circuit_breaker_threshold} failures)"
+            "Initialized rate limiter '%s': %s calls per %ss (circuit breaker: %s failures)",
+            name,
+            max_calls,
+            period,
+            circuit_breaker_threshold,
         )
 
-    def _clean_old_calls(self) -> None:
+    def _clean_old_calls(self, now: float) -> None:
         """Remove call timestamps outside the current window.
 
         This method maintains the sliding window by removing timestamps
         that are older than the rate limit period.
+
+        Args:
+            now: Current time.monotonic() reading, sampled once by the caller
         """
-        current_time = time.time()
-        cutoff_time = current_time - self.period
+        cutoff_time = now - self.period
+
+        call_times = self._call_times
+        head = self._call_head
+        count = self._call_count
+
+        if not count or call_times[head] >= cutoff_time:
+            return
+
+        # Timestamps are in order, so binary search each contiguous run of
+        # the ring for the first unexpired one and jump the head there
+        end = head + count
+        capacity = self.max_calls
+
+        if end > capacity and call_times[capacity - 1] < cutoff_time:
+            # The run up to the end of the array has expired entirely
+            new_head = bisect.bisect_left(call_times, cutoff_time, 0, end - capacity)
+            expired = capacity - head + new_head
+        else:
+            new_head = bisect.bisect_left(call_times, cutoff_time, head, min(end, capacity))
+            expired = new_head - head
 
-        # Remove timestamps older than the window
-        while self._call_times and self._call_times[0] < cutoff_time:
-            self._call_times.popleft()
+        self._call_head = new_head % capacity
+        self._call_count = count - expired
 
-    def _check_circuit_breaker(self) -> None:
+    def _check_circuit_breaker(self, now: float) -> None:
         """Check circuit breaker state and update if needed.
 
+        Args:
+            now: Current time.monotonic() reading
+
         Raises:
             CircuitBreakerOpen: If circuit is open and cooldown not expired
         """
         if self._circuit_state == CircuitState.OPEN:
             # Check if cooldown period has passed
             if self._circuit_opened_at is not None:
-                cooldown_expires = self._circuit_opened_at + self.circuit_breaker_timeout
+                cooldown_expires = self._circuit_opened_at + self._current_timeout
 
-                if time.time() >= cooldown_expires:
+                if now >= cooldown_expires:
                     # Try half-open state (allow one test call)
                     self._circuit_state = CircuitState.HALF_OPEN
-                    logger.info(f"Circuit breaker for '{self.name}' entering HALF_OPEN state")
+                    logger.info("Circuit breaker for '%s' entering HALF_OPEN state", self.name)
                 else:
-                    # Still in cooldown
+                    # Still in cooldown (report the reset time on the wall clock)
                     raise CircuitBreakerOpen(
-                        self.name, self._consecutive_failures, cooldown_expires
+                        self.name,
+                        self._consecutive_failures,
+                        time.time() + (cooldown_expires - now),
                     )
 
     def _open_circuit_breaker(self) -> None:
-        """Open circuit breaker after repeated failures."""
+        """Open circuit breaker after repeated failures.
+
+        The cooldown doubles every time the circuit re-opens (a failed
+        HALF_OPEN test call) up to MAX_CIRCUIT_BREAKER_TIMEOUT, so a
+        persistently broken upstream is probed less and less often.
+        """
+        self._trip_count += 1
+        self._current_timeout = min(
+            self.circuit_breaker_timeout * 2 ** (self._trip_count - 1),
+            max(self.MAX_CIRCUIT_BREAKER_TIMEOUT, self.circuit_breaker_timeout),
+        )
+
         self._circuit_state = CircuitState.OPEN
-        self._circuit_opened_at = time.time()
+        self._circuit_opened_at = time.monotonic()
         logger.error(
-            f"Circuit breaker OPENED for '{self.name}' after "
-            f"{self._consecutive_failures} consecutive failures"
+            "Circuit breaker OPENED for '%s' after %s consecutive failures (cooldown: %ss)",
+            self.name,
+            self._consecutive_failures,
+            self._current_timeout,
         )
 
     def _close_circuit_breaker(self) -> None:
@@ -259,7 +331,9 @@ class SmartRateLimiter:
             self._circuit_state = CircuitState.CLOSED
             self._consecutive_failures = 0
             self._circuit_opened_at = None
-            logger.info(f"Circuit breaker CLOSED for '{self.name}' (service recovered)")
+            self._trip_count = 0
+            self._current_timeout = self.circuit_breaker_timeout
+            logger.info("Circuit breaker CLOSED for '%s' (service recovered)", self.name)
 
     def record_failure(self) -> None:
         """Record a failed API call.
@@ -272,8 +346,10 @@ class SmartRateLimiter:
             self._open_circuit_breaker()
         else:
             logger.warning(
-                f"API call failed for '{self.name}' "
-                f"({self._consecutive_failures}/{self.circuit_breaker_threshold} failures)"
+                "API call failed for '%s' (%s/%s failures)",
+                self.name,
+                self._consecutive_failures,
+                self.circuit_breaker_threshold,
             )
 
     def record_success(self) -> None:
@@ -283,8 +359,9 @@ class SmartRateLimiter:
         """
         if self._consecutive_failures > 0:
             logger.info(
-                f"API call succeeded for '{self.name}' after "
-                f"{self._consecutive_failures} failures"
+                "API call succeeded for '%s' after %s failures",
+                self.name,
+                self._consecutive_failures,
             )
         self._close_circuit_breaker()
 
@@ -294,63 +371,153 @@ class SmartRateLimiter:
         Returns:
             bool: True if call can be made, False if rate limit would be exceeded
         """
-        self._clean_old_calls()
-        return len(self._call_times) < self.max_calls
+        with self._lock:
+            self._clean_old_calls(time.monotonic())
+            return self._call_count < self.max_calls
+
+    def _wait_time(self, now: float) -> float:
+        """Seconds until a call fits in the window (caller holds the lock)."""
+        self._clean_old_calls(now)
+
+        if self._call_count < self.max_calls:
+            return 0.0
 
-    def calculate_wait_time(self) -> float:
+        # Calculate when the oldest call will expire
+        oldest_call_time = self._call_times[self._call_head]
+        wait_time = (oldest_call_time + self.period) - now
+
+        return max(0.0, wait_time)
+
+    def calculate_wait_time(self, now: Optional[float] = None) -> float:
         """Calculate seconds to wait before next call is allowed.
 
+        Args:
+            now: Current time.monotonic() reading (default: read the clock)
+
         Returns:
             float: Seconds to wait (0.0 if call can be made immediately)
         """
-        self._clean_old_calls()
+        if now is None:
+            now = time.monotonic()
 
-        if self.can_make_call():
-            return 0.0
+        with self._lock:
+            return self._wait_time(now)
 
-        # Calculate when the oldest call will expire
-        oldest_call_time = self._call_times[0]
-        wait_time = (oldest_call_time + self.period) - time.time()
+    def _reserve(self, now: float) -> float:
+        """Reserve the earliest free slot in the window and record the call there.
 
-        return max(0.0, wait_time)
+        When the window is full the slot is in the future, when the oldest
+        call expires. Recording it there takes that slot from the next caller,
+        whose reservation lands on the following expiry instead, so a burst
+        of waiters is spread over distinct slots rather than waking together.
 
-    def wait_if_needed(self) -> None:
-        """Block until a call can be made within rate limit.
+        Args:
+            now: Current time.monotonic() reading
 
-        This method will sleep if necessary to respect the rate limit.
+        Returns:
+            float: Seconds to wait before the reserved slot (0.0 if it is now)
         """
-        wait_time = self.calculate_wait_time()
+        with self._lock:
+            wait_time = self._wait_time(now)
+            if wait_time > 0:
+                # Jitter is part of the reserved slot, so the window holds
+                # the time the call will actually be made
+                wait_time += random.random() * self.WAIT_JITTER
+
+            # A jittered reservation can land after the next expiry; never
+            # reserve before the newest slot so the ring stays sorted
+            if self._call_count:
+                newest = self._call_times[
+                    (self._call_head + self._call_count - 1) % self.max_calls
+                ]
+                if now + wait_time < newest:
+                    wait_time = newest - now
+
+            self._record_call(now + wait_time)
+
+            if wait_time > 0:
+                self._total_waits += 1
+                self._total_wait_time += wait_time
 
         if wait_time > 0:
-            self._total_waits += 1
-            self._total_wait_time += wait_time
-
             logger.warning(
-                f"Rate limit reached for '{self.name}'. Waiting {wait_time:.1f}s..."
+                "Rate limit reached for '%s'. Waiting %.1fs...", self.name, wait_time
             )
+
+        return wait_time
+
+    def wait_if_needed(self, now: Optional[float] = None) -> None:
+        """Reserve a call within the rate limit and block until its slot.
+
+        The lock is only held to reserve; waiters sleep outside it, each
+        until its own slot, so they never serialize behind a sleeper.
+
+        Args:
+            now: Current time.monotonic() reading (default: read the clock)
+        """
+        if now is None:
+            now = time.monotonic()
+
+        wait_time = self._reserve(now)
+
+        if wait_time > 0:
             time.sleep(wait_time)
 
-    def _check_usage_warning(self) -> None:
-        """Log warning if usage exceeds threshold (80%)."""
-        self._clean_old_calls()
-        current_usage = len(self._call_times) / self.max_calls
+    async def _async_wait_if_needed(self, now: Optional[float] = None) -> None:
+        """Async version of wait_if_needed that doesn't block the event loop."""
+        if now is None:
+            now = time.monotonic()
+
+        wait_time = self._reserve(now)
+
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def _check_usage_warning(self, now: float) -> None:
+        """Log warning if usage exceeds threshold (80%).
+
+        At most one warning per USAGE_WARNING_INTERVAL, so sustained high
+        usage doesn't turn every call into a log write. The caller holds the
+        lock and has already cleaned the window at ``now``.
+        """
+        current_usage = self._call_count / self.max_calls
 
-        if current_usage >= self._warning_threshold:
+        if (
+            current_usage >= self._warning_threshold
+            and now - self._last_usage_warning >= self.USAGE_WARNING_INTERVAL
+        ):
+            self._last_usage_warning = now
             logger.warning(
-                f"Rate limiter '{self.name}' at {current_usage:.0%} capacity "
-                f"({len(self._call_times)}/{self.max_calls} calls)"
+                "Rate limiter '%s' at %.0f%% capacity (%s/%s calls)",
+                self.name,
+                current_usage * 100,
+                self._call_count,
+                self.max_calls,
             )
 
-    def _record_call(self) -> None:
-        """Record that a call was made."""
-        current_time = time.time()
-        self._call_times.append(current_time)
+    def _record_call(self, now: float) -> None:
+        """Record a call at time.monotonic() reading ``now``.
+
+        The caller holds the lock and has already cleaned the window at
+        ``now`` (e.g. via _wait_time), so nothing here scans it again.
+        """
+        if self._call_count < self.max_calls:
+            tail = (self._call_head + self._call_count) % self.max_calls
+            self._call_count += 1
+        else:
+            # Full: the oldest entry falls out of the window
+            tail = self._call_head
+            self._call_head = (tail + 1) % self.max_calls
+        self._call_times[tail] = now
         self._total_calls += 1
-        self._check_usage_warning()
+        self._check_usage_warning(now)
 
-    def get_usage_stats(self) -> RateLimiterStats:
+    def get_usage_stats(self, now: Optional[float] = None) -> RateLimiterStats:
         """Get current usage statistics for this rate limiter.
 
+        Args:
+            now: Current time.monotonic() reading (default: read the clock)
+
         Returns:
             RateLimiterStats: Current statistics
 
@@ -358,8 +525,12 @@ class SmartRateLimiter:
             >>> stats = limiter.get_usage_stats()
             >>> print(f"Usage: {stats.usage_pct:.1f}%")
         """
-        self._clean_old_calls()
-        current_calls = len(self._call_times)
+        if now is None:
+            now = time.monotonic()
+
+        with self._lock:
+            self._clean_old_calls(now)
+            current_calls = self._call_count
         usage_pct = (current_calls / self.max_calls) * 100
 
         avg_wait = (
@@ -382,8 +553,13 @@ class SmartRateLimiter:
     def __call__(self, func: F) -> F:
         """Decorator to apply rate limiting to a function.
 
+        Coroutine functions get an async wrapper that awaits instead of
+        sleeping, so waiting for capacity never blocks the event loop.
+        Generator functions (sync or async) are limited when iteration
+        starts, and count as failed if iteration raises.
+
         Args:
-            func: Function to rate limit
+            func: Function, coroutine function or generator function to rate limit
 
         Returns:
             Wrapped function with rate limiting
@@ -394,34 +570,247 @@ class SmartRateLimiter:
             ...     return api.get_price()
         """
 
+        # Bind once so each wrapped call reads locals instead of attributes
+        monotonic = time.monotonic
+        check_circuit_breaker = self._check_circuit_breaker
+        wait_if_needed = self.wait_if_needed
+        async_wait_if_needed = self._async_wait_if_needed
+        record_success = self.record_success
+        record_failure = self.record_failure
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                now = monotonic()
+                check_circuit_breaker(now)
+                await async_wait_if_needed(now)
+
+                try:
+                    result = await func(*args, **kwargs)
+                    record_success()
+                    return result
+
+                except Exception:
+                    record_failure()
+                    raise
+
+            return async_wrapper  # type: ignore
+
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def async_gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+                now = monotonic()
+                check_circuit_breaker(now)
+                await async_wait_if_needed(now)
+
+                try:
+                    async for item in func(*args, **kwargs):
+                        yield item
+
+                except Exception:
+                    record_failure()
+                    raise
+
+                record_success()
+
+            return async_gen_wrapper  # type: ignore
+
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def gen_wrapper(*args: Any, **kwargs: Any) -> Any:
+                now = monotonic()
+                check_circuit_breaker(now)
+                wait_if_needed(now)
+
+                try:
+                    yield from func(*args, **kwargs)
+
+                except Exception:
+                    record_failure()
+                    raise
+
+                record_success()
+
+            return gen_wrapper  # type: ignore
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Check circuit breaker
-            self._check_circuit_breaker()
+            # One clock read per call, threaded through the checks
+            now = monotonic()
 
-            # Wait if needed to respect rate limit
-            self.wait_if_needed()
+            # Check circuit breaker
+            check_circuit_breaker(now)
 
-            # Record the call
-            self._record_call()
+            # Wait if needed to respect rate limit, then record the call
+            wait_if_needed(now)
 
             try:
                 # Execute the function
                 result = func(*args, **kwargs)
 
                 # Record success (for circuit breaker)
-                self.record_success()
+                record_success()
 
                 return result
 
             except Exception as e:
                 # Record failure (for circuit breaker)
-                self.record_failure()
+                record_failure()
                 raise
 
         return wrapper  # type: ignore
 
 
+# ============================================================================
+# Token Bucket Rate Limiter
+# ============================================================================
+
+
+class TokenBucketRateLimiter(SmartRateLimiter):
+    """Token bucket rate limiter with circuit breaker and usage tracking.
+
+    Tokens refill continuously at ``max_calls / period`` per second up to a
+    capacity of ``max_calls``. A burst of calls drains at the refill rate
+    instead of all landing at the start of a window, which keeps bursty
+    callers (e.g. concurrent LLM batches) under provider-side limits.
+
+    Each call reserves its token under a short ``threading.Lock`` and then
+    sleeps outside the lock, so sync threads and async tasks (on any event
+    loop) share one bucket and are served in arrival order.
+
+    Example:
+        >>> limiter = TokenBucketRateLimiter(max_calls=15, period=60, name="openrouter")
+        >>>
+        >>> @limiter
+        >>> async def call_llm():
+        ...     return await client.agenerate_text("...")
+    """
+
+    def __init__(
+        self,
+        max_calls: int,
+        period: int,
+        name: str,
+        circuit_breaker_threshold: int = 3,
+        circuit_breaker_timeout: int = 60,
+    ):
+        """Initialize token bucket rate limiter.
+
+        Args:
+            max_calls: Bucket capacity (maximum burst size) and calls per period
+            period: Time period in seconds
+            name: Human-readable name for this rate limiter
+            circuit_breaker_threshold: Number of failures before opening circuit
+            circuit_breaker_timeout: Seconds to wait before closing circuit
+        """
+        super().__init__(
+            max_calls,
+            period,
+            name,
+            circuit_breaker_threshold=circuit_breaker_threshold,
+            circuit_breaker_timeout=circuit_breaker_timeout,
+        )
+
+        self.capacity = float(max_calls)
+        self.rate = max_calls / period  # tokens per second
+
+        # Guarded by the base class _lock
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add tokens earned since the last refill (caller holds the lock)."""
+        now = time.monotonic()
+        gap = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.capacity, self._tokens + gap * self.rate)
+
+    def _acquire(self) -> float:
+        """Reserve one token.
+
+        The token is consumed immediately; a negative balance is a queue of
+        reservations that the refill pays off in order.
+
+        Returns:
+            float: Seconds the caller must wait before using its token
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1.0
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            if wait_time > 0:
+                self._total_waits += 1
+                self._total_wait_time += wait_time
+
+        return wait_time
+
+    def can_make_call(self) -> bool:
+        """Check if a token is available right now.
+
+        Returns:
+            bool: True if call can be made, False if it would have to wait
+        """
+        with self._lock:
+            self._refill()
+            return self._tokens >= 1.0
+
+    def calculate_wait_time(self, now: Optional[float] = None) -> float:
+        """Calculate seconds until a token becomes available.
+
+        Args:
+            now: Ignored; the bucket reads the clock under its lock so
+                concurrent refills never move backwards
+
+        Returns:
+            float: Seconds to wait (0.0 if call can be made immediately)
+        """
+        with self._lock:
+            self._refill()
+            tokens = self._tokens
+
+        return max(0.0, (1.0 - tokens) / self.rate)
+
+    def _record_token_call(self) -> None:
+        """Record a call for usage stats once its token is available."""
+        now = time.monotonic()
+
+        with self._lock:
+            self._clean_old_calls(now)
+            self._record_call(now)
+
+    def wait_if_needed(self, now: Optional[float] = None) -> None:
+        """Take a token, sleeping until it is available, then record the call.
+
+        Args:
+            now: Ignored (see calculate_wait_time)
+        """
+        wait_time = self._acquire()
+
+        if wait_time > 0:
+            logger.warning(
+                "Rate limit reached for '%s'. Waiting %.1fs...", self.name, wait_time
+            )
+            time.sleep(wait_time)
+
+        self._record_token_call()
+
+    async def _async_wait_if_needed(self, now: Optional[float] = None) -> None:
+        """Async version of wait_if_needed that doesn't block the event loop."""
+        wait_time = self._acquire()
+
+        if wait_time > 0:
+            logger.warning(
+                "Rate limit reached for '%s'. Waiting %.1fs...", self.name, wait_time
+            )
+            await asyncio.sleep(wait_time)
+
+        self._record_token_call()
+
+
 # ============================================================================
 # Preconfigured Rate Limiters
 # ============================================================================
@@ -475,7 +864,9 @@ huggingface_rate_limit = SmartRateLimiter(
 
 # OpenRouter API: 15 calls per 60 seconds
 # Free tier for Mistral-7B
-openrouter_rate_limit = SmartRateLimiter(
+# Token bucket: bursts (e.g. generate_text_batch) drain at 1 call per 4s
+# instead of tripping provider-side 429s at the start of a window
+openrouter_rate_limit = TokenBucketRateLimiter(
     max_calls=settings.OPENROUTER_RATE_LIMIT,
     period=settings.OPENROUTER_RATE_WINDOW,
     name="OpenRouter",
@@ -500,8 +891,20 @@ google_sheets_rate_limit = SmartRateLimiter(
 # ============================================================================
 
 
-# Simple in-memory cache (no external dependencies)
-_cache: Dict[str, Dict[str, Any]] = {}
+# Simple in-memory cache (no external dependencies): function -> args key ->
+# (result, time.monotonic() deadline), least recently used first
+_cache: Dict[str, "OrderedDict[Any, Tuple[Any, float]]"] = {}
+
+# Guards _cache and every per-function OrderedDict; never held while the
+# cached function runs. Reentrant because hashing or comparing a key can
+# run arbitrary __hash__/__eq__ code.
+_cache_lock = threading.RLock()
+
+# Maximum cached results per function; the least recently used are evicted
+MAX_CACHE_ENTRIES = 256
+
+# Separates positional from keyword arguments in cache keys
+_KWARGS_MARK = object()
 
 
 def cache_result(ttl: int = 3600) -> Callable[[F], F]:
@@ -526,41 +929,69 @@ def cache_result(ttl: int = 3600) -> Callable[[F], F]:
     def decorator(func: F) -> F:
         cache_key = f"{func.__module__}.{func.__qualname__}"
 
-        # Initialize cache entry for this function
-        if cache_key not in _cache:
-            _cache[cache_key] = {}
+        # Initialize cache entry for this function (cleared in place, never replaced)
+        with _cache_lock:
+            cache_entry = _cache.setdefault(cache_key, OrderedDict())
+        monotonic = time.monotonic
 
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Create a hashable key from args and kwargs
-            # Note: This is a simple implementation. For complex objects,
-            # consider using pickle or json serialization
-            args_key = str(args) + str(sorted(kwargs.items()))
-
-            cache_entry = _cache[cache_key]
-            current_time = time.time()
-
-            # Check if result is cached and not expired
-            if args_key in cache_entry:
-                cached_result, cached_time = cache_entry[args_key]
-                age = current_time - cached_time
-
-                if age < ttl:
-                    logger.debug(
-                        f"Cache HIT for {func.__name__} (age: {age:.1f}s, TTL: {ttl}s)"
-                    )
-                    return cached_result
-                else:
-                    logger.debug(
-                        f"Cache EXPIRED for {func.__name__} (age: {age:.1f}s, TTL: {ttl}s)"
-                    )
+            # Key on the arguments themselves; hashing a tuple is far cheaper
+            # than building repr strings of every argument. The argument
+            # types are part of the key so equal values of different types
+            # (1, 1.0, True) are cached separately, as the repr keys were.
+            args_key = args + tuple(map(type, args))
+            if kwargs:
+                items = tuple(sorted(kwargs.items()))
+                args_key += (_KWARGS_MARK,) + items + tuple(type(v) for _, v in items)
+
+            current_time = monotonic()
+
+            with _cache_lock:
+                try:
+                    cached = cache_entry.get(args_key)
+                except TypeError:
+                    # Unhashable arguments (lists, dicts): key on their repr instead
+                    args_key = str(args) + str(sorted(kwargs.items()))
+                    cached = cache_entry.get(args_key)
+
+                # Check if result is cached and not expired
+                if cached is not None:
+                    cached_result, expires_at = cached
+
+                    if current_time < expires_at:
+                        logger.debug(
+                            "Cache HIT for %s (expires in %.1fs, TTL: %ss)",
+                            func.__name__,
+                            expires_at - current_time,
+                            ttl,
+                        )
+                        cache_entry.move_to_end(args_key)
+                        return cached_result
+                    else:
+                        logger.debug("Cache EXPIRED for %s (TTL: %ss)", func.__name__, ttl)
 
             # Cache miss or expired - call function
-            logger.debug(f"Cache MISS for {func.__name__}")
+            logger.debug("Cache MISS for %s", func.__name__)
             result = func(*args, **kwargs)
 
-            # Store result in cache
-            cache_entry[args_key] = (result, current_time)
+            # Store result in cache until its deadline
+            with _cache_lock:
+                cache_entry[args_key] = (result, current_time + ttl)
+                cache_entry.move_to_end(args_key)
+
+                if len(cache_entry) > MAX_CACHE_ENTRIES:
+                    # Drop expired results first, then the least recently used
+                    expired = [
+                        key
+                        for key, (_, deadline) in cache_entry.items()
+                        if deadline <= current_time
+                    ]
+                    for key in expired:
+                        del cache_entry[key]
+
+                    while len(cache_entry) > MAX_CACHE_ENTRIES:
+                        cache_entry.popitem(last=False)
 
             return result
 
@@ -580,13 +1011,20 @@ def clear_cache(func: Optional[Callable] = None) -> None:
         >>> clear_cache()  # Clear all caches
     """
     if func is None:
-        _cache.clear()
+        # Empty each function's cache in place; decorated wrappers keep
+        # looking up their own entry
+        with _cache_lock:
+            for cache_entry in _cache.values():
+                cache_entry.clear()
         logger.info("Cleared all function caches")
     else:
         cache_key = f"{func.__module__}.{func.__qualname__}"
-        if cache_key in _cache:
-            _cache[cache_key].clear()
-            logger.info(f"Cleared cache for {func.__name__}")
+        with _cache_lock:
+            cache_entry = _cache.get(cache_key)
+            if cache_entry is not None:
+                cache_entry.clear()
+        if cache_entry is not None:
+            logger.info("Cleared cache for %s", func.__name__)
 
 
 # ============================================================================
@@ -614,7 +1052,10 @@ def get_all_rate_limit_stats() -> Dict[str, RateLimiterStats]:
         google_sheets_rate_limit,
     ]
 
-    return {limiter.name: limiter.get_usage_stats() for limiter in all_limiters}
+    # One clock read for every limiter's window
+    now = time.monotonic()
+
+    return {limiter.name: limiter.get_usage_stats(now) for limiter in all_limiters}
 
 
 def print_rate_limit_dashboard() -> None:
@@ -632,9 +1073,8 @@ def print_rate_limit_dashboard() -> None:
     """
     stats = get_all_rate_limit_stats()
 
-    print("\n" + "=" * 80)
-    print("Rate Limiter Dashboard")
-    print("=" * 80)
+    # Build the whole dashboard and write it with a single print
+    lines = ["", "=" * 80, "Rate Limiter Dashboard", "=" * 80]
 
     for name, stat in stats.items():
         circuit_emoji = {
@@ -649,13 +1089,14 @@ def print_rate_limit_dashboard() -> None:
         if stat.circuit_state == CircuitState.OPEN:
             warning = "  🚨 CIRCUIT OPEN"
 
-        print(
+        lines.append(
             f"{name:20} {stat.current_calls:3}/{stat.max_calls:3} calls "
             f"({stat.usage_pct:5.1f}%)  [{circuit_emoji}] "
             f"Total: {stat.total_calls:6}{warning}"
         )
 
-    print("=" * 80 + "\n")
+    lines.append("=" * 80 + "\n")
+    print("\n".join(lines))
 
 
 # ============================================================================
@@ -64,6 +64,10 @@ class StrategySwitcher:
         self.switch_count = 0
         self.last_switch_time = None
 
+        # LLM client for feature selection, created on first use and reused
+        # so later calls share its HTTP connection pool
+        self._llm: Optional[ChatOpenAI] = None
+
         logger.info("StrategySwitcher initialized (default: DCA)")
 
     def analyze_and_recommend(
@@ -379,15 +383,16 @@ class StrategySwitcher:
             ['trend_strength', 'momentum_score', 'network_health']
         """
         try:
-            settings = Settings.get_instance()
-
-            llm = ChatOpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=settings.OPENROUTER_API_KEY,
-                model="mistralai/mistral-7b-instruct:free",
-                temperature=0.1,
-                max_tokens=200
-            )
+            if self._llm is None:
+                settings = Settings.get_instance()
+
+                self._llm = ChatOpenAI(
+                    base_url="https://openrouter.ai/api/v1",
+                    api_key=settings.OPENROUTER_API_KEY,
+                    model="mistralai/mistral-7b-instruct:free",
+                    temperature=0.1,
+                    max_tokens=200
+                )
 
             prompt = f"""You are a Bitcoin trading analyst. Select the top 3 most relevant features for the current market regime.
 
@@ -408,7 +413,7 @@ Select exactly 3 features from the Available Features list above. Return ONLY va
 
 Example: {{"volatility_efficiency": 4.83, "network_health": 5.8, "momentum_score": -0.44}}"""
 
-            response = llm.invoke(prompt)
+            response = self._llm.invoke(prompt)
 
             # Parse response
             if isinstance(response, AIMessage):